@@ -0,0 +1,121 @@
+"""
+Benchmark of the compiled abbreviation matcher against the original per-entry regex loop.
+
+Both implementations are run over the same corpus; the script fails (exit code 1) if any
+output differs. The corpus is either the reports of a JSON file (--reports, same format
+as REPORTS_JSON_PATH) or a deterministic synthetic corpus built from the dictionary.
+
+Usage:
+    python benchmarks/bench_abbreviation_matcher.py [--csv PATH] [--reports PATH] [--synthetic N]
+"""
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from echo_extraction import abbreviation_processor
+from echo_extraction.abbreviation_matcher import AbbreviationMatcher
+
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "echo_extraction", "echo_abb_merged_csv.csv")
+
+
+#------------------------------------------------------------------------------
+# Original implementation (reference)
+#------------------------------------------------------------------------------
+def legacy_replace(text: str, abbrevs: Dict[str, str]) -> str:
+    """One re.compile + sub per dictionary entry and line, longest abbreviation first."""
+    lines = text.split('\n')
+    processed_lines = []
+    for line in lines:
+        for abbr in sorted(abbrevs.keys(), key=lambda x: -len(x)):
+            pattern = re.compile(rf'\b{re.escape(abbr)}\b', re.IGNORECASE)
+            line = pattern.sub(abbrevs[abbr], line)
+        processed_lines.append(line)
+    return '\n'.join(processed_lines)
+
+
+#------------------------------------------------------------------------------
+# Corpus
+#------------------------------------------------------------------------------
+FILLER = ["the", "is", "normal", "mild", "with", "and", "at", "of", "no", "seen", "LV", "size",
+          "function", "valve", "regurgitation", "estimated", "measured", "trace", "mm", "cm", "%"]
+
+
+def synthetic_corpus(abbrev_map: Dict[str, str], n_reports: int, seed: int = 7) -> List[str]:
+    """Deterministic report-like texts mixing dictionary keys (in varied case), numbers and punctuation."""
+    rng = random.Random(seed)
+    keys = list(abbrev_map.keys())
+    reports = []
+    for _ in range(n_reports):
+        lines = []
+        for _ in range(rng.randint(8, 25)):
+            words = []
+            for _ in range(rng.randint(4, 14)):
+                roll = rng.random()
+                if roll < 0.35:
+                    key = rng.choice(keys)
+                    words.append(rng.choice([key, key.upper(), key.title()]))
+                elif roll < 0.5:
+                    words.append(f"{rng.randint(1, 90)}{rng.choice(['', '.5', 'mm', 'cm', '%'])}")
+                else:
+                    words.append(rng.choice(FILLER))
+                if rng.random() < 0.15:
+                    words[-1] += rng.choice([",", ".", ":", "-", ")"])
+            lines.append(" ".join(words))
+        reports.append("\n".join(lines))
+    return reports
+
+
+def load_reports(path: str) -> List[str]:
+    with open(path, 'r') as f:
+        return [report['data'] for report in json.load(f)]
+
+
+#------------------------------------------------------------------------------
+# Benchmark
+#------------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compiled abbreviation matcher against the original loop.")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="Abbreviation CSV file.")
+    parser.add_argument("--reports", help="JSON file with reports (list of {'_id', 'data'}).")
+    parser.add_argument("--synthetic", type=int, default=30, help="Number of synthetic reports if --reports is not given.")
+    args = parser.parse_args()
+
+    abbrev_map = abbreviation_processor.load_abbreviation_dictionary(args.csv)
+    corpus = load_reports(args.reports) if args.reports else synthetic_corpus(abbrev_map, args.synthetic)
+    dashed = {k: v for k, v in abbrev_map.items() if '-' in k}
+    standard = {k: v for k, v in abbrev_map.items() if '-' not in k}
+    n_lines = sum(text.count('\n') + 1 for text in corpus)
+
+    start = time.perf_counter()
+    matcher = AbbreviationMatcher(abbrev_map)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy_out = [legacy_replace(legacy_replace(text, dashed), standard) for text in corpus]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher_out = [matcher.replace_standard(matcher.replace_dashed(text)) for text in corpus]
+    matcher_time = time.perf_counter() - start
+
+    mismatches = [i for i, (a, b) in enumerate(zip(legacy_out, matcher_out)) if a != b]
+
+    print(f"Dictionary entries : {len(abbrev_map)} ({len(dashed)} dashed)")
+    print(f"Corpus             : {len(corpus)} reports, {n_lines} lines")
+    print(f"Matcher build      : {build_time * 1000:.1f} ms")
+    print(f"Original loop      : {legacy_time * 1000:.1f} ms ({legacy_time / n_lines * 1e6:.0f} us/line)")
+    print(f"Compiled matcher   : {matcher_time * 1000:.1f} ms ({matcher_time / n_lines * 1e6:.0f} us/line)")
+    print(f"Speed-up           : {legacy_time / matcher_time:.1f}x")
+    print(f"Identical output   : {'yes' if not mismatches else f'NO ({len(mismatches)} reports differ)'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
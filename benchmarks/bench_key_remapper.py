@@ -0,0 +1,82 @@
+"""
+Microbenchmark of the compiled key remapper against remap_llm_keys.
+
+Builds large, nested LLM-style outputs for component models: every field is present,
+keys come in the spellings models produce (snake_case, Title Case, UPPER, dashed),
+lists of sub-models are long, and unknown keys are mixed in. Both remappers must
+produce identical output (exit code 1 otherwise); explicit aliases are left out of the
+comparison because only the compiled remapper normalizes them.
+
+Usage:
+    python benchmarks/bench_key_remapper.py [--items N] [--repeat N]
+"""
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+from typing import Any, Dict, Type
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel
+
+from echo_extraction.llm_mapping_utils import remap_llm_keys, get_key_remapper, _models_in_annotation
+from echo_extraction.models import LeftVentricle, MitralValve, RightVentricle, Aorta
+
+MODELS = [LeftVentricle, MitralValve, RightVentricle, Aorta]
+
+
+def llm_output(model: Type[BaseModel], rng: random.Random, list_items: int) -> Dict[str, Any]:
+    """A deterministic LLM-style output for `model`, with varied key spellings."""
+    out: Dict[str, Any] = {}
+    for field_name, field_info in model.model_fields.items():
+        key = rng.choice([field_name, field_name.replace("_", " ").title(), field_name.upper(), field_name.replace("_", "-")])
+        child_models = _models_in_annotation(field_info.annotation)
+        if child_models and "List" in str(field_info.annotation):
+            out[key] = [llm_output(child_models[0], rng, list_items) for _ in range(list_items)]
+        elif child_models:
+            out[key] = llm_output(child_models[0], rng, list_items)
+        else:
+            out[key] = rng.choice([round(rng.uniform(0, 100), 1), "Not Measured", "Normal", ["Not Assessed"]])
+        if rng.random() < 0.1:
+            out[f"Unknown Key {rng.randint(0, 9)}"] = {"Nested": [1, 2, 3]}
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the compiled key remapper against remap_llm_keys.")
+    parser.add_argument("--items", type=int, default=50, help="Items in each list-of-model field.")
+    parser.add_argument("--repeat", type=int, default=20, help="Remap calls per model and implementation.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    rng = random.Random(3)
+    mismatches = 0
+    for model in MODELS:
+        data = llm_output(model, rng, args.items)
+
+        start = time.perf_counter()
+        remapper = get_key_remapper(model)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            legacy = remap_llm_keys(data, model.model_fields)
+        legacy_time = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            compiled = remapper.remap(data)
+        compiled_time = (time.perf_counter() - start) / args.repeat
+
+        identical = legacy == compiled
+        mismatches += not identical
+        print(f"{model.__name__:<15} build {build_time * 1000:6.2f} ms | remap_llm_keys {legacy_time * 1000:7.2f} ms | "
+              f"compiled {compiled_time * 1000:6.2f} ms | {legacy_time / compiled_time:5.1f}x | identical: {'yes' if identical else 'NO'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,528 @@
+"""
+Offline end-to-end benchmark of the extraction pipeline, with a deterministic fake LLM.
+
+The fake backend is plugged in where the pipeline gets its chains
+(extraction_logic.get_extraction_chain / get_feedback_chain) and answers every
+extraction attempt with a canned output for the component: valid (plain, fenced, or
+missing the prefilled brace), invalid (valid JSON that fails validation) or malformed
+(prose, or cut off inside a string). Which one is drawn from a seeded RNG per report,
+component and attempt, so every run makes the same attempts. Reports are synthetic
+(see bench_abbreviation_matcher.synthetic_corpus) and go through main.process_report
+with per-report logs (LOG_FORMAT, LOG_COMPRESSION apply) and raw outputs written to a
+temporary directory.
+
+Three passes over the same reports:
+- throughput: nothing instrumented; reports/second and CPU per report (fastest of
+  --repeat passes);
+- stages: CPU time of each stage (abbreviation, parse, remap, validate, assemble,
+  logging; 'other' is the rest, e.g. prompt and error formatting), measured per thread
+  and exclusive of nested stages. Logging includes the background log writer. Keys are
+  remapped while the JSON is parsed, so parse+remap is timed as one call and split by
+  re-running the captured outputs with and without remapping;
+- memory: tracemalloc peak over the memory pass, and the process's peak RSS.
+
+Results are written as JSON (with the commit they were measured on); --compare prints
+the change against an earlier result and --max-regression makes a drop in throughput
+fail the run (exit code 1). The script also exits with 1 if a canned output does not
+behave as labelled, if changing a report assembled from defaults changes the next, or
+if assembling a report from defaults takes longer than --max-assemble-us.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--reports N] [--invalid-rate P] [--malformed-rate P]
+        [--output bench_pipeline.json] [--compare OLD.json] [--max-regression PCT]
+"""
+import os
+import sys
+import json
+import time
+import zlib
+import random
+import logging
+import platform
+import argparse
+import tempfile
+import threading
+import subprocess
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pydantic
+from pydantic import BaseModel, ValidationError
+
+import main
+from echo_extraction import abbreviation_processor, extraction_logic, utils
+from echo_extraction.json_recovery import parse_llm_json
+from echo_extraction.llm_mapping_utils import parse_component_output
+from echo_extraction.log_store import LogStore
+from echo_extraction.models import get_default_component
+
+from bench_abbreviation_matcher import DEFAULT_CSV, synthetic_corpus
+from bench_validation_path import respell
+
+COMPONENTS: List[Type[BaseModel]] = [
+    main.LeftVentricle, main.RightVentricle, main.LeftAtrium, main.RightAtrium,
+    main.MitralValve, main.AorticValve, main.PulmonaryValve, main.TricuspidValve,
+    main.Aorta, main.PulmonicVein, main.IVC,
+    main.VSD, main.ASD, main.PFO,
+    main.Pericardium,
+]
+STAGES = ["abbreviation", "parse", "remap", "validate", "assemble", "logging", "other"]
+
+
+#------------------------------------------------------------------------------
+# Fake LLM
+#------------------------------------------------------------------------------
+def _string_leaves(data: Any, path: Tuple = ()) -> List[Tuple]:
+    if isinstance(data, dict):
+        return [leaf for key, value in data.items() for leaf in _string_leaves(value, path + (key,))]
+    if isinstance(data, list):
+        return [leaf for i, value in enumerate(data) for leaf in _string_leaves(value, path + (i,))]
+    return [path] if isinstance(data, str) else []
+
+
+def _replaced(data: Any, path: Tuple, value: Any) -> Any:
+    if not path:
+        return value
+    copy = list(data) if isinstance(data, list) else dict(data)
+    copy[path[0]] = _replaced(data[path[0]], path[1:], value)
+    return copy
+
+
+def canned_outputs(model: Type[BaseModel], rng: random.Random, list_items: int) -> Dict[str, List[str]]:
+    """
+    Raw outputs for one component, as the model answers after the prefilled '{':
+    'valid' (plain, fenced, brace missing), 'invalid' (a field set to a value the model
+    rejects) and 'malformed' (no JSON at all, or cut off inside a string).
+    """
+    defaults = get_default_component(model).model_dump(mode="json")
+    full = json.dumps(respell(defaults, rng, list_items), indent=2)
+    invalid = []
+    for path in _string_leaves(defaults):
+        candidate = _replaced(defaults, path, "Unrecognised finding")
+        try:
+            model.model_validate(candidate)
+        except ValidationError:
+            invalid.append(json.dumps(respell(candidate, rng, list_items), indent=2))
+            if len(invalid) == 2:
+                break
+    cut = full.index('": "') + 6 if '": "' in full else len(full) // 2
+    return {
+        "valid": [full, f"```json\n{full}\n```", full[1:]],
+        "invalid": invalid,
+        "malformed": [
+            "I could not find any information about this component in the report.",
+            full[:cut],
+        ],
+    }
+
+
+def check_canned_outputs(outputs: Dict[str, Dict[str, List[str]]]) -> List[str]:
+    """Labels that the outputs do not live up to (an empty list if all behave as labelled)."""
+    problems = []
+    for model in COMPONENTS:
+        for kind, texts in outputs[model.__name__].items():
+            if not texts:
+                problems.append(f"{model.__name__}: no {kind} output")
+            for i, text in enumerate(texts):
+                outcome = "malformed"
+                try:
+                    data, _ = parse_component_output(text, model)
+                    model.model_validate(data)
+                    outcome = "valid"
+                except ValidationError:
+                    outcome = "invalid"
+                except Exception:
+                    pass
+                if outcome != kind:
+                    problems.append(f"{model.__name__}: {kind} output {i} is {outcome}")
+    return problems
+
+
+def _mutate_tree(instance: BaseModel) -> int:
+    """Tries to change every string field and list of the tree in place; returns how many changes were refused."""
+    refused = 0
+    for name, value in list(instance.__dict__.items()):
+        try:
+            if isinstance(value, BaseModel):
+                refused += _mutate_tree(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, BaseModel):
+                        refused += _mutate_tree(item)
+                value.append("changed")
+            elif isinstance(value, str):
+                setattr(instance, name, "changed")
+        except TypeError:
+            refused += 1
+    return refused
+
+
+def check_default_isolation() -> List[str]:
+    """
+    Problems if changing a report assembled from defaults changes the next one (an empty
+    list if not): the shared defaults must refuse changes, and deep copies must be changeable.
+    """
+    problems = []
+    expected = main.assemble_echo_report({}).model_dump()
+    report = main.assemble_echo_report({})
+    if not _mutate_tree(report):
+        problems.append("the default components of an assembled report can be changed")
+    copy = report.model_copy(deep=True)
+    if _mutate_tree(copy):
+        problems.append("a deep copy of an assembled report cannot be changed")
+    if main.assemble_echo_report({}).model_dump() != expected:
+        problems.append("changing an assembled report changed the defaults of the next one")
+    return problems
+
+
+def time_default_assembly(rounds: int = 5, number: int = 1000) -> float:
+    """Microseconds per assemble_echo_report({}) (all components default), fastest of `rounds`."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            main.assemble_echo_report({})
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+class FakeLLM:
+    """
+    Deterministic stand-in for the extraction chain. invoke() answers with a canned output
+    of the requested component; the kind is drawn from an RNG seeded with the report,
+    the component and the attempt number, so runs are repeatable.
+    """
+    def __init__(self, outputs: Dict[str, Dict[str, List[str]]], seed: int, invalid_rate: float, malformed_rate: float):
+        self.outputs = outputs
+        self.seed = seed
+        self.invalid_rate = invalid_rate
+        self.malformed_rate = malformed_rate
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.attempts: Dict[Tuple[int, str], int] = {}
+        self.counts = {"valid": 0, "invalid": 0, "malformed": 0}
+
+    def invoke(self, llm_input: Dict[str, Any]) -> str:
+        component = llm_input["schema_name"]
+        report_key = zlib.crc32(llm_input["report"].encode("utf-8"))
+        with self._lock:
+            attempt = self.attempts.get((report_key, component), 0) + 1
+            self.attempts[(report_key, component)] = attempt
+        rng = random.Random(f"{self.seed}:{report_key}:{component}:{attempt}")
+        roll = rng.random()
+        kind = "malformed" if roll < self.malformed_rate else "invalid" if roll < self.malformed_rate + self.invalid_rate else "valid"
+        with self._lock:
+            self.counts[kind] += 1
+        return rng.choice(self.outputs[component][kind])
+
+
+class FakeFeedback:
+    """Stand-in for the feedback chain."""
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, feedback_input: Dict[str, Any]) -> str:
+        self.calls += 1
+        return "The previous output was rejected. Output only the JSON object and use the allowed values listed in the schema."
+
+
+#------------------------------------------------------------------------------
+# Stage timing
+#------------------------------------------------------------------------------
+class StageTimer:
+    """CPU time per stage, measured on the calling thread and exclusive of nested stages."""
+    def __init__(self):
+        self.cpu: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self.calls: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            stack = self._local.__dict__.setdefault("stack", [])
+            stack.append(0.0)  # CPU time of nested stages
+            start = time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - start
+                nested = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                with self._lock:
+                    self.cpu[stage] += elapsed - nested
+                    self.calls[stage] += 1
+        return timed
+
+
+class Patches:
+    """Sets attributes for the duration of a with-block and restores them afterwards."""
+    def __init__(self):
+        self._saved: List[Tuple[Any, str, bool, Any]] = []
+
+    def set(self, target: Any, name: str, value: Any) -> None:
+        own = name in vars(target)
+        self._saved.append((target, name, own, vars(target).get(name)))
+        setattr(target, name, value)
+
+    def __enter__(self) -> "Patches":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for target, name, own, value in reversed(self._saved):
+            if own:
+                setattr(target, name, value)
+            else:
+                delattr(target, name)
+        self._saved.clear()
+
+
+def instrument(patches: Patches, timer: StageTimer, captured: List[Tuple[str, Type[BaseModel]]]) -> None:
+    """Wraps the functions of each stage at the names the pipeline calls them by."""
+    patches.set(abbreviation_processor, "process_abbreviations", timer.wrap("abbreviation", abbreviation_processor.process_abbreviations))
+
+    parse = timer.wrap("parse", parse_component_output)
+    def parse_and_capture(raw_output, component_model):
+        captured.append((raw_output, component_model))
+        return parse(raw_output, component_model)
+    patches.set(extraction_logic, "parse_component_output", parse_and_capture)
+
+    for model in COMPONENTS:
+        validate = timer.wrap("validate", model.model_validate)
+        patches.set(model, "model_validate", classmethod(lambda cls, obj, _validate=validate, **kwargs: _validate(obj, **kwargs)))
+
+    patches.set(main, "assemble_echo_report", timer.wrap("assemble", main.assemble_echo_report))
+    patches.set(logging.Logger, "_log", timer.wrap("logging", logging.Logger._log))
+    # The background writer formats and writes the records in its own thread
+    patches.set(utils._router, "emit", timer.wrap("logging", utils._router.emit))
+
+
+def remap_share(captured: List[Tuple[str, Type[BaseModel]]], repeat: int) -> float:
+    """Share of the parse stage spent remapping keys: parse_component_output vs. parse_llm_json alone, best of `repeat`."""
+    def best(func: Callable[[str, Type[BaseModel]], Any]) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.process_time()
+            for raw_output, model in captured:
+                try:
+                    func(raw_output, model)
+                except Exception:
+                    pass
+            timings.append(time.process_time() - start)
+        return min(timings)
+    with_remap = best(parse_component_output)
+    parse_only = best(lambda raw_output, model: parse_llm_json(raw_output))
+    return max(0.0, (with_remap - parse_only) / with_remap) if with_remap > 0 else 0.0
+
+
+#------------------------------------------------------------------------------
+# Passes
+#------------------------------------------------------------------------------
+def run_pass(reports: List[str], matcher: Any, log_store: LogStore, raw_dir: str, prefix: str) -> Tuple[float, float, int]:
+    """Processes every report like main's batch loop. Returns (wall seconds, CPU seconds, reports that failed)."""
+    extension = ".jsonl" if utils.LOG_FORMAT == "jsonl" else ".md"
+    abbreviation_processor.clear_line_cache()
+    failed = 0
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    for i, text in enumerate(reports):
+        report_id = f"{prefix}_{i:05d}"
+        utils.set_log_file(log_store.path_for(report_id, extension), os.path.join(raw_dir, f"{report_id}.jsonl"))
+        if main.process_report(text, matcher) is None:
+            failed += 1
+        utils.close_log_file()
+    return time.perf_counter() - wall_start, time.process_time() - cpu_start, failed
+
+
+def git_commit() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def max_rss_mib() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1 << 20) if sys.platform == "darwin" else rss / 1024, 1)
+
+
+#------------------------------------------------------------------------------
+# Comparison
+#------------------------------------------------------------------------------
+def _metrics(result: Dict[str, Any]) -> Dict[str, float]:
+    metrics = {
+        "reports/s": result["throughput"]["reports_per_second"],
+        "cpu ms/report": result["throughput"]["cpu_ms_per_report"],
+    }
+    metrics.update({f"{stage} ms/report": value for stage, value in result["stages_cpu_ms_per_report"].items()})
+    metrics["tracemalloc peak MiB"] = result["memory"]["tracemalloc_peak_mib"]
+    return metrics
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any]) -> float:
+    """Prints every metric of both results and returns the relative change in reports/s."""
+    print(f"\nCompared with {old['meta'].get('commit') or 'previous result'}:")
+    old_metrics, new_metrics = _metrics(old), _metrics(new)
+    for name, value in new_metrics.items():
+        before = old_metrics.get(name)
+        change = f"{(value - before) / before * 100:+7.1f}%" if before else "      -"
+        print(f"  {name:<24} {before if before is not None else '-':>10} -> {value:>10}  {change}")
+    before = old_metrics["reports/s"]
+    return (new_metrics["reports/s"] - before) / before if before else 0.0
+
+
+#------------------------------------------------------------------------------
+# Benchmark
+#------------------------------------------------------------------------------
+def main_bench() -> int:
+    parser = argparse.ArgumentParser(description="Offline pipeline benchmark with a deterministic fake LLM.")
+    parser.add_argument("--reports", type=int, default=50, help="Synthetic reports per pass.")
+    parser.add_argument("--memory-reports", type=int, default=10, help="Reports in the (slower) memory pass.")
+    parser.add_argument("--warmup", type=int, default=2, help="Reports processed before measuring.")
+    parser.add_argument("--repeat", type=int, default=3, help="Throughput passes; the fastest is reported.")
+    parser.add_argument("--invalid-rate", type=float, default=0.15, help="Share of attempts answered with an invalid output.")
+    parser.add_argument("--malformed-rate", type=float, default=0.05, help="Share of attempts answered with a malformed output.")
+    parser.add_argument("--list-items", type=int, default=3, help="Items in each list-of-model field of the canned outputs.")
+    parser.add_argument("--seed", type=int, default=11, help="Seed of the reports, the canned outputs and the fake LLM.")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="Abbreviation CSV file.")
+    parser.add_argument("--output", default="bench_pipeline.json", help="Where to write the results.")
+    parser.add_argument("--compare", help="Earlier results to compare with.")
+    parser.add_argument("--max-regression", type=float, default=None, help="Fail if reports/s dropped by more than this percentage (with --compare).")
+    parser.add_argument("--max-assemble-us", type=float, default=200.0,
+                        help="Fail if assembling a report from default components takes longer (microseconds).")
+    args = parser.parse_args()
+
+    # Book records only (as in main, minus the console), so logging costs what it costs in production
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.setLevel(logging.DEBUG)
+
+    rng = random.Random(args.seed)
+    outputs = {model.__name__: canned_outputs(model, rng, args.list_items) for model in COMPONENTS}
+    problems = check_canned_outputs(outputs) + check_default_isolation()
+    assemble_us = time_default_assembly()
+    if assemble_us > args.max_assemble_us:
+        problems.append(f"assembling a report from defaults takes {assemble_us:.1f} us (more than {args.max_assemble_us:g} us)")
+    for problem in problems:
+        print(f"Check failed: {problem}")
+    if problems:
+        return 1
+
+    matcher = abbreviation_processor.load_abbreviation_matcher(args.csv)
+    abbrev_map = abbreviation_processor.load_abbreviation_dictionary(args.csv)
+    reports = synthetic_corpus(abbrev_map, args.reports + args.warmup, seed=args.seed)
+    warmup, reports = reports[:args.warmup], reports[args.warmup:]
+
+    fake_llm = FakeLLM(outputs, args.seed, args.invalid_rate, args.malformed_rate)
+    fake_feedback = FakeFeedback()
+    with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as tmp, Patches() as patches:
+        patches.set(extraction_logic, "get_extraction_chain", lambda: fake_llm)
+        patches.set(extraction_logic, "get_feedback_chain", lambda: fake_feedback)
+        patches.set(extraction_logic, "get_escalation_chain", lambda: None)
+        log_store = LogStore.from_env(os.path.join(tmp, "logs"))
+        raw_dir = os.path.join(tmp, "raw_outputs")
+        os.makedirs(raw_dir)
+
+        run_pass(warmup, matcher, log_store, raw_dir, "warmup")
+
+        # Best of --repeat runs, as every run makes the same LLM calls
+        runs = []
+        for _ in range(args.repeat):
+            fake_llm.reset()
+            fake_feedback.calls = 0
+            runs.append(run_pass(reports, matcher, log_store, raw_dir, "throughput"))
+        wall, cpu, failed = min(runs)
+        outcomes = dict(fake_llm.counts)
+        feedback_calls = fake_feedback.calls
+        log_bytes = sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(log_store.log_dir) for name in files)
+
+        timer = StageTimer()
+        captured: List[Tuple[str, Type[BaseModel]]] = []
+        fake_llm.reset()
+        with Patches() as stage_patches:
+            instrument(stage_patches, timer, captured)
+            _, stage_cpu, _ = run_pass(reports, matcher, log_store, raw_dir, "stages")
+        share = remap_share(captured, repeat=3)
+        timer.cpu["remap"] = timer.cpu["parse"] * share
+        timer.cpu["parse"] -= timer.cpu["remap"]
+        timer.calls["remap"] = timer.calls["parse"]
+        timer.cpu["other"] = max(0.0, stage_cpu - sum(timer.cpu.values()))
+
+        fake_llm.reset()
+        memory_reports = reports[:args.memory_reports]
+        tracemalloc.start()
+        run_pass(memory_reports, matcher, log_store, raw_dir, "memory")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    n = len(reports)
+    result = {
+        "benchmark": "pipeline",
+        "meta": {
+            **git_commit(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "pydantic": pydantic.VERSION,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "log_format": utils.LOG_FORMAT,
+            "log_compression": log_store.compression,
+            "args": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "max_regression")},
+        },
+        "throughput": {
+            "reports": n,
+            "failed_reports": failed,
+            "wall_seconds": round(wall, 3),
+            "cpu_seconds": round(cpu, 3),
+            "reports_per_second": round(n / wall, 2),
+            "cpu_ms_per_report": round(cpu / n * 1000, 2),
+            "llm_calls_per_report": round(sum(outcomes.values()) / n, 2),
+            "outcomes": outcomes,
+            "feedback_calls": feedback_calls,
+            "log_bytes_per_report": round(log_bytes / (n * args.repeat + len(warmup))),
+        },
+        "assemble_defaults_us": round(assemble_us, 1),
+        "stages_cpu_ms_per_report": {stage: round(timer.cpu[stage] / n * 1000, 3) for stage in STAGES},
+        "stage_calls_per_report": {stage: round(timer.calls[stage] / n, 1) for stage in STAGES if stage != "other"},
+        "memory": {
+            "reports": len(memory_reports),
+            "tracemalloc_peak_mib": round(peak / (1 << 20), 2),
+            "max_rss_mib": max_rss_mib(),
+        },
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+    throughput = result["throughput"]
+    print(f"Reports            : {n} ({throughput['llm_calls_per_report']} LLM calls/report: "
+          + ", ".join(f"{count} {kind}" for kind, count in outcomes.items()) + f"; {failed} failed)")
+    print(f"Throughput         : {throughput['reports_per_second']} reports/s, {throughput['cpu_ms_per_report']} ms CPU/report")
+    for stage, value in result["stages_cpu_ms_per_report"].items():
+        print(f"  {stage:<16} : {value:8.3f} ms/report")
+    print(f"Default assembly   : {result['assemble_defaults_us']} us/report")
+    print(f"Peak memory        : {result['memory']['tracemalloc_peak_mib']} MiB traced, {result['memory']['max_rss_mib']} MiB RSS")
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            change = compare(json.load(f), result)
+        if args.max_regression is not None and change < -args.max_regression / 100:
+            print(f"Throughput dropped by {-change * 100:.1f}% (more than {args.max_regression}%).")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
@@ -0,0 +1,173 @@
+"""
+Bulk-validation benchmark of the declarative range checks against per-class validators.
+
+For every range-checked model, a reference model with the same fields is rebuilt in
+the original style: one before-mode validator per class that takes the validation
+info and checks `info.field_name` against a chain of ranges. Both are run over the
+same batch of generated inputs (in-range and out-of-range numbers, numeric strings,
+"Not Measured" and, for fields that default, non-numeric text) and must produce
+identical output (exit code 1 otherwise).
+
+Usage:
+    python benchmarks/bench_range_validation.py [--items N] [--repeat N]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import warnings
+from typing import Any, Dict, List, Tuple, Type
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel, create_model, field_validator
+
+from echo_extraction import models
+from echo_extraction.models import RangeCheckedModel, common_model_config
+
+warnings.filterwarnings("ignore")
+
+
+#------------------------------------------------------------------------------
+# Original arrangement (reference)
+#------------------------------------------------------------------------------
+def _declared_ranges(model: Type[BaseModel]) -> Dict[str, Tuple[float, float, str]]:
+    ranges = {}
+    for name, field_info in model.model_fields.items():
+        extra = field_info.json_schema_extra if isinstance(field_info.json_schema_extra, dict) else {}
+        if extra.get("range") is not None:
+            low, high = extra["range"]
+            ranges[name] = (low, high, extra.get("on_invalid", "default"))
+    return ranges
+
+
+def legacy_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """The model with its range checks in a single per-class validator, as before."""
+    ranges = _declared_ranges(model)
+
+    def validate_ranges(cls, v, info):
+        if v == "Not Measured":
+            return v
+        low, high, on_invalid = ranges[info.field_name]
+        if on_invalid == "raise":
+            if isinstance(v, str):
+                try:
+                    v = float(v)
+                except ValueError:
+                    raise ValueError(f"{info.field_name} value must be a number or 'Not Measured'")
+            if isinstance(v, (int, float)):
+                val = float(v)
+                for name, (lo, hi, _) in ranges.items():
+                    if info.field_name == name and not (lo <= val <= hi):
+                        raise ValueError(f"{info.field_name} value must be between {lo} and {hi}")
+                return val
+            raise ValueError(f"{info.field_name} value must be a number or 'Not Measured'")
+        try:
+            val = float(v)
+            for name, (lo, hi, _) in ranges.items():
+                if info.field_name == name and not (lo <= val <= hi):
+                    return "Not Measured"
+            return val
+        except Exception:
+            return "Not Measured"
+
+    fields = {name: (field_info.annotation, field_info) for name, field_info in model.model_fields.items()}
+    validator = field_validator(*ranges, mode="before")(classmethod(validate_ranges))
+    return create_model(
+        f"Legacy{model.__name__}",
+        __config__=common_model_config,
+        __validators__={"validate_ranges": validator},
+        **fields,
+    )
+
+
+#------------------------------------------------------------------------------
+# Inputs
+#------------------------------------------------------------------------------
+def range_checked_models() -> List[Type[BaseModel]]:
+    found = []
+    for name in models.__all__:
+        obj = getattr(models, name)
+        if isinstance(obj, type) and issubclass(obj, RangeCheckedModel) and obj is not RangeCheckedModel:
+            found.append(obj)
+    return found
+
+
+def _value(rng: random.Random, low: float, high: float, on_invalid: str) -> Any:
+    roll = rng.random()
+    span = high - low
+    if roll < 0.55:
+        return round(rng.uniform(low, high), 2)
+    if roll < 0.7:
+        return str(round(rng.uniform(low, high), 1))
+    if roll < 0.8:
+        return "Not Measured"
+    if on_invalid == "raise":
+        return rng.randint(int(low) + 1, int(low) + 2) if span >= 2 else low
+    if roll < 0.92:
+        return round(rng.uniform(high, high + span + 1), 2)
+    return rng.choice(["n/a", "", "normal", None])
+
+
+def generate_inputs(model: Type[BaseModel], n_items: int, seed: int = 5) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    ranges = _declared_ranges(model)
+    items = []
+    for _ in range(n_items):
+        item = {}
+        for name, (low, high, on_invalid) in ranges.items():
+            if rng.random() < 0.9:
+                key = model.model_fields[name].alias or name
+                item[key] = _value(rng, low, high, on_invalid)
+        items.append(item)
+    return items
+
+
+#------------------------------------------------------------------------------
+# Benchmark
+#------------------------------------------------------------------------------
+def _time(model: Type[BaseModel], inputs: List[Dict[str, Any]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in inputs:
+            model.model_validate(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark declarative range checks against per-class validators.")
+    parser.add_argument("--items", type=int, default=2000, help="Inputs generated per model.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (the best is reported).")
+    args = parser.parse_args()
+
+    total_legacy = total_declarative = 0.0
+    n_fields = 0
+    mismatches = 0
+    print(f"{'Model':<34}{'fields':>7}{'per-class':>12}{'declarative':>13}{'speed-up':>10}")
+    for model in range_checked_models():
+        legacy = legacy_model(model)
+        inputs = generate_inputs(model, args.items)
+        for item in inputs:
+            if legacy.model_validate(item).model_dump() != model.model_validate(item).model_dump():
+                mismatches += 1
+        legacy_time = _time(legacy, inputs, args.repeat)
+        declarative_time = _time(model, inputs, args.repeat)
+        total_legacy += legacy_time
+        total_declarative += declarative_time
+        n_fields += sum(len(item) for item in inputs)
+        print(f"{model.__name__:<34}{len(_declared_ranges(model)):>7}{legacy_time * 1000:>10.1f}ms"
+              f"{declarative_time * 1000:>11.1f}ms{legacy_time / declarative_time:>9.2f}x")
+
+    print(f"\nTotal              : {n_fields} fields validated per run")
+    print(f"Per-class validator: {total_legacy * 1000:.1f} ms ({n_fields / total_legacy / 1e6:.2f} M fields/s)")
+    print(f"Declarative        : {total_declarative * 1000:.1f} ms ({n_fields / total_declarative / 1e6:.2f} M fields/s)")
+    print(f"Speed-up           : {total_legacy / total_declarative:.2f}x")
+    print(f"Identical output   : {'yes' if not mismatches else f'NO ({mismatches} inputs differ)'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
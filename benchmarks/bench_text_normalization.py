@@ -0,0 +1,160 @@
+"""
+Benchmark of the fused abbreviation pipeline against the original line-by-line steps.
+
+The original arrangement (split into lines, run the five step functions on every
+non-empty line, collapse spaces) is rebuilt from the step functions, which are kept
+unchanged, and compared with process_abbreviations and process_abbreviations_batch.
+The script fails (exit code 1) if any output differs. Besides the report corpus, a set
+of edge-case texts (blank lines, tabs, CRLF, unusual whitespace, dashes and dots) is
+always checked. The fused pipeline is timed with a cold line cache and again with the
+cache warmed by the first run, and each of its stages is timed on its own: the standard
+abbreviation replacement takes nearly all of the time, the regex passes a few percent.
+
+Usage:
+    python benchmarks/bench_text_normalization.py [--csv PATH] [--reports PATH] [--synthetic N] [--workers N]
+"""
+import os
+import re
+import sys
+import time
+import random
+import argparse
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from echo_extraction import abbreviation_processor as ap
+from echo_extraction.abbreviation_matcher import get_abbreviation_matcher
+from bench_abbreviation_matcher import DEFAULT_CSV, synthetic_corpus, load_reports
+
+
+#------------------------------------------------------------------------------
+# Original arrangement (reference)
+#------------------------------------------------------------------------------
+def legacy_process(text: str, abbrev_map: Dict[str, str]) -> str:
+    """The per-line pipeline as process_abbreviations ran it before the steps were fused."""
+    text = text.replace('\\n', '\n')
+    processed_lines = []
+    for line in text.split('\n'):
+        if line.strip():
+            line = ap.replace_dashed_abbreviations(line, abbrev_map)
+            line = ap.normalize_text_spacing(line)
+            line = ap.remove_space_around_numeric_dots(line)
+            line = ap.add_space_between_number_and_word(line)
+            line = ap.replace_standard_abbreviations(line, abbrev_map)
+            processed_lines.append(re.sub(r' +', ' ', line).strip())
+        else:
+            processed_lines.append('')
+    return '\n'.join(processed_lines)
+
+
+#------------------------------------------------------------------------------
+# Stage timing
+#------------------------------------------------------------------------------
+def stage_times(corpus: List[str], matcher) -> Dict[str, float]:
+    """Seconds spent in each stage of the fused pipeline (the steps of _normalize_text) over the corpus."""
+    stages = [
+        ("dashed abbreviations", matcher.replace_dashed),
+        ("punctuation spacing", lambda t: ap._PUNCTUATION_OR_DASH_RE.sub(r' \1\2 ', t)),
+        ("space collapse", lambda t: ap._SPACE_RUNS_AND_LINE_EDGES_RE.sub(r'\1', t)),
+        ("numeric dots", lambda t: ap._NUMERIC_DOT_RE.sub(r'\1.\2', t)),
+        ("number/word split", lambda t: ap._NUMBER_WORD_BOUNDARY_RE.sub(' ', t)),
+        ("standard abbreviations", matcher.replace_standard),
+        ("final space collapse", lambda t: ap._SPACE_RUNS_AND_LINE_EDGES_RE.sub(r'\1', t)),
+    ]
+    totals = {name: 0.0 for name, _ in stages}
+    for text in corpus:
+        text = text.replace('\\n', '\n')
+        for name, stage in stages:
+            start = time.perf_counter()
+            text = stage(text)
+            totals[name] += time.perf_counter() - start
+    return totals
+
+
+#------------------------------------------------------------------------------
+# Edge cases
+#------------------------------------------------------------------------------
+EDGE_CHARS = [" ", "  ", "\t", "\r", "\n", "\n\n", "\x0b", "\x0c", "\xa0", " ", "\\n",
+              ".", "..", "-", "--", " - ", "2.5", "2 . 5", "1.2.3", "3cm", "cm3", "a1b2", "x", "LV",
+              "(", ")", ":", "=", "é", "_", "٣"]
+
+
+def edge_case_corpus(abbrev_map: Dict[str, str], n_texts: int, seed: int = 11) -> List[str]:
+    """Random concatenations of whitespace, punctuation, numbers and dictionary keys."""
+    rng = random.Random(seed)
+    keys = list(abbrev_map.keys())
+    texts = []
+    for _ in range(n_texts):
+        pieces = [rng.choice(EDGE_CHARS) if rng.random() < 0.7 else rng.choice(keys) for _ in range(rng.randint(1, 40))]
+        texts.append("".join(pieces))
+    return texts
+
+
+#------------------------------------------------------------------------------
+# Benchmark
+#------------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fused abbreviation pipeline against the line-by-line steps.")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="Abbreviation CSV file.")
+    parser.add_argument("--reports", help="JSON file with reports (list of {'_id', 'data'}).")
+    parser.add_argument("--synthetic", type=int, default=200, help="Number of synthetic reports if --reports is not given.")
+    parser.add_argument("--edge-cases", type=int, default=2000, help="Number of random edge-case texts to check.")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes for the batch API run.")
+    args = parser.parse_args()
+
+    abbrev_map = ap.load_abbreviation_dictionary(args.csv)
+    corpus = load_reports(args.reports) if args.reports else synthetic_corpus(abbrev_map, args.synthetic)
+    matcher = get_abbreviation_matcher(abbrev_map)
+    n_lines = sum(text.count('\n') + 1 for text in corpus)
+
+    # Warm the matcher's lazily compiled patterns so both sides are timed alike
+    for text in corpus:
+        legacy_process(text, matcher)
+
+    start = time.perf_counter()
+    legacy_out = [legacy_process(text, matcher) for text in corpus]
+    legacy_time = time.perf_counter() - start
+
+    ap.clear_line_cache()
+    start = time.perf_counter()
+    fused_out = [ap.process_abbreviations(text, matcher) for text in corpus]
+    fused_time = time.perf_counter() - start
+    cold_stats = ap.get_line_cache_stats()
+
+    # Same corpus again: every line is now served from the line cache
+    start = time.perf_counter()
+    cached_out = [ap.process_abbreviations(text, matcher) for text in corpus]
+    cached_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_out = ap.process_abbreviations_batch(corpus, matcher, workers=args.workers)
+    batch_time = time.perf_counter() - start
+
+    stages = stage_times(corpus, matcher)
+    stages_total = sum(stages.values())
+
+    edge_texts = edge_case_corpus(abbrev_map, args.edge_cases)
+    ap.clear_line_cache()
+    edge_mismatches = [t for t in edge_texts if legacy_process(t, matcher) != ap.process_abbreviations(t, matcher)]
+    mismatches = [i for i, (a, b, c, d) in enumerate(zip(legacy_out, fused_out, batch_out, cached_out)) if not a == b == c == d]
+
+    print(f"Corpus             : {len(corpus)} reports, {n_lines} lines")
+    print(f"Line-by-line steps : {legacy_time * 1000:.1f} ms ({legacy_time / n_lines * 1e6:.0f} us/line)")
+    print(f"Fused pipeline     : {fused_time * 1000:.1f} ms ({fused_time / n_lines * 1e6:.0f} us/line)")
+    print(f"Fused, cache warm  : {cached_time * 1000:.1f} ms ({cached_time / n_lines * 1e6:.0f} us/line)")
+    print(f"Batch, cache warm  : {batch_time * 1000:.1f} ms ({args.workers} workers)")
+    print(f"Line cache (cold)  : {cold_stats['hits']} hits / {cold_stats['misses']} misses")
+    print(f"Speed-up (fused)   : {legacy_time / fused_time:.2f}x")
+    print("Fused stages       :")
+    for name, seconds in stages.items():
+        print(f"  {name:<24}: {seconds * 1000:7.1f} ms ({seconds / stages_total:5.1%})")
+    print(f"Identical output   : {'yes' if not mismatches else f'NO ({len(mismatches)} reports differ)'}")
+    print(f"Edge cases         : {len(edge_texts) - len(edge_mismatches)}/{len(edge_texts)} identical")
+    for text in edge_mismatches[:5]:
+        print(f"  differs: {text!r}")
+    return 1 if mismatches or edge_mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Per-attempt CPU time and allocations of turning raw LLM text into a validated component.
+
+Compares three paths over the same raw outputs:
+- original: json.loads, remap_llm_keys (builds a remapped copy), model_validate;
+- compiled: json.loads, compiled KeyRemapper.remap (still a copy), model_validate;
+- single walk: json.loads with the remapper's object_pairs_hook (keys remapped while
+  parsing, no copy), model_validate.
+
+The raw outputs are full, valid components (every field present, long lists, key
+spellings varied like LLM output). All paths must validate to the same model
+(exit code 1 otherwise).
+
+Usage:
+    python benchmarks/bench_validation_path.py [--items N] [--repeat N]
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from typing import Any, Callable, Dict, Type
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel
+
+from echo_extraction.json_recovery import parse_llm_json
+from echo_extraction.llm_mapping_utils import remap_llm_keys, get_key_remapper
+from echo_extraction.models import LeftVentricle, MitralValve, Aorta
+
+MODELS = [LeftVentricle, MitralValve, Aorta]
+
+
+def respell(data: Any, rng: random.Random, list_items: int) -> Any:
+    """Varies key spellings (and lengthens lists) the way LLM output does."""
+    if isinstance(data, dict):
+        out = {}
+        for key, value in data.items():
+            spelled = rng.choice([key, key.replace("_", " ").title(), key.upper(), key.replace("_", "-")])
+            out[spelled] = respell(value, rng, list_items)
+        return out
+    if isinstance(data, list):
+        items = [respell(item, rng, list_items) for item in data]
+        return (items * list_items)[:list_items] if items and isinstance(data[0], dict) else items
+    return data
+
+
+def raw_output_for(model: Type[BaseModel], rng: random.Random, list_items: int) -> str:
+    """A complete, valid raw output for `model`, as the model would answer after the prefilled '{'."""
+    defaults = model.model_validate({"assessment": {}, "measurements": {}}).model_dump(mode="json")
+    text = json.dumps(respell(defaults, rng, list_items), indent=2)
+    return text[1:]  # The prompt ends with '{', so the answer usually starts right after it
+
+
+def original_path(raw: str, model: Type[BaseModel]) -> BaseModel:
+    parsed, _ = parse_llm_json(raw)
+    return model.model_validate(remap_llm_keys(parsed, model.model_fields))
+
+
+def compiled_path(raw: str, model: Type[BaseModel]) -> BaseModel:
+    parsed, _ = parse_llm_json(raw)
+    return model.model_validate(get_key_remapper(model).remap(parsed))
+
+
+def single_walk_path(raw: str, model: Type[BaseModel]) -> BaseModel:
+    parsed, _ = parse_llm_json(raw, object_pairs_hook=get_key_remapper(model).object_pairs_hook)
+    return model.model_validate(parsed)
+
+
+def measure(path: Callable[[str, Type[BaseModel]], BaseModel], raw: str, model: Type[BaseModel], repeat: int) -> Dict[str, Any]:
+    result = path(raw, model)  # Warm-up (compiles remappers and hooks)
+    start = time.process_time()
+    for _ in range(repeat):
+        path(raw, model)
+    cpu = (time.process_time() - start) / repeat
+    tracemalloc.start()
+    path(raw, model)
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return {'result': result, 'cpu_ms': cpu * 1000, 'peak_kib': peak / 1024, 'live_blocks': sum(s.count for s in snapshot.statistics('filename'))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark raw-output-to-model paths.")
+    parser.add_argument("--items", type=int, default=30, help="Items in each list-of-model field.")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed runs per model and path.")
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    paths = [("original", original_path), ("compiled", compiled_path), ("single walk", single_walk_path)]
+    mismatches = 0
+    for model in MODELS:
+        raw = raw_output_for(model, rng, args.items)
+        results = {name: measure(path, raw, model, args.repeat) for name, path in paths}
+        reference = results["original"]
+        print(f"{model.__name__} ({len(raw)} chars of raw output)")
+        for name, r in results.items():
+            same = r['result'] == reference['result']
+            mismatches += not same
+            print(f"  {name:<12} cpu {r['cpu_ms']:7.3f} ms  ({reference['cpu_ms'] / r['cpu_ms']:4.2f}x)  "
+                  f"peak alloc {r['peak_kib']:8.1f} KiB  same model: {'yes' if same else 'NO'}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Import-time budget check.
+
+Imports each target module in a fresh interpreter with `python -X importtime` and
+compares its cumulative import time (median of several runs) with a budget. pydantic
+is imported (and one trivial model built) first in every run, so the numbers measure
+this package's own modules (building the models, compiling patterns) rather than
+third-party start-up. The script exits with code 1 if any target is over its budget,
+so it can guard CLI tools and worker start-up against a module that starts importing
+(or building) everything.
+
+Usage:
+    python benchmarks/check_import_time.py [--runs N] [--scale X] [module ...]
+"""
+import os
+import re
+import sys
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs before the measured import: loads pydantic, including the parts it imports lazily
+_PREAMBLE = (
+    "from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator\n"
+    "class _Warm(BaseModel):\n"
+    "    x: int = Field(default=0)\n"
+)
+
+# Cumulative import time budget per module, in milliseconds (pydantic already loaded)
+IMPORT_BUDGETS_MS: Dict[str, float] = {
+    "echo_extraction.models": 10,
+    "echo_extraction.models.pericardium": 40,
+    "echo_extraction.models.left_ventricle": 70,
+    "echo_extraction.models.echo_report": 400,
+    "echo_extraction.abbreviation_processor": 50,
+    "echo_extraction.json_recovery": 20,
+    "echo_extraction.schema_helpers": 20,
+    "echo_extraction.llm_mapping_utils": 20,
+    "echo_extraction.prompt_schema": 30,
+}
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)\s*$")
+
+
+def import_time_ms(module: str) -> Optional[float]:
+    """Cumulative import time of `module` in a fresh interpreter, or None if the import failed."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{_PREAMBLE}import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        print(f"  import of {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+        return None
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1)) / 1000
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check module import times against their budgets.")
+    parser.add_argument("modules", nargs="*", help="Modules to check (default: all with a budget).")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module (the median is used).")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (for slower machines).")
+    args = parser.parse_args()
+
+    over_budget: List[str] = []
+    print(f"{'Module':<42}{'median ms':>10}{'budget':>8}")
+    for module in args.modules or IMPORT_BUDGETS_MS:
+        times = [import_time_ms(module) for _ in range(args.runs)]
+        if any(t is None for t in times):
+            over_budget.append(module)
+            continue
+        median = statistics.median(times)
+        budget = IMPORT_BUDGETS_MS.get(module)
+        limit = budget * args.scale if budget is not None else None
+        flag = "  OVER BUDGET" if limit is not None and median > limit else ""
+        if flag:
+            over_budget.append(module)
+        print(f"{module:<42}{median:>10.1f}{limit if limit is not None else '-':>8}{flag}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,396 @@
+"""
+Local stand-in for an Ollama server, for load-testing the pipeline without a GPU.
+
+Implements the parts of the Ollama HTTP API the pipeline uses (POST /api/generate,
+streamed as NDJSON or, with "stream": false, as one JSON object; GET /api/tags,
+/api/version) and simulates how a model server behaves under load:
+- prefill: each request first holds its slot for --prefill-ms per prompt token
+  (prompt tokens are estimated as characters / --chars-per-token);
+- decode: the response is streamed token by token at --tokens-per-second per slot;
+- slots: at most --parallel requests are served at a time (OLLAMA_NUM_PARALLEL); the
+  others wait in a queue of at most --max-queue, beyond which requests are rejected
+  with 503 (as Ollama does with OLLAMA_MAX_QUEUE);
+- errors: --error-rate of the requests fail, with a 500, a 503 or a connection dropped
+  in the middle of the stream (--error-mode), drawn from a seeded RNG.
+
+Responses come from --script (a JSON list or JSONL file of rules, first match wins):
+    {"match": "Left Ventricle", "model": "llama3:8b", "response": "...",
+     "status": 500, "delay": 2.0}
+where "match" is a regex searched in the prompt, "model" restricts the rule to a model,
+"response" is a string or a list of strings (cycled per rule), and the optional "status"
+makes the rule fail with that HTTP status and "delay" adds seconds before the answer.
+Prompts no rule matches are answered like the real prompts expect: extraction prompts
+with a canned output for the component named in the prompt (see
+bench_pipeline.canned_outputs; --invalid-rate and --malformed-rate mix in outputs that
+fail validation or parsing), feedback prompts with a short feedback text.
+
+GET /sim/stats returns the counters (requests, rejections, errors, queue and latency
+figures), which are also printed on shutdown. Several instances on different ports
+stand in for several endpoints.
+
+Usage:
+    python benchmarks/ollama_simulator.py [--port 11434] [--parallel 4] [--max-queue 64]
+        [--tokens-per-second 30] [--prefill-ms 0.5] [--error-rate 0.02] [--script rules.jsonl]
+    OLLAMA_BASE_URL=http://127.0.0.1:11434 python main.py
+"""
+import os
+import re
+import sys
+import json
+import time
+import random
+import signal
+import argparse
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_EXTRACTION_RE = re.compile(r"extracting data for the (\w+) component")
+_FEEDBACK_MARKER = "You are a feedback agent"
+FEEDBACK_TEXT = "- The previous output was rejected. Output only the JSON object and use the allowed values listed in the schema."
+
+
+#------------------------------------------------------------------------------
+# Responses
+#------------------------------------------------------------------------------
+def load_script(path: str) -> List[Dict[str, Any]]:
+    """Scripted rules from a JSON list or a JSONL file (one rule per line)."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        rules = json.loads(text)
+    else:
+        rules = [json.loads(line) for line in text.splitlines() if line.strip()]
+    for rule in rules:
+        rule["_pattern"] = re.compile(rule.get("match", ""))
+        if isinstance(rule.get("response"), str):
+            rule["response"] = [rule["response"]]
+        rule["_next"] = 0
+    return rules
+
+
+class Responder:
+    """Picks the response (or scripted failure) to a prompt."""
+    def __init__(self, rules: List[Dict[str, Any]], seed: int, invalid_rate: float, malformed_rate: float, list_items: int):
+        self.rules = rules
+        self.invalid_rate = invalid_rate
+        self.malformed_rate = malformed_rate
+        self.list_items = list_items
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._outputs: Optional[Dict[str, Dict[str, List[str]]]] = None
+        self._seed = seed
+
+    def _canned(self) -> Dict[str, Dict[str, List[str]]]:
+        # Built on first use: it imports the pipeline, which scripted-only runs do not need
+        if self._outputs is None:
+            from bench_pipeline import COMPONENTS, canned_outputs
+            rng = random.Random(self._seed)
+            self._outputs = {model.__name__: canned_outputs(model, rng, self.list_items) for model in COMPONENTS}
+        return self._outputs
+
+    def respond(self, model: str, prompt: str) -> Tuple[str, Optional[int], float]:
+        """(response text, HTTP status to fail with or None, extra delay in seconds)."""
+        for rule in self.rules:
+            if rule.get("model") not in (None, model) or not rule["_pattern"].search(prompt):
+                continue
+            with self._lock:
+                responses = rule.get("response") or [""]
+                text = responses[rule["_next"] % len(responses)]
+                rule["_next"] += 1
+            return text, rule.get("status"), float(rule.get("delay", 0))
+
+        if _FEEDBACK_MARKER in prompt:
+            return FEEDBACK_TEXT, None, 0.0
+        match = _EXTRACTION_RE.search(prompt)
+        outputs = self._canned().get(match.group(1)) if match else None
+        if outputs is None:
+            return "{}", None, 0.0
+        with self._lock:
+            roll = self._rng.random()
+            kind = "malformed" if roll < self.malformed_rate else "invalid" if roll < self.malformed_rate + self.invalid_rate else "valid"
+            return self._rng.choice(outputs[kind]), None, 0.0
+
+
+#------------------------------------------------------------------------------
+# Simulated server
+#------------------------------------------------------------------------------
+class Simulator:
+    """Slots, queue, timing and error injection shared by the request handlers."""
+    def __init__(self, args: argparse.Namespace, responder: Responder):
+        self.args = args
+        self.responder = responder
+        self._rng = random.Random(args.seed + 1)
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._next_ticket = 0
+        self._serving = 0
+        self.waiting = 0
+        self.active = 0
+        self.stats: Dict[str, Any] = {
+            "requests": 0, "completed": 0, "rejected": 0, "errors": 0, "dropped": 0,
+            "prompt_tokens": 0, "output_tokens": 0, "max_waiting": 0, "max_active": 0,
+            "queue_seconds": 0.0, "busy_seconds": 0.0, "models": {},
+        }
+        self.started = time.time()
+
+    def count_tokens(self, text: str) -> int:
+        return max(1, round(len(text) / self.args.chars_per_token)) if text else 0
+
+    def tokens(self, text: str) -> List[str]:
+        """The response split into simulated tokens of about --chars-per-token characters."""
+        step = max(1, round(self.args.chars_per_token))
+        return [text[i:i + step] for i in range(0, len(text), step)]
+
+    def enqueue(self) -> bool:
+        """Takes a slot, waiting in the queue (first come, first served); False if the queue is full."""
+        with self._cond:
+            self.stats["requests"] += 1
+            if self.active >= self.args.parallel or self.waiting:
+                if self.waiting >= self.args.max_queue:
+                    self.stats["rejected"] += 1
+                    return False
+                ticket = self._next_ticket
+                self._next_ticket += 1
+                self.waiting += 1
+                self.stats["max_waiting"] = max(self.stats["max_waiting"], self.waiting)
+                start = time.perf_counter()
+                while self.active >= self.args.parallel or ticket != self._serving:
+                    self._cond.wait()
+                self._serving += 1
+                self.waiting -= 1
+                self.stats["queue_seconds"] += time.perf_counter() - start
+                self._cond.notify_all()
+            self.active += 1
+            self.stats["max_active"] = max(self.stats["max_active"], self.active)
+        return True
+
+    def release(self, busy_seconds: float) -> None:
+        with self._cond:
+            self.active -= 1
+            self.stats["busy_seconds"] += busy_seconds
+            self._cond.notify_all()
+
+    def injected_error(self, tokens: int) -> Tuple[Optional[str], Optional[int]]:
+        """
+        The failure to inject per --error-rate and --error-mode: ('500'/'503', None),
+        ('drop', number of tokens sent before the connection is dropped) or (None, None).
+        """
+        with self._cond:
+            if self._rng.random() >= self.args.error_rate:
+                return None, None
+            mode = self._rng.choice(self.args.error_mode.split(","))
+            return mode, self._rng.randrange(tokens + 1) if mode == "drop" else None
+
+    def record(self, model: str, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+            per_model = self.stats["models"].setdefault(model, {"completed": 0, "errors": 0, "prompt_tokens": 0, "output_tokens": 0})
+            if key in per_model:
+                per_model[key] += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = json.loads(json.dumps(self.stats))
+            stats.update(waiting=self.waiting, active=self.active, uptime_seconds=round(time.time() - self.started, 3))
+        return stats
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class OllamaHandler(BaseHTTPRequestHandler):
+    server_version = "OllamaSimulator/0.1"
+    protocol_version = "HTTP/1.1"
+    sim: Simulator = None  # set by serve()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.sim.args.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == "/api/version":
+            self._send_json(200, {"version": "0.0.0-simulator"})
+        elif self.path == "/api/tags":
+            models = self.sim.args.models.split(",") if self.sim.args.models else sorted(self.sim.stats["models"])
+            self._send_json(200, {"models": [{"name": name, "model": name, "modified_at": _timestamp(), "size": 0} for name in models]})
+        elif self.path == "/sim/stats":
+            self._send_json(200, self.sim.snapshot())
+        elif self.path == "/":
+            body = b"Ollama is running"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if self.path != "/api/generate":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._send_json(400, {"error": f"invalid request body: {e}"})
+            return
+        model = request.get("model") or ""
+        if self.sim.args.models and model not in self.sim.args.models.split(","):
+            self._send_json(404, {"error": f"model '{model}' not found, try pulling it first"})
+            return
+        prompt = request.get("prompt") or ""
+        if request.get("system"):
+            prompt = f"{request['system']}\n{prompt}"
+        self.generate(model, prompt, request.get("stream", True) is not False)
+
+    def generate(self, model: str, prompt: str, stream: bool) -> None:
+        sim = self.sim
+        if not sim.enqueue():
+            self._send_json(503, {"error": "server busy, please try again.  maximum pending requests exceeded"})
+            return
+        start = time.perf_counter()
+        try:
+            text, status, delay = sim.responder.respond(model, prompt)
+            tokens = sim.tokens(text)
+            error, drop_at = (str(status), None) if status else sim.injected_error(len(tokens))
+            prompt_tokens = sim.count_tokens(prompt)
+            prefill = prompt_tokens * sim.args.prefill_ms / 1000 + delay
+            time.sleep(prefill)
+            if error and error != "drop":
+                sim.record(model, "errors")
+                self._send_json(int(error), {"error": f"simulated error {error}"})
+                return
+            sim.record(model, "prompt_tokens", prompt_tokens)
+
+            per_token = 1 / sim.args.tokens_per_second if sim.args.tokens_per_second > 0 else 0
+            if not stream:
+                time.sleep(per_token * len(tokens))
+                if drop_at is not None:
+                    sim.record(model, "dropped")
+                    self.close_connection = True
+                    return
+                body = {"model": model, "created_at": _timestamp(), "response": text, "done": True}
+                body.update(self._final_info(prompt_tokens, len(tokens), prefill, per_token * len(tokens), start))
+                self._send_json(200, body)
+            else:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                decode_start = time.perf_counter()
+                for i, token in enumerate(tokens):
+                    if i == drop_at:
+                        sim.record(model, "dropped")
+                        self.close_connection = True
+                        return
+                    time.sleep(per_token)
+                    self._write_chunk({"model": model, "created_at": _timestamp(), "response": token, "done": False})
+                if drop_at == len(tokens):
+                    sim.record(model, "dropped")
+                    self.close_connection = True
+                    return
+                final = {"model": model, "created_at": _timestamp(), "response": "", "done": True}
+                final.update(self._final_info(prompt_tokens, len(tokens), prefill, time.perf_counter() - decode_start, start))
+                self._write_chunk(final)
+                self.wfile.write(b"0\r\n\r\n")
+            sim.record(model, "output_tokens", len(tokens))
+            sim.record(model, "completed")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        finally:
+            sim.release(time.perf_counter() - start)
+
+    def _write_chunk(self, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8") + b"\n"
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    @staticmethod
+    def _final_info(prompt_tokens: int, output_tokens: int, prefill: float, decode: float, start: float) -> Dict[str, Any]:
+        # Durations in nanoseconds, as Ollama reports them
+        return {
+            "done_reason": "stop",
+            "context": [],
+            "total_duration": int((time.perf_counter() - start) * 1e9),
+            "load_duration": 0,
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": int(prefill * 1e9),
+            "eval_count": output_tokens,
+            "eval_duration": int(decode * 1e9),
+        }
+
+
+def serve(args: argparse.Namespace) -> Simulator:
+    """Starts the server in a background thread and returns its simulator (`.server` is the HTTP server)."""
+    rules = load_script(args.script) if args.script else []
+    responder = Responder(rules, args.seed, args.invalid_rate, args.malformed_rate, args.list_items)
+    sim = Simulator(args, responder)
+    handler = type("Handler", (OllamaHandler,), {"sim": sim})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    # Enough backlog for every queued request, so the simulator (not the OS) decides what is rejected
+    server.request_queue_size = args.parallel + args.max_queue + 16
+    sim.server = server
+    threading.Thread(target=server.serve_forever, name="ollama-simulator", daemon=True).start()
+    return sim
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local Ollama-compatible server simulating a model under load.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=11434, help="Port to listen on (0 = any free port).")
+    parser.add_argument("--parallel", type=int, default=4, help="Requests served at a time (slots).")
+    parser.add_argument("--max-queue", type=int, default=64, help="Requests that may wait for a slot; more are rejected with 503.")
+    parser.add_argument("--tokens-per-second", type=float, default=30.0, help="Decode speed of each slot (0 = instant).")
+    parser.add_argument("--prefill-ms", type=float, default=0.5, help="Prefill cost per prompt token, in milliseconds.")
+    parser.add_argument("--chars-per-token", type=float, default=4.0, help="Characters per simulated token.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests that fail.")
+    parser.add_argument("--error-mode", default="500", help="Comma-separated failures to draw from: 500, 503, drop.")
+    parser.add_argument("--script", help="JSON or JSONL file of scripted responses (see the module docstring).")
+    parser.add_argument("--models", default="", help="Comma-separated models to serve (others get 404); default: any.")
+    parser.add_argument("--invalid-rate", type=float, default=0.0, help="Share of unscripted extraction answers that fail validation.")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Share of unscripted extraction answers that are not JSON.")
+    parser.add_argument("--list-items", type=int, default=3, help="Items in each list-of-model field of the canned outputs.")
+    parser.add_argument("--seed", type=int, default=11, help="Seed of the canned outputs and the error injection.")
+    parser.add_argument("--verbose", action="store_true", help="Log every HTTP request.")
+    return parser.parse_args(argv)
+
+
+def main_simulator() -> int:
+    args = parse_args()
+    sim = serve(args)
+    host, port = sim.server.server_address[:2]
+    print(f"Ollama simulator listening on http://{host}:{port} "
+          f"({args.parallel} slots, queue {args.max_queue}, {args.tokens_per_second:g} tokens/s, "
+          f"{args.prefill_ms:g} ms/prompt token, error rate {args.error_rate:g})")
+    print(f"Point the pipeline at it with OLLAMA_BASE_URL=http://{host}:{port}")
+    # Stop (and print the stats) on SIGTERM as on Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.server.shutdown()
+        print(json.dumps(sim.snapshot(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_simulator())
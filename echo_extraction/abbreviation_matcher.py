@@ -0,0 +1,224 @@
+import re
+import json
+import hashlib
+import logging
+from typing import Dict, List, Optional, Pattern, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def _trie_regex(node: Dict[str, dict]) -> str:
+    """Builds a regex from a character trie. Greedy optional groups make it prefer the longest key."""
+    branches = [re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        body = "(?:" + body + ")?"
+    return body
+
+
+class _CompiledAbbreviationSet:
+    """
+    One group of abbreviations (dashed or standard), compiled for repeated use.
+
+    Replacement reproduces the original sequential algorithm exactly: every
+    abbreviation is applied in longest-first order with a case-insensitive,
+    word-bounded substitution, so an expansion can still be picked up by a shorter
+    abbreviation later in the order. The speed-up comes from skipping abbreviations
+    that cannot occur: a single scan with a trie regex finds, at every position, the
+    longest abbreviation starting there, and every abbreviation that is a prefix of
+    it is a candidate too. Only candidates are substituted, and after a substitution
+    only the text around the inserted expansions is rescanned.
+    """
+
+    def __init__(self, abbrev_map: Dict[str, str]):
+        # Same order as the original implementation: stable sort by descending length
+        self.keys: List[str] = sorted(abbrev_map.keys(), key=lambda x: -len(x))
+        self.expansions: List[str] = [abbrev_map[k] for k in self.keys]
+        self._patterns: List[Optional[Pattern]] = [None] * len(self.keys)
+        self._max_len: int = max((len(k) for k in self.keys), default=0)
+
+        # Keys with non-ASCII characters can match in ways str.lower() does not model
+        # (e.g. the Kelvin sign under IGNORECASE), so they are always candidates, as is
+        # an empty key (which matches at every word boundary).
+        self._always: List[int] = [i for i, k in enumerate(self.keys) if not k or not k.isascii()]
+
+        indices_by_key: Dict[str, List[int]] = {}
+        for i, key in enumerate(self.keys):
+            if key.isascii() and key:
+                indices_by_key.setdefault(key.lower(), []).append(i)
+
+        # Every key that is a prefix of a longer key is a candidate wherever the longer one starts
+        self._prefix_indices: Dict[str, Tuple[int, ...]] = {}
+        for key in indices_by_key:
+            found = []
+            for length in range(1, len(key) + 1):
+                found.extend(indices_by_key.get(key[:length], ()))
+            self._prefix_indices[key] = tuple(found)
+
+        trie: Dict[str, dict] = {}
+        for key in indices_by_key:
+            node = trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        # Compiled on first use, so a matcher loaded from a compiled artifact is ready immediately
+        self._scanner_source: Optional[str] = f"(?=({_trie_regex(trie)}))" if trie else None
+        self._compiled_scanner: Optional[Pattern] = None
+
+    def __getstate__(self) -> dict:
+        # Compiled patterns are rebuilt lazily after unpickling instead of being re-parsed on load
+        state = self.__dict__.copy()
+        state['_patterns'] = [None] * len(self.keys)
+        state['_compiled_scanner'] = None
+        return state
+
+    @property
+    def _scanner(self) -> Optional[Pattern]:
+        if self._compiled_scanner is None and self._scanner_source is not None:
+            self._compiled_scanner = re.compile(self._scanner_source)
+        return self._compiled_scanner
+
+    def _pattern(self, idx: int) -> Pattern:
+        """Returns the word-bounded pattern for one abbreviation, compiling it on first use."""
+        pattern = self._patterns[idx]
+        if pattern is None:
+            pattern = re.compile(rf'\b{re.escape(self.keys[idx])}\b', re.IGNORECASE)
+            self._patterns[idx] = pattern
+        return pattern
+
+    def _candidates(self, text: str, after: int = -1) -> List[int]:
+        """Indices (in processing order, greater than `after`) of the abbreviations that may occur in `text`."""
+        if not text.isascii():
+            # str.lower() and IGNORECASE differ for some non-ASCII characters: try everything
+            return list(range(after + 1, len(self.keys)))
+        found = set(self._always)
+        if self._scanner is not None:
+            for longest in set(self._scanner.findall(text.lower())):
+                found.update(self._prefix_indices[longest])
+        return sorted(i for i in found if i > after)
+
+    def _window_candidates(self, text: str, windows: List[Tuple[int, int]], after: int) -> Set[int]:
+        """
+        Candidates (greater than `after`) among abbreviations overlapping the given spans
+        of `text`. Only text within one key length of a span needs to be rescanned.
+        """
+        if not text.isascii():
+            return set(range(after + 1, len(self.keys)))
+        found: Set[int] = set()
+        if self._scanner is None:
+            return found
+        reach = self._max_len - 1
+        for start, end in windows:
+            window = text[max(0, start - reach):end + reach].lower()
+            for longest in set(self._scanner.findall(window)):
+                found.update(i for i in self._prefix_indices[longest] if i > after)
+        return found
+
+    def replace(self, text: str) -> str:
+        """Replaces every abbreviation of this group in `text`."""
+        if not self.keys or not text:
+            return text
+        pending = self._candidates(text)
+        j = 0
+        while j < len(pending):
+            idx = pending[j]
+            j += 1
+            pattern = self._pattern(idx)
+            expansion = self.expansions[idx]
+            if '\\' in expansion:
+                # Template replacement: let re expand it, then rescan the whole text
+                text, count = pattern.subn(expansion, text)
+                if count:
+                    pending = self._candidates(text, after=idx)
+                    j = 0
+                continue
+            matches = list(pattern.finditer(text))
+            if not matches:
+                continue
+            # Same result as pattern.sub, but keeping track of where the expansions landed
+            pieces = []
+            windows = []
+            last = 0
+            shift = 0
+            for m in matches:
+                pieces.append(text[last:m.start()])
+                pieces.append(expansion)
+                new_start = m.start() + shift
+                windows.append((new_start, new_start + len(expansion)))
+                shift += len(expansion) - (m.end() - m.start())
+                last = m.end()
+            pieces.append(text[last:])
+            text = "".join(pieces)
+            # The expansion may introduce abbreviations that come later in the order
+            pending = sorted(set(pending[j:]) | self._window_candidates(text, windows, after=idx))
+            j = 0
+        return text
+
+
+class AbbreviationMatcher:
+    """
+    Abbreviation replacer compiled once per dictionary.
+
+    Splits the dictionary into dash-connected and standard abbreviations (the two
+    pipeline steps) and produces exactly the same output as applying one regex per
+    dictionary entry, without compiling or running patterns for entries that cannot
+    occur in the text.
+    """
+
+    def __init__(self, abbrev_map: Dict[str, str]):
+        self.abbreviations: Dict[str, str] = dict(abbrev_map)
+        self.version: str = hashlib.sha256(
+            json.dumps(sorted(self.abbreviations.items()), ensure_ascii=False).encode('utf-8')
+        ).hexdigest()[:16]
+        self._dashed = _CompiledAbbreviationSet({k: v for k, v in self.abbreviations.items() if '-' in k})
+        self._standard = _CompiledAbbreviationSet({k: v for k, v in self.abbreviations.items() if '-' not in k})
+
+    def __len__(self) -> int:
+        return len(self.abbreviations)
+
+    def __bool__(self) -> bool:
+        return bool(self.abbreviations)
+
+    def replace_dashed(self, text: str) -> str:
+        """Replaces dash-connected abbreviations (pipeline step 1), line by line."""
+        if '\n' not in text:
+            return self._dashed.replace(text)
+        return '\n'.join(self._dashed.replace(line) for line in text.split('\n'))
+
+    def replace_standard(self, text: str) -> str:
+        """Replaces abbreviations without dashes (pipeline step 5), line by line."""
+        if '\n' not in text:
+            return self._standard.replace(text)
+        return '\n'.join(self._standard.replace(line) for line in text.split('\n'))
+
+
+# Matchers already built, keyed by id() of the dictionary they were built from
+_matcher_cache: Dict[int, Tuple[Dict[str, str], int, AbbreviationMatcher]] = {}
+
+
+def get_abbreviation_matcher(abbrev_map: Union[Dict[str, str], AbbreviationMatcher]) -> AbbreviationMatcher:
+    """
+    Returns the compiled matcher for a dictionary, building it on first use.
+    Dictionaries are treated as immutable once loaded; a change in size triggers a rebuild.
+    """
+    if isinstance(abbrev_map, AbbreviationMatcher):
+        return abbrev_map
+    cached = _matcher_cache.get(id(abbrev_map))
+    if cached is not None and cached[0] is abbrev_map and cached[1] == len(abbrev_map):
+        return cached[2]
+    matcher = register_abbreviation_matcher(AbbreviationMatcher(abbrev_map))
+    logger.debug("Compiled abbreviation matcher for %d entries (version %s).", len(matcher), matcher.version)
+    return matcher
+
+
+def register_abbreviation_matcher(matcher: AbbreviationMatcher) -> AbbreviationMatcher:
+    """
+    Registers a matcher built elsewhere (e.g. loaded from a compiled artifact) so that
+    passing its `abbreviations` dictionary to get_abbreviation_matcher reuses it.
+    """
+    if len(_matcher_cache) >= 8:
+        _matcher_cache.clear()
+    _matcher_cache[id(matcher.abbreviations)] = (matcher.abbreviations, len(matcher.abbreviations), matcher)
+    return matcher
@@ -1,7 +1,13 @@
-import pandas as pd
+import os
 import re
+import pickle
+import hashlib
 import logging
-from typing import Dict, Union 
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from .abbreviation_matcher import AbbreviationMatcher, get_abbreviation_matcher, register_abbreviation_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,7 @@ def load_abbreviation_dictionary(csv_path: str) -> Dict[str, str]:
     """
     abbrev_dict: Dict[str, str] = {}
     try:
+        import pandas as pd # Only needed when the CSV is (re)parsed, see load_abbreviation_matcher
         df = pd.read_csv(csv_path, encoding="ISO-8859-1")
         abbrev_dict = {
             str(row['Abbreviation']).strip().lower(): str(row['FullForm']).strip()
@@ -31,29 +38,100 @@ def load_abbreviation_dictionary(csv_path: str) -> Dict[str, str]:
         logger.error(f"Error loading abbreviation dictionary from {csv_path}: {e}. Abbreviation replacement may be incomplete.")
     return abbrev_dict
 
+#--------------------------------------------------------------------------
+# Compiled dictionary artifact
+#--------------------------------------------------------------------------
+# Bump when the pickled matcher layout changes, so stale artifacts are rebuilt
+_ARTIFACT_FORMAT = 1
+_ARTIFACT_SUFFIX = ".compiled.pkl"
 
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _read_artifact(artifact_path: str) -> Union[dict, None]:
+    """Returns the artifact contents, or None if it is missing, unreadable or of another format."""
+    if not os.path.isfile(artifact_path):
+        return None
+    try:
+        with open(artifact_path, 'rb') as f:
+            artifact = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Could not read compiled abbreviation dictionary {artifact_path}: {e}. It will be rebuilt.")
+        return None
+    if not isinstance(artifact, dict) or artifact.get('format') != _ARTIFACT_FORMAT:
+        return None
+    return artifact
+
+def _write_artifact(artifact_path: str, artifact: dict) -> None:
+    """Atomically writes the artifact; failure (e.g. a read-only directory) only costs the next start-up."""
+    tmp_path = f"{artifact_path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, artifact_path)
+    except Exception as e:
+        logger.warning(f"Could not write compiled abbreviation dictionary {artifact_path}: {e}")
+
+def load_abbreviation_matcher(csv_path: str, artifact_path: Optional[str] = None) -> AbbreviationMatcher:
+    """
+    Loads the compiled abbreviation matcher for a CSV, using a compiled artifact stored
+    next to it (`<csv_path>.compiled.pkl`) so the CSV is only parsed when it changes.
+
+    The artifact is used as-is when the CSV's size and modification time are unchanged.
+    Otherwise the CSV's SHA-256 is compared with the one the artifact was built from,
+    and only a different hash triggers parsing the CSV (with pandas) and rebuilding.
+
+    Args:
+        csv_path: the CSV file containing abbreviations and full forms.
+        artifact_path: where the compiled artifact is kept (defaults to next to the CSV).
+
+    Returns:
+        The compiled matcher; it is empty if the CSV cannot be loaded.
+    """
+    artifact_path = artifact_path or csv_path + _ARTIFACT_SUFFIX
+    try:
+        stat = os.stat(csv_path)
+    except FileNotFoundError:
+        logger.error(f"Abbreviation CSV file not found at {csv_path}. Abbreviation replacement will be skipped.")
+        return AbbreviationMatcher({})
+
+    artifact = _read_artifact(artifact_path)
+    if artifact is not None:
+        source = artifact['source']
+        if source['size'] == stat.st_size and source['mtime_ns'] == stat.st_mtime_ns:
+            logger.info(f"Abbreviation dictionary loaded from compiled artifact {artifact_path}.")
+            return register_abbreviation_matcher(artifact['matcher'])
+        sha256 = _file_sha256(csv_path)
+        if source['sha256'] == sha256:
+            # Touched but unchanged: refresh the recorded stat so the next start-up skips hashing
+            artifact['source'] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+            _write_artifact(artifact_path, artifact)
+            logger.info(f"Abbreviation dictionary loaded from compiled artifact {artifact_path}.")
+            return register_abbreviation_matcher(artifact['matcher'])
+    else:
+        sha256 = _file_sha256(csv_path)
+
+    abbrev_dict = load_abbreviation_dictionary(csv_path)
+    matcher = register_abbreviation_matcher(AbbreviationMatcher(abbrev_dict))
+    if abbrev_dict:
+        _write_artifact(artifact_path, {
+            'format': _ARTIFACT_FORMAT,
+            'source': {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256},
+            'matcher': matcher,
+        })
+        logger.info(f"Compiled abbreviation dictionary written to {artifact_path}.")
+    return matcher
 
 
 # Step 1: Replace dash-connected abbreviations BEFORE punctuation spacing
-def replace_dashed_abbreviations(text: str, abbrev_map: dict) -> str:
+def replace_dashed_abbreviations(text: str, abbrev_map: Union[Dict[str, str], AbbreviationMatcher]) -> str:
     """Replaces dash-connected abbreviations in text while preserving line breaks."""
-    dashed_abbrevs = {k: v for k, v in abbrev_map.items() if '-' in k}
-    
-    
-    # Split by newlines to preserve them
-    lines = text.split('\n')
-    processed_lines = []
-    
-    for line in lines:
-        # Sort by length descending to handle longer abbreviations first
-        for abbr in sorted(dashed_abbrevs.keys(), key=lambda x: -len(x)):
-            # Use word boundaries to ensure whole word match
-            pattern = re.compile(rf'\b{re.escape(abbr)}\b', re.IGNORECASE)
-            line = pattern.sub(dashed_abbrevs[abbr], line)
-        processed_lines.append(line)
-    
-    # Join the lines back with newlines
-    return '\n'.join(processed_lines)
+    # The compiled matcher is built once per dictionary and works line by line
+    return get_abbreviation_matcher(abbrev_map).replace_dashed(text)
 
 # Step 2: Normalize punctuation spacing (but keep internal dashes)
 def normalize_text_spacing(text: str) -> str:
@@ -108,32 +186,152 @@ def add_space_between_number_and_word(text: str) -> str:
     return '\n'.join(processed_lines)
 
 # Step 5: Replace regular abbreviations after spacing
-def replace_standard_abbreviations(text: str, abbrev_map: dict) -> str:
+def replace_standard_abbreviations(text: str, abbrev_map: Union[Dict[str, str], AbbreviationMatcher]) -> str:
     """Replaces standard abbreviations in text while preserving line breaks."""
-    regular_abbrevs = {k: v for k, v in abbrev_map.items() if '-' not in k}
-    
-    # Split by newlines to preserve them
+    # The compiled matcher is built once per dictionary and works line by line
+    return get_abbreviation_matcher(abbrev_map).replace_standard(text)
+
+#--------------------------------------------------------------------------
+# Fused pipeline
+#--------------------------------------------------------------------------
+# Whole-text equivalents of steps 2-4 and the final cleanup. They run once over the
+# full report instead of once per line and step: '[^\S\n]' stands for the per-line
+# '\s', and MULTILINE anchors stand for the per-line strip().
+# Step 2, punctuation and free-standing dashes in one pass (the spaces added around
+# punctuation never change what the dash lookarounds see)
+_PUNCTUATION_OR_DASH_RE = re.compile(r'([.,!?;:()=+&{}\[\]])|(?<!\w)(-)(?!\w)')
+# Collapse runs of spaces (group 1 keeps one) and strip each line (group 1 unmatched)
+_SPACE_RUNS_AND_LINE_EDGES_RE = re.compile(r'^[^\S\n]+|[^\S\n]+$|( ) +', re.MULTILINE)
+# Step 3
+_NUMERIC_DOT_RE = re.compile(r'(\d)[^\S\n]*\.[^\S\n]*(\d)')
+# Step 4, both directions in one pass: every digit/letter boundary gets a space
+_NUMBER_WORD_BOUNDARY_RE = re.compile(r'(?<=\d)(?=[A-Za-z])|(?<=[A-Za-z])(?=\d)')
+
+
+def _normalize_text(text: str, matcher: AbbreviationMatcher) -> str:
+    """Runs the full pipeline over `text` (literal '\\n' already converted). Same output as the per-line steps."""
+    text = matcher.replace_dashed(text)
+    text = _PUNCTUATION_OR_DASH_RE.sub(r' \1\2 ', text)
+    text = _SPACE_RUNS_AND_LINE_EDGES_RE.sub(r'\1', text)
+    text = _NUMERIC_DOT_RE.sub(r'\1.\2', text)
+    text = _NUMBER_WORD_BOUNDARY_RE.sub(' ', text)
+    text = matcher.replace_standard(text)
+    return _SPACE_RUNS_AND_LINE_EDGES_RE.sub(r'\1', text)
+
+#--------------------------------------------------------------------------
+# Line cache
+#--------------------------------------------------------------------------
+class LineCache:
+    """
+    Bounded LRU cache of processed lines, keyed on (dictionary version, raw line).
+
+    Every pipeline step is line-local, so a line always produces the same output for
+    a given dictionary. Templated reports repeat many lines verbatim; those skip the
+    pipeline entirely.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, version: str, lines: List[str]) -> List[Optional[str]]:
+        """Looks up lines, returning None for misses."""
+        found: List[Optional[str]] = []
+        with self._lock:
+            for line in lines:
+                key = (version, line)
+                output = self._entries.get(key)
+                if output is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                found.append(output)
+        return found
+
+    def put_many(self, version: str, lines: List[str], outputs: List[str]) -> None:
+        """Stores processed lines, evicting the least recently used entries beyond `maxsize`."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            for line, output in zip(lines, outputs):
+                self._entries[(version, line)] = output
+                self._entries.move_to_end((version, line))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def snapshot(self, version: str) -> Dict[str, str]:
+        """Entries for one dictionary version, used to seed batch worker processes."""
+        with self._lock:
+            return {line: output for (v, line), output in self._entries.items() if v == version}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Shared by all reports processed in this process (0 disables it)
+_line_cache = LineCache(int(os.getenv("ABBREVIATION_LINE_CACHE_SIZE", "20000")))
+
+def get_line_cache_stats() -> Dict[str, Any]:
+    """Returns hits, misses, hit rate and size of the line cache."""
+    return _line_cache.stats()
+
+def clear_line_cache() -> None:
+    """Empties the line cache and resets its statistics."""
+    _line_cache.clear()
+
+def _normalize_text_cached(text: str, matcher: AbbreviationMatcher, cache: LineCache) -> str:
+    """_normalize_text with cached lines served from `cache`; the missing lines are processed in one fused pass."""
+    if cache.maxsize <= 0:
+        return _normalize_text(text, matcher)
     lines = text.split('\n')
-    processed_lines = []
-    
-    for line in lines:
-        # Sort by length descending to handle longer abbreviations first
-        for abbr in sorted(regular_abbrevs.keys(), key=lambda x: -len(x)):
-            # Use word boundaries to ensure whole word match
-            pattern = re.compile(rf'\b{re.escape(abbr)}\b', re.IGNORECASE)
-            line = pattern.sub(regular_abbrevs[abbr], line)
-        processed_lines.append(line)
-    
-    # Join the lines back with newlines
-    return '\n'.join(processed_lines)
+    outputs = cache.get_many(matcher.version, lines)
+    missing = list(dict.fromkeys(line for line, output in zip(lines, outputs) if output is None))
+    if missing:
+        computed = _normalize_text('\n'.join(missing), matcher).split('\n')
+        if len(computed) != len(missing):
+            # An expansion contains a line break, so lines cannot be told apart: process uncached
+            return _normalize_text(text, matcher)
+        cache.put_many(matcher.version, missing, computed)
+        by_line = dict(zip(missing, computed))
+        outputs = [by_line[line] if output is None else output for line, output in zip(lines, outputs)]
+    return '\n'.join(outputs)
 
-def process_abbreviations(text: str, abbrev_map: Dict[str, str]) -> str:
+def _cache_outputs(cache: LineCache, version: str, text: str, output: str) -> None:
+    """Adds the lines of a text processed elsewhere (a batch worker) to `cache`."""
+    lines = text.split('\n')
+    output_lines = output.split('\n')
+    if len(lines) == len(output_lines):
+        cache.put_many(version, lines, output_lines)
+
+def process_abbreviations(text: str, abbrev_map: Union[Dict[str, str], AbbreviationMatcher]) -> str:
     """
     Applies the full abbreviation replacement pipeline to the input text.
 
+    The steps above are fused: each one runs once over the whole text (line breaks
+    are preserved and never crossed), giving the same output as applying them line
+    by line.
+
     Args:
         text: The input text with potential abbreviations.
-        abbrev_map: The dictionary mapping abbreviations to full forms.
+        abbrev_map: The dictionary mapping abbreviations to full forms, or its compiled matcher.
 
     Returns:
         The text with abbreviations replaced.
@@ -142,34 +340,66 @@ def process_abbreviations(text: str, abbrev_map: Dict[str, str]) -> str:
         logger.warning("Abbreviation map is empty. Skipping abbreviation processing.")
         return text # Return original text if map is empty
 
+    logger.info("Applying abbreviation replacement pipeline...")
     # Convert literal '\n' to actual newlines if they exist in the text
-    text = text.replace('\\n', '\n')
+    final_output = _normalize_text_cached(text.replace('\\n', '\n'), get_abbreviation_matcher(abbrev_map), _line_cache)
+    logger.info("Abbreviation replacement complete.")
+    return final_output
 
-    logger.info("Applying abbreviation replacement pipeline...")
-    
-    # Process each line separately to preserve newlines
-    lines = text.split('\n')
-    processed_lines = []
-    
-    for line in lines:
-        if line.strip():  # Skip empty lines
-            # Apply the pipeline to each line individually
-            step1_processed = replace_dashed_abbreviations(line, abbrev_map)
-            step2_processed = normalize_text_spacing(step1_processed)
-            step3_processed = remove_space_around_numeric_dots(step2_processed)
-            step4_processed = add_space_between_number_and_word(step3_processed)
-            line_output = replace_standard_abbreviations(step4_processed, abbrev_map)
-            
-            # Normalize whitespace for this line
-            processed_lines.append(re.sub(r' +', ' ', line_output).strip())
-        else:
-            processed_lines.append('')  # Keep empty lines
-    
-    # Join the processed lines with newlines
-    final_output = '\n'.join(processed_lines)
+# Matcher used by batch worker processes, set once per worker by the pool initializer
+_worker_matcher: Optional[AbbreviationMatcher] = None
+
+def _init_batch_worker(matcher: AbbreviationMatcher, cached_lines: Dict[str, str]) -> None:
+    global _worker_matcher
+    _worker_matcher = matcher
+    # Start from the parent's cache; lines the worker processes are merged back by the parent
+    _line_cache.clear()
+    _line_cache.put_many(matcher.version, list(cached_lines), list(cached_lines.values()))
+
+def _normalize_in_worker(text: str) -> str:
+    return _normalize_text_cached(text, _worker_matcher, _line_cache)
 
+def process_abbreviations_batch(
+    texts: Iterable[str],
+    abbrev_map: Union[Dict[str, str], AbbreviationMatcher],
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> List[str]:
+    """
+    Applies the abbreviation pipeline to many texts, e.g. for preprocessing jobs.
+
+    The matcher is compiled once for the whole batch. With `workers` > 1 the texts are
+    spread over a process pool: each worker receives the matcher and a copy of the
+    line cache once, and the lines the workers processed are added to this process's
+    cache afterwards. Otherwise the texts are processed in this process. Output order
+    matches input order.
+
+    Args:
+        texts: The input texts.
+        abbrev_map: The dictionary mapping abbreviations to full forms, or its compiled matcher.
+        workers: Number of worker processes (None or 1 processes serially).
+        chunksize: Texts handed to a worker at a time.
+
+    Returns:
+        The processed texts, in input order.
+    """
+    texts = list(texts)
+    if not abbrev_map:
+        logger.warning("Abbreviation map is empty. Skipping abbreviation processing.")
+        return texts
+    matcher = get_abbreviation_matcher(abbrev_map)
+    logger.info(f"Applying abbreviation replacement pipeline to {len(texts)} texts...")
+    texts = [text.replace('\\n', '\n') for text in texts]
+    if workers and workers > 1 and len(texts) > 1:
+        initargs = (matcher, _line_cache.snapshot(matcher.version))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker, initargs=initargs) as pool:
+            results = list(pool.map(_normalize_in_worker, texts, chunksize=chunksize))
+        for text, output in zip(texts, results):
+            _cache_outputs(_line_cache, matcher.version, text, output)
+    else:
+        results = [_normalize_text_cached(text, matcher, _line_cache) for text in texts]
     logger.info("Abbreviation replacement complete.")
-    return final_output
+    return results
 
 # Global variable to store the loaded dictionary
 _abbrev_dictionary: Union[Dict[str, str], None] = None
@@ -177,9 +407,11 @@ _abbrev_dictionary: Union[Dict[str, str], None] = None
 def get_abbreviation_dictionary(csv_path: str) -> Dict[str, str]:
     """
     Gets the loaded abbreviation dictionary, loading it if necessary.
-    Uses a global variable to avoid reloading the CSV multiple times.
+    Uses a global variable to avoid reloading the CSV multiple times. The dictionary
+    comes from the compiled artifact (see load_abbreviation_matcher), and its matcher
+    is already registered, so passing it to process_abbreviations compiles nothing.
     """
     global _abbrev_dictionary
     if _abbrev_dictionary is None:
-        _abbrev_dictionary = load_abbreviation_dictionary(csv_path)
+        _abbrev_dictionary = load_abbreviation_matcher(csv_path).abbreviations
     return _abbrev_dictionary
\ No newline at end of file
@@ -0,0 +1,96 @@
+import os
+import logging
+import threading
+from typing import Optional, Tuple
+
+from .abbreviation_matcher import AbbreviationMatcher
+from .abbreviation_processor import load_abbreviation_matcher
+
+logger = logging.getLogger(__name__)
+
+
+class AbbreviationDictionaryHolder:
+    """
+    Versioned, hot-reloadable holder of the compiled abbreviation matcher.
+
+    A background thread polls the CSV's size and modification time. When the file
+    changes, the new matcher is built in that thread (through the compiled artifact,
+    see load_abbreviation_matcher) and swapped in with a single reference assignment,
+    so in-flight processing is never paused. Callers take a snapshot with `current()`
+    once per report and use it for the whole report, which keeps each report on one
+    dictionary version. A CSV that fails to load leaves the current matcher in place.
+    """
+
+    def __init__(self, csv_path: str, poll_interval: float = 10.0):
+        """
+        Args:
+            csv_path: The abbreviation CSV to watch.
+            poll_interval: Seconds between checks of the CSV (0 or less disables watching).
+        """
+        self.csv_path = csv_path
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reload_lock = threading.Lock()
+        self._source_stat = self._stat()
+        self._matcher: AbbreviationMatcher = load_abbreviation_matcher(csv_path)
+        logger.info(f"Abbreviation dictionary version {self._matcher.version} ({len(self._matcher)} entries) in use.")
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def current(self) -> AbbreviationMatcher:
+        """Returns the matcher in use; hold on to it for the duration of one report."""
+        return self._matcher
+
+    @property
+    def version(self) -> str:
+        return self._matcher.version
+
+    def check_for_update(self) -> bool:
+        """
+        Reloads the dictionary if the CSV changed since the last check.
+
+        Returns:
+            True if a new dictionary version was swapped in.
+        """
+        with self._reload_lock:
+            stat = self._stat()
+            if stat is None or stat == self._source_stat:
+                return False
+            self._source_stat = stat
+            matcher = load_abbreviation_matcher(self.csv_path)
+            if not matcher:
+                logger.error(f"Reloaded abbreviation dictionary from {self.csv_path} is empty. Keeping version {self._matcher.version}.")
+                return False
+            if matcher.version == self._matcher.version:
+                return False
+            previous_version = self._matcher.version
+            self._matcher = matcher
+        logger.info(f"Abbreviation dictionary reloaded: version {previous_version} -> {matcher.version} ({len(matcher)} entries).")
+        return True
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.check_for_update()
+            except Exception as e:
+                logger.error(f"Error reloading abbreviation dictionary from {self.csv_path}: {e}")
+
+    def start(self) -> "AbbreviationDictionaryHolder":
+        """Starts watching the CSV in a daemon thread (no-op if watching is disabled or already running)."""
+        if self.poll_interval > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="abbreviation-reloader", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the watcher thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
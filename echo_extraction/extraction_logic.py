@@ -2,14 +2,21 @@
 
 import logging
 import json
+import contextvars
 import textwrap
 import os
-from typing import Dict, Any, Type, Union, List, Optional
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Type, Union, List, Optional, Tuple
 from pydantic import BaseModel, ValidationError, Field
-from .llm_setup import get_extraction_chain, get_feedback_chain, get_json_parser, is_langchain_available
-from .schema_helpers import format_validation_errors_for_agent, format_pydantic_errors_for_book 
-from .models import EchoReport
-from .llm_mapping_utils import remap_llm_keys
+from .llm_setup import get_extraction_chain, get_feedback_chain, get_escalation_chain, get_speculative_variants, is_langchain_available
+from .llm_setup import CancellationHandler
+from .llm_setup import USE_GENERATED_PROMPT_SCHEMAS, PROMPT_SCHEMA_DESCRIPTIONS
+from .prompt_schema import build_prompt_schema
+from .schema_helpers import format_validation_errors_for_agent, format_pydantic_errors_for_book, get_model_schema
+from .llm_mapping_utils import parse_component_output
+from .retry_policy import RetryPolicy, STATIC_FEEDBACK
 
 
 # Get a logger specific to this module
@@ -54,31 +61,106 @@ def generate_feedback(
         return f"An error occurred while generating specific feedback ({e}). Please ensure your output is ONLY valid JSON and strictly conforms to the schema."
 
 
-def extract_component_data(
+def _feedback_for_next_attempt(
+    retry_policy: Optional[RetryPolicy],
+    component_name: str,
+    attempt_num: int,
+    max_attempts: int,
+    error_type: str,
     report: str,
+    raw_llm_output: str,
+    error_details: Union[List[Dict[str, Any]], str],
+    full_echo_schema: Dict[str, Any]
+) -> Tuple[str, bool]:
+    """
+    Returns the feedback for the next attempt and whether it came from the feedback agent.
+    Without a retry policy the feedback agent is always called; with one, the call is
+    skipped after the last attempt and for error types where it historically did not help.
+    """
+    if retry_policy is not None and not retry_policy.should_generate_feedback(component_name, attempt_num, max_attempts, error_type):
+        return STATIC_FEEDBACK, False
+    start = time.perf_counter()
+    feedback = generate_feedback(report, raw_llm_output, error_details, full_echo_schema)
+    if retry_policy is not None:
+        retry_policy.record_feedback_latency(component_name, error_type, time.perf_counter() - start)
+    return feedback, True
+
+
+def _run_variant(
+    chain: Any,
+    llm_input: Dict[str, Any],
     component_model: Type[BaseModel],
-    max_attempts: int = 5
-) -> BaseModel:
+    cancel: threading.Event
+) -> Tuple[str, Optional[BaseModel], List[str], Optional[Exception]]:
     """
-    Extracts data for a specific component, logging details for the Markdown book.
+    Runs one speculative attempt variant end to end; its LLM call is aborted once `cancel` is set.
+    Returns (raw_output, validated_component or None, json_recovery, error or None).
     """
-    if not is_langchain_available():
-        logger.error("LLM functionality is disabled. Cannot perform extraction.")
-        raise RuntimeError("LLM functionality is disabled. Cannot perform extraction.")
+    raw_output = ""
+    recoveries: List[str] = []
+    try:
+        raw_output = chain.invoke(llm_input, config={"callbacks": [CancellationHandler(cancel)]}).strip()
+        remapped_data, recoveries = parse_component_output(raw_output, component_model)
+        return raw_output, component_model.model_validate(remapped_data), recoveries, None
+    except Exception as e:
+        return raw_output, None, recoveries, e
 
-    main_extraction_chain = get_extraction_chain()
-    json_parser = get_json_parser()
-    full_echo_schema = EchoReport.model_json_schema() 
 
-    if main_extraction_chain is None or json_parser is None:
-        logger.error("LLM chains or parser not initialized correctly.")
-        raise RuntimeError("LLM chains or parser not initialized correctly.")
+def _run_speculative_round(
+    variants: List[Tuple[str, Any, str]],
+    llm_input: Dict[str, Any],
+    component_model: Type[BaseModel]
+) -> Tuple[Optional[str], Dict[str, Tuple[str, Optional[BaseModel], List[str], Optional[Exception]]]]:
+    """
+    Launches all attempt variants at once and returns as soon as one passes validation.
+    The other variants are then cancelled: those not started yet never send their request,
+    and requests in flight are aborted at their next streamed token (see CancellationHandler).
+
+    Returns:
+        A tuple (winner_name or None, outcomes by variant name for the variants that finished).
+    """
+    outcomes = {}
+    winner = None
+    cancel = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=len(variants), thread_name_prefix="speculative")
+    futures = {}
+    try:
+        for name, chain, feedback_hint in variants:
+            variant_input = dict(llm_input)
+            if feedback_hint:
+                variant_input["feedback"] = f"{llm_input['feedback']}\n{feedback_hint}".strip()
+            # Each variant runs in a copy of this context, so its log records keep the current report id
+            context = contextvars.copy_context()
+            futures[executor.submit(context.run, _run_variant, chain, variant_input, component_model, cancel)] = name
+        for future in as_completed(futures):
+            name = futures[future]
+            outcomes[name] = future.result()
+            if outcomes[name][1] is not None:
+                winner = name
+                break
+    finally:
+        cancel.set()
+        # Cancelled here rather than with shutdown(cancel_futures=True), which needs Python 3.9
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+    return winner, outcomes
+
 
+# Prompt schema text per component, generated or read from JSON_Schema once
+_prompt_schemas: Dict[str, str] = {}
+
+def _load_prompt_schema(component_model: Type[BaseModel]) -> str:
+    """
+    Returns the schema text for the component's extraction prompt: generated from the
+    model if USE_GENERATED_PROMPT_SCHEMAS is set, otherwise the JSON_Schema file.
+    """
     component_name = component_model.__name__
-    # Get the Pydantic schema for error reporting and validation
-    pydantic_component_schema = component_model.model_json_schema()
-    
-    # Load schema from JSON file instead of Pydantic model for the extraction prompt
+    if component_name in _prompt_schemas:
+        return _prompt_schemas[component_name]
+    if USE_GENERATED_PROMPT_SCHEMAS:
+        _prompt_schemas[component_name] = build_prompt_schema(component_model, PROMPT_SCHEMA_DESCRIPTIONS)
+        return _prompt_schemas[component_name]
     schema_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'JSON_Schema')
     # Try both .json and .schema.json extensions
     possible_filenames = [f"{component_name}.json", f"{component_name}.schema.json"]
@@ -92,7 +174,53 @@ def extract_component_data(
         raise FileNotFoundError(f"Schema file for component '{component_name}' not found in {schema_dir}.")
     with open(schema_path, 'r') as f:
         json_component_schema = json.load(f)
-    component_schema_str = json.dumps(json_component_schema, indent=2)
+    _prompt_schemas[component_name] = json.dumps(json_component_schema, indent=2)
+    return _prompt_schemas[component_name]
+
+def extract_component_data(
+    report: str,
+    component_model: Type[BaseModel],
+    max_attempts: int = 5,
+    retry_policy: Optional[RetryPolicy] = None,
+    speculative_variants: Optional[List[str]] = None
+) -> BaseModel:
+    """
+    Extracts data for a specific component, logging details for the Markdown book.
+    If a retry policy is given, it caps the attempts (never above `max_attempts`),
+    decides when feedback is generated and when to switch to the escalation model,
+    and records the outcome of every attempt.
+    If speculative variants are given (opt-in), every attempt launches those variants
+    in parallel and the first one that validates wins. With a retry policy this only
+    happens for components whose first-attempt success rate is historically low.
+    """
+    if not is_langchain_available():
+        logger.error("LLM functionality is disabled. Cannot perform extraction.")
+        raise RuntimeError("LLM functionality is disabled. Cannot perform extraction.")
+
+    main_extraction_chain = get_extraction_chain()
+    from .models import EchoReport # Imported here so importing this module does not build every model
+    full_echo_schema = get_model_schema(EchoReport) # Generated once; its snippet index is shared across calls
+
+    if main_extraction_chain is None:
+        logger.error("LLM chains not initialized correctly.")
+        raise RuntimeError("LLM chains not initialized correctly.")
+
+    component_name = component_model.__name__
+    escalate_from = None
+    escalation_chain = None
+    if retry_policy is not None:
+        max_attempts = retry_policy.max_attempts(component_name, max_attempts)
+        escalation_chain = get_escalation_chain()
+        if escalation_chain is not None:
+            escalate_from = retry_policy.escalate_from_attempt(component_name, max_attempts)
+    variants = []
+    if speculative_variants and (retry_policy is None or retry_policy.should_speculate(component_name)):
+        variants = get_speculative_variants(speculative_variants)
+    # Get the Pydantic schema for error reporting and validation
+    pydantic_component_schema = get_model_schema(component_model)
+    
+    # Load schema from JSON file instead of Pydantic model for the extraction prompt
+    component_schema_str = _load_prompt_schema(component_model)
     
     # Log the start of processing for this component (for the book)
     logger.info(f"Starting component: {component_name}", extra={
@@ -102,8 +230,12 @@ def extract_component_data(
 
     feedback = ""  # Initial empty feedback
     last_error_for_runtime_exception = None # To store the very last error if all attempts fail
+    feedback_error_type = None # Error type addressed by the feedback agent's feedback, if any
 
     for i in range(1, max_attempts + 1):
+        escalated = escalate_from is not None and i >= escalate_from
+        speculative = len(variants) > 1 and not escalated
+        raw_output = ""
         # Prepare a dictionary to hold all data for the current attempt's log entry
         attempt_log_data = {
             'log_type': 'ATTEMPT_PROCESSED', # This will be recognized by MarkdownBookFormatter
@@ -114,6 +246,10 @@ def extract_component_data(
             'extractor_input': {},
             'extractor_raw_output': 'Not yet generated.',
             'feedback_output': feedback if feedback else "No feedback provided (first attempt or previous success).", # Log current feedback
+            'json_recovery': [], # Recoveries applied by the tolerant JSON parser
+            'escalated': escalated, # Whether this attempt runs on the escalation model
+            'speculative_variants': [], # Per-variant outcome when attempts run speculatively
+            'latency': None, # Seconds from the LLM call to validation (feedback generation excluded)
             'errors': [] # List to store errors for this attempt
         }
         
@@ -129,19 +265,39 @@ def extract_component_data(
 
         logger.info(f"Attempt {i}/{max_attempts} for {component_name}...")
 
+        attempt_start = time.perf_counter()
+        error_type = None
         try:
-            response = main_extraction_chain.invoke(current_llm_input)
-            raw_output = response.strip()
-            attempt_log_data['extractor_raw_output'] = raw_output
-
-            parsed_data = json_parser.parse(raw_output)
-            # Remap keys to match model fields before validation
-            remapped_data = remap_llm_keys(parsed_data, component_model.__fields__)
-            validated_component = component_model.model_validate(remapped_data)
+            if speculative:
+                winner, outcomes = _run_speculative_round(variants, current_llm_input, component_model)
+                attempt_log_data['speculative_variants'] = [
+                    {'variant': name, 'status': 'Successful' if outcome[1] is not None else f"Failed ({type(outcome[3]).__name__})"}
+                    for name, outcome in outcomes.items()
+                ]
+                # Report the winner, or the primary variant if none validated
+                raw_output, validated_component, attempt_log_data['json_recovery'], variant_error = outcomes[winner or variants[0][0]]
+                attempt_log_data['extractor_raw_output'] = raw_output
+                if variant_error is not None:
+                    raise variant_error
+            else:
+                chain = escalation_chain if escalated else main_extraction_chain
+                response = chain.invoke(current_llm_input)
+                raw_output = response.strip()
+                attempt_log_data['extractor_raw_output'] = raw_output
+
+                # Tolerant parse: re-attaches the prefilled brace, strips fences/prose, closes safe truncations.
+                # Keys are remapped to match model fields during the parse where possible.
+                remapped_data, attempt_log_data['json_recovery'] = parse_component_output(raw_output, component_model)
+                validated_component = component_model.model_validate(remapped_data)
             
             attempt_log_data['status'] = 'Successful'
+            attempt_latency = time.perf_counter() - attempt_start
+            attempt_log_data['latency'] = round(attempt_latency, 3)
             # Log successful attempt details to the book
             logger.info(f"Attempt {i} for {component_name} successful.", extra=attempt_log_data)
+            if retry_policy is not None:
+                retry_policy.record_attempt(component_name, i, True, attempt_latency, escalated=escalated,
+                                            feedback_error_type=feedback_error_type, speculative=speculative)
             return validated_component
 
         except json.JSONDecodeError as jde:
@@ -156,8 +312,12 @@ def extract_component_data(
             })
             
             # Generate feedback for the next attempt
-            feedback = generate_feedback(report, raw_output, error_message, full_echo_schema)
+            error_type = 'JSONDecodeError'
+            attempt_latency = time.perf_counter() - attempt_start
+            feedback, feedback_generated = _feedback_for_next_attempt(
+                retry_policy, component_name, i, max_attempts, error_type, report, raw_output, error_message, full_echo_schema)
             attempt_log_data['feedback_output'] = feedback
+            attempt_log_data['latency'] = round(attempt_latency, 3)
             # Log failed attempt details to the book
             logger.error(f"Attempt {i} for {component_name} failed: JSON Parse Error.", extra=attempt_log_data)
 
@@ -169,8 +329,12 @@ def extract_component_data(
             attempt_log_data['errors'].extend(formatted_pyd_errors)
             
             # Generate feedback for the next attempt
-            feedback = generate_feedback(report, raw_output, ve.errors(), full_echo_schema)
+            error_type = 'ValidationError'
+            attempt_latency = time.perf_counter() - attempt_start
+            feedback, feedback_generated = _feedback_for_next_attempt(
+                retry_policy, component_name, i, max_attempts, error_type, report, raw_output, ve.errors(), full_echo_schema)
             attempt_log_data['feedback_output'] = feedback
+            attempt_log_data['latency'] = round(attempt_latency, 3)
             logger.error(f"Attempt {i} for {component_name} failed: Validation Error.", extra=attempt_log_data)
 
         except Exception as e:
@@ -185,10 +349,19 @@ def extract_component_data(
             })
             
             # Generate feedback for the next attempt
-            feedback = generate_feedback(report, raw_output, error_message, full_echo_schema)
+            error_type = type(e).__name__
+            attempt_latency = time.perf_counter() - attempt_start
+            feedback, feedback_generated = _feedback_for_next_attempt(
+                retry_policy, component_name, i, max_attempts, error_type, report, raw_output, error_message, full_echo_schema)
             attempt_log_data['feedback_output'] = feedback
+            attempt_log_data['latency'] = round(attempt_latency, 3)
             logger.error(f"Attempt {i} for {component_name} failed: Unexpected Error.", extra=attempt_log_data)
 
+        if retry_policy is not None:
+            retry_policy.record_attempt(component_name, i, False, attempt_latency, error_type=error_type, escalated=escalated,
+                                        feedback_error_type=feedback_error_type, speculative=speculative)
+        feedback_error_type = error_type if feedback_generated else None
+
     # If loop finishes, all attempts failed. The last attempt's failure is already logged.
     logger.error(f"Extraction for {component_name} FAILED After {max_attempts} Attempts.")
     raise RuntimeError(f"Failed to extract and validate data for {component_name} after {max_attempts} attempts. Last error: {last_error_for_runtime_exception}")
@@ -0,0 +1,162 @@
+import json
+import re
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Names of the recoveries reported back to the caller (and the Markdown book)
+RECOVERY_STRIPPED_FENCES = "stripped_code_fences"
+RECOVERY_STRIPPED_LEADING_PROSE = "stripped_leading_prose"
+RECOVERY_REATTACHED_BRACE = "reattached_prefill_brace"
+RECOVERY_STRIPPED_TRAILING_TEXT = "stripped_trailing_text"
+RECOVERY_DROPPED_TRAILING_COMMA = "dropped_trailing_comma"
+RECOVERY_CLOSED_TRUNCATED = "closed_truncated_structure"
+
+_LEADING_FENCE_RE = re.compile(r'^```[a-zA-Z0-9]*[ \t]*\n?')
+
+
+def _scan_json_value(text: str) -> Tuple[int, List[str], bool]:
+    """
+    Scans `text` (which must start with '{' or '[') tracking strings and nesting.
+
+    Returns:
+        A tuple (end, open_stack, safe_to_close):
+        - end: index just past the top-level value, or -1 if the text ends first.
+        - open_stack: the closers still missing when the text ends ("}" / "]").
+        - safe_to_close: True if the text ends on a member boundary, i.e. after a
+          complete value or a separating comma, so appending closers loses nothing.
+    """
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    # Whether the next string inside an object is a key (True) or a value (False)
+    expect_key: List[bool] = []
+    last_token = ""  # 'value', 'key', 'colon', 'comma', 'open', 'scalar'
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+                is_key = bool(stack) and stack[-1] == '}' and expect_key[-1]
+                last_token = 'key' if is_key else 'value'
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in '{[':
+            stack.append('}' if ch == '{' else ']')
+            expect_key.append(ch == '{')
+            last_token = 'open'
+        elif ch in '}]':
+            if not stack:
+                return i, [], False
+            stack.pop()
+            expect_key.pop()
+            last_token = 'value'
+            if not stack:
+                return i + 1, [], True
+        elif ch == ':':
+            if expect_key:
+                expect_key[-1] = False
+            last_token = 'colon'
+        elif ch == ',':
+            if stack and stack[-1] == '}':
+                expect_key[-1] = True
+            last_token = 'comma'
+        elif not ch.isspace():
+            # Part of a number or a true/false/null literal
+            last_token = 'scalar'
+
+    # Text ended before the top-level value was closed
+    safe = not in_string and last_token in ('value', 'comma', 'open')
+    return -1, list(reversed(stack)), safe
+
+
+def parse_llm_json(raw_output: str, object_pairs_hook: Optional[Callable[[List[Tuple[str, Any]]], Any]] = None) -> Tuple[Any, List[str]]:
+    """
+    Parses raw LLM output into JSON, recovering from the common ways it goes wrong.
+
+    The extraction prompt ends with "```json\\n{", so the model's answer usually lacks
+    the opening brace and may carry a closing fence, trailing prose, or be cut off.
+    The following recoveries are attempted, in order:
+    1. Strip a leading code fence, or prose before the first '{'.
+    2. Re-attach the prefilled '{' if the output starts directly with a key.
+    3. Drop anything after the end of the top-level JSON value (fences, prose).
+    4. Close a truncated structure, but only when the output stops on a member
+       boundary (nothing partial would be kept or silently dropped).
+
+    Args:
+        raw_output: The raw text returned by the extraction chain.
+        object_pairs_hook: Passed to json.loads, e.g. to remap keys while parsing.
+
+    Returns:
+        A tuple (parsed_data, recoveries), where recoveries lists the names of the
+        recoveries that were applied (empty if the output parsed as-is).
+
+    Raises:
+        json.JSONDecodeError: If the output cannot be recovered into valid JSON.
+    """
+    text = raw_output.strip()
+    try:
+        return json.loads(text, object_pairs_hook=object_pairs_hook), []
+    except json.JSONDecodeError as original_error:
+        first_error = original_error
+
+    recoveries: List[str] = []
+
+    fence_match = _LEADING_FENCE_RE.match(text)
+    if fence_match:
+        text = text[fence_match.end():].lstrip()
+        recoveries.append(RECOVERY_STRIPPED_FENCES)
+
+    if text.startswith('"'):
+        # The model continued right after the prefilled '{' of the prompt
+        text = "{" + text
+        recoveries.append(RECOVERY_REATTACHED_BRACE)
+    elif not text.startswith(('{', '[')):
+        start = text.find('{')
+        if start == -1:
+            raise first_error
+        text = text[start:]
+        recoveries.append(RECOVERY_STRIPPED_LEADING_PROSE)
+
+    # Fast path: a complete value, possibly followed by trailing text, is decoded by the C parser
+    try:
+        parsed, end = json.JSONDecoder(object_pairs_hook=object_pairs_hook).raw_decode(text)
+    except json.JSONDecodeError:
+        pass
+    else:
+        if text[end:].strip():
+            recoveries.append(RECOVERY_STRIPPED_TRAILING_TEXT)
+        logger.debug("Recovered LLM JSON output using: %s", ", ".join(recoveries))
+        return parsed, recoveries
+
+    # Slow path: scan the text to find where it ends or how it was truncated
+    end, missing_closers, safe_to_close = _scan_json_value(text)
+    if end != -1:
+        trailing = text[end:]
+        if trailing.strip():
+            recoveries.append(RECOVERY_STRIPPED_TRAILING_TEXT)
+        text = text[:end]
+    elif missing_closers and safe_to_close:
+        text = text.rstrip()
+        if text.endswith(','):
+            text = text[:-1]
+            recoveries.append(RECOVERY_DROPPED_TRAILING_COMMA)
+        text += "".join(missing_closers)
+        recoveries.append(RECOVERY_CLOSED_TRUNCATED)
+    else:
+        raise first_error
+
+    try:
+        parsed = json.loads(text, object_pairs_hook=object_pairs_hook)
+    except json.JSONDecodeError:
+        raise first_error
+
+    logger.debug("Recovered LLM JSON output using: %s", ", ".join(recoveries))
+    return parsed, recoveries
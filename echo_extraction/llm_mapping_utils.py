@@ -1,16 +1,193 @@
 import re
+import inspect
 import logging
-from typing import Any, Dict, List, Union, Optional
+import threading
+import typing
+from typing import Any, Callable, Dict, List, Union, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .json_recovery import parse_llm_json
 
 logger = logging.getLogger(__name__)
 
+_KEY_SEPARATORS_RE = re.compile(r'[\s_\-]')
+
 def normalize_key(key: str) -> str:
     """
     Normalize a key by:
     - Lowercasing
     - Removing spaces, dashes, and underscores
     """
-    return re.sub(r'[\s_\-]', '', key).lower()
+    return _KEY_SEPARATORS_RE.sub('', key).lower()
+
+
+#--------------------------------------------------------------------------
+# Compiled remapper
+#--------------------------------------------------------------------------
+def _models_in_annotation(annotation: Any) -> List[Type[BaseModel]]:
+    """Pydantic models a field's value (or its list items) can hold: Model, List[Model], Optional/Union of those."""
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return [annotation]
+    models: List[Type[BaseModel]] = []
+    for arg in typing.get_args(annotation):
+        for model in _models_in_annotation(arg):
+            if model not in models:
+                models.append(model)
+    return models
+
+
+class KeyRemapper:
+    """
+    Key remapper compiled once per model (or Union of models).
+
+    Holds the normalized-key -> field-name map of its model(s), including normalized
+    aliases, and the child remapper of every field that holds a model, a list of
+    models or a Union of models. `remap` then does a single walk over the LLM output
+    with plain dictionary lookups. Keys without a match are kept as they are.
+    """
+
+    # Per-remapper memo of raw key -> field name; LLM outputs repeat the same keys
+    _MAX_KEY_MEMO = 1024
+
+    def __init__(self, models: List[Type[BaseModel]]):
+        self.models = models
+        self.norm_map: Dict[str, str] = {}
+        self.children: Dict[str, "KeyRemapper"] = {}
+        self._key_memo: Dict[str, str] = {}
+        self._pairs_hook: Optional[Callable[[List[Tuple[str, Any]]], Dict[str, Any]]] = None
+        self._pairs_hook_built = False
+
+    def _compile(self, building: Dict[tuple, "KeyRemapper"]) -> None:
+        # Field names first (a later field wins, as in remap_llm_keys), then aliases that do not clash
+        aliases: Dict[str, Optional[str]] = {}
+        for model in self.models:
+            for field_name, field_info in model.model_fields.items():
+                self.norm_map[normalize_key(field_name)] = field_name
+                for alias in (field_info.alias, field_info.validation_alias):
+                    if isinstance(alias, str):
+                        norm_alias = normalize_key(alias)
+                        # An alias shared by different fields (across Union members) is ambiguous
+                        aliases[norm_alias] = field_name if aliases.get(norm_alias, field_name) == field_name else None
+                child_models = _models_in_annotation(field_info.annotation)
+                if child_models and field_name not in self.children:
+                    self.children[field_name] = _build_remapper(child_models, building)
+        for norm_alias, field_name in aliases.items():
+            if field_name is not None:
+                self.norm_map.setdefault(norm_alias, field_name)
+
+    def field_for_key(self, key: str) -> str:
+        """The model field an LLM key maps to, or the key itself if there is no normalized match."""
+        field_name = self._key_memo.get(key)
+        if field_name is None:
+            field_name = self.norm_map.get(normalize_key(key), key) if isinstance(key, str) else key
+            if len(self._key_memo) < self._MAX_KEY_MEMO:
+                self._key_memo[key] = field_name
+        return field_name
+
+    def _tree_norm_map(self) -> Optional[Dict[str, str]]:
+        """
+        The normalized-key maps of this remapper and all its descendants merged into one,
+        or None if a normalized key maps to different field names at different levels.
+        """
+        merged: Dict[str, str] = {}
+        seen = set()
+        pending = [self]
+        while pending:
+            remapper = pending.pop()
+            if id(remapper) in seen:
+                continue
+            seen.add(id(remapper))
+            for norm_key, field_name in remapper.norm_map.items():
+                if merged.setdefault(norm_key, field_name) != field_name:
+                    return None
+            pending.extend(remapper.children.values())
+        return merged
+
+    @property
+    def object_pairs_hook(self) -> Optional[Callable[[List[Tuple[str, Any]]], Dict[str, Any]]]:
+        """
+        A json.loads object_pairs_hook that remaps keys while the JSON is parsed, so no
+        second, remapped copy of the output is built. Only available (not None) when
+        every normalized key maps to the same field name at every level of the model
+        tree, so the level an object sits at does not matter. Objects under keys that
+        are not model fields get their keys normalized too; validation ignores them.
+        """
+        if not self._pairs_hook_built:
+            tree_map = self._tree_norm_map()
+            if tree_map is not None:
+                key_memo: Dict[str, str] = {}
+
+                def field_for_key(key: str) -> str:
+                    field_name = key_memo.get(key)
+                    if field_name is None:
+                        field_name = tree_map.get(normalize_key(key), key)
+                        if len(key_memo) < self._MAX_KEY_MEMO:
+                            key_memo[key] = field_name
+                    return field_name
+
+                def pairs_hook(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+                    return {field_for_key(key): value for key, value in pairs}
+
+                self._pairs_hook = pairs_hook
+            self._pairs_hook_built = True
+        return self._pairs_hook
+
+    def remap(self, data: Any) -> Any:
+        """Returns `data` with keys remapped to field names, at every level described by the model(s)."""
+        if isinstance(data, list):
+            return [self.remap(item) for item in data]
+        if not isinstance(data, dict):
+            return data
+        remapped_dict = {}
+        children = self.children
+        for llm_key, llm_value in data.items():
+            field_name = self.field_for_key(llm_key)
+            if field_name != llm_key and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Key mapped: '{llm_key}' -> '{field_name}'")
+            child = children.get(field_name)
+            remapped_dict[field_name] = child.remap(llm_value) if child is not None else llm_value
+        return remapped_dict
+
+
+# Compiled remappers by tuple of models; only fully compiled remappers are published here
+_remappers: Dict[tuple, KeyRemapper] = {}
+_remappers_lock = threading.Lock()
+
+def _build_remapper(models: List[Type[BaseModel]], building: Dict[tuple, KeyRemapper]) -> KeyRemapper:
+    key = tuple(models)
+    remapper = _remappers.get(key) or building.get(key)
+    if remapper is None:
+        # Registered before compiling, so self-referencing models resolve to the same remapper
+        remapper = KeyRemapper(list(models))
+        building[key] = remapper
+        remapper._compile(building)
+    return remapper
+
+def get_key_remapper(model: Type[BaseModel]) -> KeyRemapper:
+    """Returns the compiled key remapper of a model, building it (and its children) on first use."""
+    remapper = _remappers.get((model,))
+    if remapper is None:
+        with _remappers_lock:
+            building: Dict[tuple, KeyRemapper] = {}
+            remapper = _build_remapper([model], building)
+            _remappers.update(building)
+    return remapper
+
+
+def parse_component_output(raw_output: str, component_model: Type[BaseModel]) -> Tuple[Any, List[str]]:
+    """
+    Parses raw LLM output into data ready for `component_model.model_validate`.
+    Keys are remapped while parsing when the model allows it, otherwise in one walk
+    over the parsed output. Returns (data, json_recovery).
+    """
+    remapper = get_key_remapper(component_model)
+    pairs_hook = remapper.object_pairs_hook
+    parsed_data, recoveries = parse_llm_json(raw_output, object_pairs_hook=pairs_hook)
+    if pairs_hook is None:
+        parsed_data = remapper.remap(parsed_data)
+    return parsed_data, recoveries
+
 
 def remap_llm_keys(data: Union[Dict, List, Any],
                      current_model_fields: Optional[Dict[str, Any]]
@@ -24,25 +201,33 @@ def remap_llm_keys(data: Union[Dict, List, Any],
                               or for the items if data is a list of models. None otherwise.
     Returns:
         A new dict, list, or the original primitive with remapped keys where applicable.
+
+    Prefer get_key_remapper(model).remap(data): it does the same with a remapper compiled
+    once per model. This function builds the normalization map at every level.
     """
-    logger.debug(f"remap_llm_keys CALLED. Data type: {type(data)}, Data (truncated): {str(data)[:200]}, Current model fields keys: {list(current_model_fields.keys()) if current_model_fields else 'None'}")
+    debug = logger.isEnabledFor(logging.DEBUG) # Debug strings below are costly; only build them when needed
+    if debug:
+        logger.debug(f"remap_llm_keys CALLED. Data type: {type(data)}, Data (truncated): {str(data)[:200]}, Current model fields keys: {list(current_model_fields.keys()) if current_model_fields else 'None'}")
 
     if isinstance(data, list):
         # If data is a list, current_model_fields should pertain to the schema of the *items* in the list.
         # This means the logic that calls remap_llm_keys for a list value must have already determined
         # the item_schema_fields.
-        logger.debug(f"  Data is a list. Remapping each item with fields: {list(current_model_fields.keys()) if current_model_fields else 'None'}")
+        if debug:
+            logger.debug(f"  Data is a list. Remapping each item with fields: {list(current_model_fields.keys()) if current_model_fields else 'None'}")
         return [remap_llm_keys(item, current_model_fields) for item in data]
 
     if not isinstance(data, dict) or not current_model_fields:
         # Not a dictionary that needs key remapping against model_fields, or no fields provided.
         # Could be a primitive value, or a dict that's not part of a defined Pydantic model structure.
-        logger.debug(f"  Data is not a dict OR no current_model_fields. Returning data as is. Data type: {type(data)}")
+        if debug:
+            logger.debug(f"  Data is not a dict OR no current_model_fields. Returning data as is. Data type: {type(data)}")
         return data
 
     # Build normalization map for the current dictionary level
     norm_map = {normalize_key(field_name): field_name for field_name in current_model_fields.keys()}
-    logger.debug(f"  Normalized map for current dict level: {norm_map}")
+    if debug:
+        logger.debug(f"  Normalized map for current dict level: {norm_map}")
 
     remapped_dict = {}
     for llm_key, llm_value in data.items():
@@ -52,8 +237,9 @@ def remap_llm_keys(data: Union[Dict, List, Any],
         model_field_name = norm_map.get(norm_llm_key, llm_key) # Default to original llm_key if no normalized match
         
         if model_field_name != llm_key:
-            logger.debug(f"    Key mapped: '{llm_key}' (norm: '{norm_llm_key}') -> '{model_field_name}'")
-        else:
+            if debug:
+                logger.debug(f"    Key mapped: '{llm_key}' (norm: '{norm_llm_key}') -> '{model_field_name}'")
+        elif debug:
             logger.debug(f"    Key processing: '{llm_key}' (norm: '{norm_llm_key}') -> (no change, or no match in norm_map: '{model_field_name}')")
 
         # Determine model_fields for the next recursion level (for llm_value)
@@ -65,23 +251,29 @@ def remap_llm_keys(data: Union[Dict, List, Any],
             if field_annotation:
                 if hasattr(field_annotation, '__fields__'): 
                     subfields_for_next_recursion = field_annotation.__fields__
-                    logger.debug(f"      Subfields for '{model_field_name}' (type: Pydantic Model {field_annotation.__name__}): {list(subfields_for_next_recursion.keys())}")
+                    if debug:
+                        logger.debug(f"      Subfields for '{model_field_name}' (type: Pydantic Model {field_annotation.__name__}): {list(subfields_for_next_recursion.keys())}")
                 else: # Check if annotation is List[PydanticModel] or similar
                     origin = getattr(field_annotation, '__origin__', None)
                     args = getattr(field_annotation, '__args__', [])
                     if (origin is list or origin is List) and args and hasattr(args[0], '__fields__'):
                         # This is for items if llm_value is a list
                         subfields_for_next_recursion = args[0].__fields__
-                        logger.debug(f"      Subfields for items in '{model_field_name}' (type: List[{args[0].__name__}]): {list(subfields_for_next_recursion.keys())}")
+                        if debug:
+                            logger.debug(f"      Subfields for items in '{model_field_name}' (type: List[{args[0].__name__}]): {list(subfields_for_next_recursion.keys())}")
                     elif isinstance(llm_value, dict) or isinstance(llm_value, list):
-                         logger.debug(f"      Value for '{model_field_name}' is dict/list, but its annotation '{field_annotation}' is not a recognized Pydantic model or List[PydanticModel]. No subfields for recursion.")
+                         if debug:
+                             logger.debug(f"      Value for '{model_field_name}' is dict/list, but its annotation '{field_annotation}' is not a recognized Pydantic model or List[PydanticModel]. No subfields for recursion.")
             elif isinstance(llm_value, dict) or isinstance(llm_value, list):
-                 logger.debug(f"      Value for '{model_field_name}' is dict/list, but no annotation found on FieldInfo. No subfields for recursion.")
+                 if debug:
+                     logger.debug(f"      Value for '{model_field_name}' is dict/list, but no annotation found on FieldInfo. No subfields for recursion.")
         elif (isinstance(llm_value, dict) or isinstance(llm_value, list)):
-            logger.debug(f"    Field '{model_field_name}' (from llm_key '{llm_key}') not found in current_model_fields. Cannot determine subfields for recursion if value is dict/list.")
+            if debug:
+                logger.debug(f"    Field '{model_field_name}' (from llm_key '{llm_key}') not found in current_model_fields. Cannot determine subfields for recursion if value is dict/list.")
 
         remapped_dict[model_field_name] = remap_llm_keys(llm_value, subfields_for_next_recursion)
     
-    logger.debug(f"  Remapped dictionary for current level: {remapped_dict}")
+    if debug:
+        logger.debug(f"  Remapped dictionary for current level: {remapped_dict}")
     return remapped_dict
 
@@ -1,13 +1,14 @@
 import logging
 import json
 import os
-from typing import Dict, Any, Type, Union
+from typing import Dict, Any, Type, Union, List, Tuple
 from dotenv import load_dotenv
 try:
     from langchain_community.llms import Ollama
     from langchain_core.prompts import PromptTemplate
     from langchain_core.output_parsers import JsonOutputParser 
     from langchain_core.runnables import RunnableSequence 
+    from langchain_core.callbacks import BaseCallbackHandler
     from pydantic import BaseModel
 
 
@@ -33,6 +34,8 @@ except ImportError:
             raise NotImplementedError("Langchain is not installed.")
     class BaseModel: 
         pass
+    class BaseCallbackHandler:
+        pass
 
 
 
@@ -42,6 +45,10 @@ LOG_FILE_DIR = os.getenv("LOG_FILE_DIR", "/main_app/logs")
 FINAL_REPORTS_DIR = os.getenv("FINAL_REPORTS_DIR", "/main_app/final_reports")
 ABBREVIATION_CSV_PATH = os.getenv("ABBREVIATION_CSV_PATH", "/main_app/echo_abb_merged_csv.csv")
 REPORTS_JSON_PATH = os.getenv("REPORTS_JSON_PATH", "/main_app/CTICI_NCIBB_Echo_Sample.json")
+# Use prompt schemas generated from the models (prompt_schema.py) instead of the JSON_Schema files
+USE_GENERATED_PROMPT_SCHEMAS = os.getenv("USE_GENERATED_PROMPT_SCHEMAS", "false").lower() in ("1", "true", "yes")
+# Include shortened field descriptions in generated prompt schemas (dropped again if over the token budget)
+PROMPT_SCHEMA_DESCRIPTIONS = os.getenv("PROMPT_SCHEMA_DESCRIPTIONS", "false").lower() in ("1", "true", "yes")
 
 
 #------------------------------------------------------------------------------
@@ -52,16 +59,22 @@ try:
     ollama_model_name = os.getenv("OLLAMA_MODEL_NAME", "your_ollama_model")
     ollama_base_url = os.getenv("OLLAMA_BASE_URL") 
 
+    # Optional stronger model used by the retry policy for attempts that rarely succeed
+    escalation_model_name = os.getenv("OLLAMA_ESCALATION_MODEL_NAME")
+
     if ollama_base_url:
         main_extraction_llm = Ollama(model=ollama_model_name, temperature=0.0, base_url=ollama_base_url) if LANGCHAIN_AVAILABLE else None
         feedback_llm = Ollama(model=ollama_model_name, temperature=0.0, base_url=ollama_base_url) if LANGCHAIN_AVAILABLE else None
+        escalation_llm = Ollama(model=escalation_model_name, temperature=0.0, base_url=ollama_base_url) if LANGCHAIN_AVAILABLE and escalation_model_name else None
     else:
         main_extraction_llm = Ollama(model=ollama_model_name, temperature=0.0) if LANGCHAIN_AVAILABLE else None
         feedback_llm = Ollama(model=ollama_model_name, temperature=0.0) if LANGCHAIN_AVAILABLE else None
+        escalation_llm = Ollama(model=escalation_model_name, temperature=0.0) if LANGCHAIN_AVAILABLE and escalation_model_name else None
 except Exception as e:
     logging.error(f"Failed to initialize Ollama models: {e}")
     main_extraction_llm = None
     feedback_llm = None
+    escalation_llm = None
     LANGCHAIN_AVAILABLE = False 
 
 json_parser = JsonOutputParser() if LANGCHAIN_AVAILABLE else JsonOutputParser() 
@@ -155,6 +168,7 @@ Example Feedback Points (Adapt to specific errors and schema):
 #------------------------------------------------------------------------------
 main_extraction_chain = main_extraction_prompt | main_extraction_llm if LANGCHAIN_AVAILABLE else None
 feedback_agent_chain = feedback_agent_prompt | feedback_llm if LANGCHAIN_AVAILABLE else None
+escalation_extraction_chain = main_extraction_prompt | escalation_llm if LANGCHAIN_AVAILABLE and escalation_llm is not None else None
 
 def get_extraction_chain() -> Union[RunnableSequence, None]:
     """Returns the main extraction Langchain runnable chain."""
@@ -170,6 +184,84 @@ def get_feedback_chain() -> Union[RunnableSequence, None]:
         return None
     return feedback_agent_chain
 
+def get_escalation_chain() -> Union[RunnableSequence, None]:
+    """Returns the extraction chain on the escalation model, or None if OLLAMA_ESCALATION_MODEL_NAME is not set."""
+    if not LANGCHAIN_AVAILABLE:
+        return None
+    return escalation_extraction_chain
+
+#------------------------------------------------------------------------------
+# Speculative Attempt Variants
+#------------------------------------------------------------------------------
+# name -> (Ollama options overriding the main extraction model, instruction appended to the feedback slot)
+SPECULATIVE_VARIANT_SPECS: Dict[str, Tuple[Dict[str, Any], str]] = {
+    "default": ({}, ""),
+    "json_mode": ({"format": "json"}, ""), # Constrained (JSON grammar) decoding
+    "sampled": ({"temperature": 0.4, "top_p": 0.9}, ""),
+    "strict_prompt": ({}, "Output ONLY the JSON object for this component. Use 'Not Assessed' / 'Not Measured' for anything the report does not state explicitly."),
+}
+_speculative_chains: Dict[str, RunnableSequence] = {}
+
+def get_speculative_variants(variant_names: List[str]) -> List[Tuple[str, RunnableSequence, str]]:
+    """
+    Returns (name, chain, feedback_hint) for each known variant name, building the
+    variant chains on first use. Unknown names are skipped with a warning.
+    """
+    if not LANGCHAIN_AVAILABLE:
+        logging.error("Langchain is not available. Speculative variants cannot be provided.")
+        return []
+    variants = []
+    for name in variant_names:
+        if name not in SPECULATIVE_VARIANT_SPECS:
+            logging.warning(f"Unknown speculative variant '{name}' ignored. Known variants: {list(SPECULATIVE_VARIANT_SPECS)}")
+            continue
+        llm_options, feedback_hint = SPECULATIVE_VARIANT_SPECS[name]
+        if not llm_options:
+            chain = main_extraction_chain
+        else:
+            if name not in _speculative_chains:
+                options = {"model": ollama_model_name, "temperature": 0.0, **llm_options}
+                if ollama_base_url:
+                    options["base_url"] = ollama_base_url
+                _speculative_chains[name] = main_extraction_prompt | Ollama(**options)
+            chain = _speculative_chains[name]
+        variants.append((name, chain, feedback_hint))
+    return variants
+
+class VariantCancelled(Exception):
+    """Raised inside a speculative variant's LLM call once another variant has won."""
+
+
+class CancellationHandler(BaseCallbackHandler):
+    """
+    Callback that aborts an LLM call once `event` is set: before the request is sent, or
+    at the next streamed token. Aborting stops reading the Ollama stream and closes the
+    connection, which makes Ollama stop generating and free the slot. A request still in
+    prompt evaluation (no token yet) keeps its slot until its first token.
+    """
+    raise_error = True
+
+    def __init__(self, event):
+        self.event = event
+
+    def _check(self) -> None:
+        if self.event.is_set():
+            raise VariantCancelled("Another speculative variant already succeeded.")
+
+    def on_llm_start(self, serialized, prompts, **kwargs) -> None:
+        self._check()
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        self._check()
+
+
+class _CancellationLogFilter(logging.Filter):
+    """Drops LangChain's "Error in CancellationHandler..." warning: the abort is intended."""
+    def filter(self, record: logging.LogRecord) -> bool:
+        return "VariantCancelled" not in record.getMessage()
+
+logging.getLogger("langchain_core.callbacks.manager").addFilter(_CancellationLogFilter())
+
 def get_json_parser() -> Union[JsonOutputParser, None]:
     """Returns the JsonOutputParser instance."""
     if not LANGCHAIN_AVAILABLE:
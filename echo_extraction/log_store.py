@@ -0,0 +1,295 @@
+import os
+import gzip
+import time
+import shutil
+import logging
+from typing import IO, List, Optional, Set, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# File suffix of each compression
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+# Subdirectory of a log directory that holds the blobs of its traces (never a shard)
+BLOB_DIR_NAME = 'blobs'
+# Extensions (before compression) of the report logs retention may remove one by one
+LOG_EXTENSIONS = ('.jsonl', '.md')
+
+
+#--------------------------------------------------------------------------
+# Compressed files
+#--------------------------------------------------------------------------
+def compression_of(path: str) -> Optional[str]:
+    """The compression of a log file, from its suffix ('gzip', 'zstd' or None)."""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def strip_compression_suffix(path: str) -> str:
+    """The path without its compression suffix, e.g. 'a/r1.jsonl.gz' -> 'a/r1.jsonl'."""
+    compression = compression_of(path)
+    return path[:-len(COMPRESSION_SUFFIXES[compression])] if compression else path
+
+
+def open_log_file(path: str, mode: str = 'r', compression: Optional[str] = None, encoding: str = 'utf-8') -> IO:
+    """
+    Opens a log file, compressed or not, like open(): text modes ('r', 'w', 'a') return a
+    text stream and binary modes ('rb', 'wb', 'ab') the (decompressed) bytes.
+
+    Args:
+        path: The file.
+        mode: The open() mode.
+        compression: 'gzip', 'zstd' or None; inferred from the suffix (.gz, .zst) if not given.
+        encoding: Text encoding for text modes.
+
+    Raises:
+        RuntimeError: For zstd files if the optional `zstandard` package is not installed.
+    """
+    compression = compression or compression_of(path)
+    binary = 'b' in mode
+    if compression == 'gzip':
+        return gzip.open(path, mode if binary else mode + 't', encoding=None if binary else encoding)
+    if compression == 'zstd':
+        if zstandard is None:
+            raise RuntimeError(f"Cannot open {path}: zstd log files need the 'zstandard' package (pip install zstandard).")
+        return zstandard.open(path, mode, encoding=None if binary else encoding)
+    return open(path, mode, encoding=None if binary else encoding)
+
+
+class CompressedFileHandler(logging.FileHandler):
+    """
+    FileHandler that writes through open_log_file, so a '.gz' or '.zst' log is compressed
+    as it is written. A compressed stream is flushed at most every `flush_interval`
+    seconds and when the handler is closed, not after every record: each flush ends a
+    compressed block, which costs CPU and compression ratio.
+    """
+    def __init__(self, filename, mode='a', encoding=None, delay=False, flush_interval: float = 5.0):
+        self.flush_interval = flush_interval
+        self._compressed = compression_of(os.fspath(filename)) is not None
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode, encoding=encoding, delay=delay)
+
+    def _open(self):
+        return open_log_file(self.baseFilename, self.mode, encoding=self.encoding or 'utf-8')
+
+    def flush(self):
+        if self._compressed:
+            now = time.monotonic()
+            if now - self._last_flush < self.flush_interval:
+                return
+            self._last_flush = now
+        super().flush()
+
+
+#--------------------------------------------------------------------------
+# Log store
+#--------------------------------------------------------------------------
+def _parse_size(value: str) -> int:
+    """Bytes from a size such as '500M', '20G' or '1048576' (0 = no limit)."""
+    value = value.strip().upper()
+    for unit, factor in (('K', 1 << 10), ('M', 1 << 20), ('G', 1 << 30), ('T', 1 << 40)):
+        if value.endswith(unit) or value.endswith(unit + 'B'):
+            return int(float(value.rstrip('B')[:-1]) * factor)
+    return int(value or 0)
+
+
+def _dir_stats(path: str) -> Tuple[int, float]:
+    """Total size and newest modification time of the files under `path`."""
+    total = 0
+    newest = 0.0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            total += stat.st_size
+            newest = max(newest, stat.st_mtime)
+    return total, newest
+
+
+class LogStore:
+    """
+    Where the per-report logs go: `<log_dir>/<shard>/<_id><ext>[.gz|.zst]`, with one
+    subdirectory (shard) per day by default, so no directory grows without bound. Each
+    shard has its own `blobs/` directory, so a shard is self-contained and retention
+    removes whole shards: the oldest are deleted once they are older than `max_age_days`
+    or the store is larger than `max_bytes`. The shard being written is never deleted;
+    if the store is still too large (e.g. a big single-day batch, or no shards at all),
+    the oldest report logs in it are removed one by one. Retention runs when writing
+    moves on to a new shard and every `check_every` logs.
+    """
+
+    def __init__(
+        self,
+        log_dir: str,
+        compression: Optional[str] = 'gzip',
+        shard_format: str = '%Y-%m-%d',
+        max_bytes: int = 0,
+        max_age_days: float = 0,
+        check_every: int = 100,
+    ):
+        """
+        Args:
+            log_dir: Root directory of the store.
+            compression: 'gzip', 'zstd' or None. zstd falls back to gzip if `zstandard` is not installed.
+            shard_format: time.strftime() format of the shard subdirectory ('' writes to `log_dir` itself).
+            max_bytes: Total size the store is trimmed to (0 = no limit).
+            max_age_days: Shards whose newest file is older than this are removed (0 = no limit).
+            check_every: Retention is also applied every this many path_for() calls (0 = only on a new shard).
+        """
+        if compression not in (None, *COMPRESSION_SUFFIXES):
+            raise ValueError(f"Unknown log compression {compression!r}; expected one of {sorted(COMPRESSION_SUFFIXES)} or none.")
+        if compression == 'zstd' and zstandard is None:
+            logger.warning("zstandard is not installed; compressing logs with gzip instead.")
+            compression = 'gzip'
+        self.log_dir = log_dir
+        self.compression = compression
+        self.shard_format = shard_format
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.check_every = check_every
+        self._current_shard = None
+        self._since_check = 0
+        # Logs handed out since the last retention check; they may still be written, so they are kept
+        self._recent: Set[str] = set()
+
+    @classmethod
+    def from_env(cls, log_dir: Optional[str] = None) -> "LogStore":
+        """Builds a store configured from LOG_* environment variables."""
+        compression = os.getenv("LOG_COMPRESSION", "gzip").lower()
+        return cls(
+            log_dir=log_dir if log_dir is not None else os.getenv("LOG_FILE_DIR", "main_app/logs"),
+            compression=None if compression in ("", "none") else compression,
+            shard_format=os.getenv("LOG_SHARD_FORMAT", "%Y-%m-%d"),
+            max_bytes=_parse_size(os.getenv("LOG_RETENTION_MAX_SIZE", "0")),
+            max_age_days=float(os.getenv("LOG_RETENTION_DAYS", "0")),
+            check_every=int(os.getenv("LOG_RETENTION_CHECK_EVERY", "100")),
+        )
+
+    def path_for(self, report_id: str, extension: str) -> str:
+        """
+        The log path of a report in the current shard (created if needed), e.g.
+        'logs/2026-10-19/report_001.jsonl.gz' for extension '.jsonl'. Retention is
+        applied whenever writing moves on to a new shard and every `check_every` calls.
+        """
+        shard = time.strftime(self.shard_format) if self.shard_format else ''
+        shard_dir = os.path.join(self.log_dir, shard)
+        self._since_check += 1
+        if shard != self._current_shard:
+            os.makedirs(shard_dir, exist_ok=True)
+            self._current_shard = shard
+            self.apply_retention()
+        elif self.check_every and self._since_check >= self.check_every:
+            self.apply_retention()
+        suffix = COMPRESSION_SUFFIXES.get(self.compression, '')
+        path = os.path.join(shard_dir, f"{report_id}{extension}{suffix}")
+        self._recent.add(path)
+        return path
+
+    def shards(self) -> List[str]:
+        """The shard directories of the store."""
+        if not os.path.isdir(self.log_dir):
+            return []
+        with os.scandir(self.log_dir) as entries:
+            return [entry.path for entry in entries if entry.is_dir() and entry.name != BLOB_DIR_NAME]
+
+    def _report_logs(self, directory: str) -> List[Tuple[float, str, int]]:
+        """(mtime, path, size) of the report logs directly in `directory`."""
+        logs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and strip_compression_suffix(entry.name).endswith(LOG_EXTENSIONS):
+                    stat = entry.stat()
+                    logs.append((stat.st_mtime, entry.path, stat.st_size))
+        return logs
+
+    def apply_retention(self) -> List[str]:
+        """
+        Removes the oldest shards (by their newest file) until none is older than
+        `max_age_days` and the store is at most `max_bytes`. If the store is still too
+        large, or has report logs outside shards, the oldest report logs in the current
+        shard and directly in `log_dir` are removed the same way; logs handed out since
+        the previous check are kept. Returns the removed shards and logs.
+        """
+        self._since_check = 0
+        recent, self._recent = self._recent, set()
+        if not self.max_bytes and not self.max_age_days:
+            return []
+        current = os.path.join(self.log_dir, self._current_shard) if self._current_shard else None
+        shards = []
+        for shard in self.shards():
+            size, newest = _dir_stats(shard)
+            shards.append((newest, shard, size))
+        shards.sort()
+
+        # Everything else in the store (e.g. unsharded logs and their blobs) counts towards the size
+        total = sum(size for _, _, size in shards)
+        with os.scandir(self.log_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    total += entry.stat().st_size
+                elif entry.name == BLOB_DIR_NAME:
+                    total += _dir_stats(entry.path)[0]
+        cutoff = time.time() - self.max_age_days * 86400 if self.max_age_days else None
+
+        def over_limit(newest: float) -> bool:
+            too_old = cutoff is not None and newest < cutoff
+            return too_old or bool(self.max_bytes and total > self.max_bytes)
+
+        removed = []
+        for newest, shard, size in shards:
+            if shard == current:
+                continue
+            if not over_limit(newest):
+                break
+            shutil.rmtree(shard, ignore_errors=True)
+            total -= size
+            removed.append(shard)
+
+        # Then single logs, where shards cannot help: the current shard and the unsharded root
+        logs = self._report_logs(self.log_dir)
+        if current and os.path.isdir(current):
+            logs += self._report_logs(current)
+        for mtime, path, size in sorted(logs):
+            if path in recent:
+                continue
+            if not over_limit(mtime):
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed.append(path)
+
+        if removed:
+            logger.info(f"Log retention removed {len(removed)} shard(s)/log(s) from {self.log_dir}: {', '.join(os.path.basename(s) for s in removed)}")
+        if self.max_bytes and total > self.max_bytes:
+            logger.warning(f"Log store {self.log_dir} is {total} bytes, above its {self.max_bytes}-byte limit, after retention: "
+                           f"what is left is the logs being written and the blobs of the current shard.")
+        return removed
+
+
+def find_report_log(log_dir: str, report_id: str, extensions: List[str]) -> Optional[str]:
+    """
+    Finds the log of a report in a log store: directly in `log_dir` or in one of its shards
+    (latest first), with any of the extensions and with or without compression.
+    """
+    names = [f"{report_id}{ext}{suffix}" for ext in extensions for suffix in ('', *COMPRESSION_SUFFIXES.values())]
+    directories = [log_dir]
+    if os.path.isdir(log_dir):
+        with os.scandir(log_dir) as entries:
+            directories += sorted((entry.path for entry in entries if entry.is_dir() and entry.name != BLOB_DIR_NAME), reverse=True)
+    for directory in directories:
+        for name in names:
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                return path
+    return None
@@ -1,10 +1,79 @@
+import io
+import os
 import re
+import sys
+import json
+import shutil
+import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 
-def clean_markdown_file(filepath):
+from .log_store import compression_of, open_log_file, strip_compression_suffix
+
+# MarkdownBookFormatter fences every code block with a fence longer than the content's
+# backtick runs, so books written since then need no cleaning. This cleaner is kept for
+# logs written before that, which can contain broken fence sequences.
+
+MANIFEST_NAME = ".md_cleaner_manifest.json"
+
+_LONG_FENCE_RE = re.compile(r'`{4,}')
+# A line with only ``` (and a newline)
+_FENCE_ONLY_RE = re.compile(r'[ \t]*```[ \t]*\n')
+# A line with only ```, with or without a newline (e.g. the last line of the file)
+_FENCE_LINE_RE = re.compile(r'[ \t]*```[ \t]*\n?')
+# A line starting with ```lang
+_FENCE_LANG_RE = re.compile(r'[ \t]*```[a-zA-Z0-9]+.*\n')
+
+#--------------------------------------------------------------------------
+# Cleaning
+#--------------------------------------------------------------------------
+def _normalize_fences(lines):
+    # Step 1: sequences of 4 or more backticks become ```
+    for line in lines:
+        yield _LONG_FENCE_RE.sub('```', line) if '````' in line else line
+
+def _drop_fence_before_lang(lines):
+    # Case A: a line with only ``` followed by a line starting with ```lang
+    pending = None
+    for line in lines:
+        if pending is not None:
+            if not _FENCE_LANG_RE.match(line):
+                yield pending
+            pending = None
+        if '```' in line and _FENCE_ONLY_RE.fullmatch(line):
+            pending = line
+        else:
+            yield line
+    if pending is not None:
+        yield pending
+
+def _drop_fence_after_lang(lines):
+    # Case B: a line starting with ```lang followed by a line with only ```
+    after_lang = False
+    for line in lines:
+        if after_lang and _FENCE_ONLY_RE.fullmatch(line):
+            after_lang = False
+            continue
+        after_lang = '```' in line and _FENCE_LANG_RE.match(line) is not None
+        yield line
+
+def _empty_repeated_fences(lines):
+    # Step 3: of two consecutive lines with only ```, the second is emptied (its newline stays)
+    after_fence = False
+    for line in lines:
+        if after_fence and _FENCE_LINE_RE.fullmatch(line):
+            after_fence = False
+            yield '\n' if line.endswith('\n') else ''
+            continue
+        after_fence = '```' in line and _FENCE_ONLY_RE.fullmatch(line) is not None
+        yield line
+
+def clean_markdown_lines(lines):
     """
-    Reads a markdown file, corrects problematic consecutive backtick sequences,
-    and overwrites the file with the cleaned content.
+    Corrects problematic consecutive backtick sequences in a stream of Markdown lines
+    (each ending with '\\n', except possibly the last) and yields the cleaned lines.
+    Each step needs only the previous line, so a file is cleaned in one pass without
+    reading it into memory.
 
     Specifically, it addresses:
     1. Sequences of 4 or more backticks (e.g., ````, `````) are replaced with ```.
@@ -29,64 +98,201 @@ def clean_markdown_file(filepath):
     4. Consecutive lines each containing only ```:
        ```
        ```
-       which becomes:
-       ```
+       where the second line is emptied.
+    """
+    return _empty_repeated_fences(_drop_fence_after_lang(_drop_fence_before_lang(_normalize_fences(lines))))
+
+def clean_markdown_text(content):
+    """Cleans Markdown text (see clean_markdown_lines) and returns the cleaned text."""
+    return ''.join(clean_markdown_lines(io.StringIO(content, newline='\n')))
+
+def _file_sha256(filepath):
+    # Of the decompressed content, so it matches the checksum of the cleaned text
+    digest = hashlib.sha256()
+    with open_log_file(filepath, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def clean_file(filepath, known_sha256=None):
     """
+    Cleans a Markdown file in place, streaming it through clean_markdown_lines into a
+    temporary file that replaces the original only if the content changed. Files ending
+    with .gz or .zst are decompressed and recompressed on the fly.
+
+    Args:
+        filepath: The Markdown file.
+        known_sha256: Checksum of the file when it was last known to be clean; if the
+            file still has it, it is not cleaned again.
+
+    Returns:
+        {'path', 'status': 'cleaned', 'clean' or 'error', 'size', 'mtime_ns', 'sha256'
+        (of the clean file), 'error'}
+    """
+    result = {'path': filepath, 'status': 'clean', 'size': None, 'mtime_ns': None, 'sha256': None, 'error': None}
+    tmp_path = f"{filepath}.tmp"
     try:
-        with open(filepath, 'r', encoding='utf-8') as file:
-            content = file.read()
-
-        original_content = content
-
-        # Step 1: Normalize overly long backtick sequences to ```
-        # e.g., ```` -> ```,  ````` -> ```
-        content = re.sub(r'`{4,}', '```', content)
-
-        # Step 2: Handle redundant ``` lines around a language-specified block
-        # Case A: A line with only ``` followed by a line starting with ```lang
-        content = re.sub(r'(^[ \t]*```[ \t]*\n)([ \t]*```[a-zA-Z0-9]+.*\n)', r'\2', content, flags=re.MULTILINE)
-
-        # Case B: A line with ```lang followed by a line with only ```
-        content = re.sub(r'(^[ \t]*```[a-zA-Z0-9]+.*\n)([ \t]*```[ \t]*\n)', r'\1', content, flags=re.MULTILINE)
-
-        # Step 3: Handle consecutive lines of triple backticks
-        # e.g., ```\n``` -> ```
-        # This regex looks for a line that IS "```" (with optional surrounding whitespace)
-        # followed by another line that IS "```" (with optional surrounding whitespace)
-        # and replaces it with a single "```" line.
-        # We loop this replacement because ```\n```\n``` would become ```\n``` in one pass, requiring another pass.
-        new_content = content
-        while True:
-            # Replace two consecutive standalone ``` lines with one
-            # Handles ```\n``` and keeps the first one. Also handles if the second ``` is at the EOF.
-            # The (?=\n|\Z) is a positive lookahead asserting that the second ``` is followed by a newline or end of string,
-            # without consuming it, which helps in cases of more than two ``` lines.
-            processed_content = re.sub(r'(^[ \t]*```[ \t]*\n)[ \t]*```[ \t]*(?=\n|\Z)', r'\1', new_content, flags=re.MULTILINE)
-            if processed_content == new_content:
-                break
-            new_content = processed_content
-        content = new_content
-
-        if content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as file:
-                file.write(content)
-            print(f"Cleaned file: {filepath}")
+        if known_sha256 is not None and _file_sha256(filepath) == known_sha256:
+            result['sha256'] = known_sha256
         else:
-            print(f"No changes needed for file: {filepath}")
+            source_digest = hashlib.sha256()
+            cleaned_digest = hashlib.sha256()
+            with open_log_file(filepath, 'r') as source, \
+                    open_log_file(tmp_path, 'w', compression=compression_of(filepath)) as target:
+                def read_lines():
+                    for line in source:
+                        source_digest.update(line.encode('utf-8'))
+                        yield line
+                for line in clean_markdown_lines(read_lines()):
+                    cleaned_digest.update(line.encode('utf-8'))
+                    target.write(line)
+            result['sha256'] = cleaned_digest.hexdigest()
+            if result['sha256'] == source_digest.hexdigest():
+                os.remove(tmp_path)
+            else:
+                shutil.copymode(filepath, tmp_path)
+                os.replace(tmp_path, filepath)
+                result['status'] = 'cleaned'
+        stat = os.stat(filepath)
+        result['size'] = stat.st_size
+        result['mtime_ns'] = stat.st_mtime_ns
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        result['status'] = 'error'
+        result['error'] = str(e)
+    return result
 
-    except FileNotFoundError:
+def clean_markdown_file(filepath):
+    """
+    Cleans a markdown file in place (see clean_file) and reports what was done.
+    """
+    if not os.path.isfile(filepath):
         print(f"Error: File not found at {filepath}")
-    except Exception as e:
-        print(f"An error occurred while processing {filepath}: {e}")
+        return
+    result = clean_file(filepath)
+    if result['status'] == 'cleaned':
+        print(f"Cleaned file: {filepath}")
+    elif result['status'] == 'clean':
+        print(f"No changes needed for file: {filepath}")
+    else:
+        print(f"An error occurred while processing {filepath}: {result['error']}")
+
+#--------------------------------------------------------------------------
+# Bulk cleaning
+#--------------------------------------------------------------------------
+def list_markdown_files(directory):
+    """Paths of the *.md files (also *.md.gz, *.md.zst) under `directory` (recursively), sorted."""
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files if strip_compression_suffix(name).endswith('.md'))
+    return sorted(paths)
+
+def load_manifest(manifest_path):
+    """The manifest of files known to be clean: {path: {'size', 'mtime_ns', 'sha256'}}."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest_path, manifest):
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def _clean_task(args):
+    return clean_file(*args)
+
+def clean_markdown_files(paths, manifest=None, workers=None):
+    """
+    Cleans many Markdown files, optionally over a process pool (None or 1 = serial).
 
+    Files whose size and modification time match their `manifest` entry are skipped
+    without being read; files whose checksum matches it are read but not rewritten.
+    The manifest (keyed by absolute path) is updated in place with every clean file.
+
+    Returns:
+        The clean_file results, in input order; skipped files have status 'skipped'.
+    """
+    manifest = manifest if manifest is not None else {}
+    results = [None] * len(paths)
+    tasks = []
+    positions = []
+    for i, path in enumerate(paths):
+        key = os.path.abspath(path)
+        entry = manifest.get(key)
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            results[i] = {'path': path, 'status': 'error', 'size': None, 'mtime_ns': None, 'sha256': None, 'error': str(e)}
+            continue
+        if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+            results[i] = {'path': path, 'status': 'skipped', 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                          'sha256': entry.get('sha256'), 'error': None}
+            continue
+        tasks.append((path, entry.get('sha256') if entry else None))
+        positions.append(i)
+
+    if workers and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            cleaned = list(pool.map(_clean_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        cleaned = [_clean_task(task) for task in tasks]
+
+    for i, result in zip(positions, cleaned):
+        results[i] = result
+        if result['status'] != 'error':
+            manifest[os.path.abspath(result['path'])] = {
+                'size': result['size'], 'mtime_ns': result['mtime_ns'], 'sha256': result['sha256'],
+            }
+    return results
+
+#--------------------------------------------------------------------------
+# CLI
+#--------------------------------------------------------------------------
 def main():
     parser = argparse.ArgumentParser(
-        description="Clean markdown files by correcting problematic backtick sequences.",
+        description="Clean markdown files by correcting problematic backtick sequences.\n"
+                    "Directories are cleaned recursively (*.md, *.md.gz, *.md.zst), in parallel, skipping files already clean.",
         formatter_class=argparse.RawTextHelpFormatter
     )
-    parser.add_argument("filepath", help="Path to the markdown file to clean.")
+    parser.add_argument("paths", nargs="+", help="Markdown file(s) or directories of markdown files to clean.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (1 = serial).")
+    parser.add_argument("--manifest", default=None,
+                        help=f"Manifest of files known to be clean (default: {MANIFEST_NAME} in each directory).")
+    parser.add_argument("--no-manifest", action="store_true", help="Clean every file, without reading or writing a manifest.")
     args = parser.parse_args()
-    clean_markdown_file(args.filepath)
+
+    if len(args.paths) == 1 and not os.path.isdir(args.paths[0]) and args.manifest is None:
+        clean_markdown_file(args.paths[0])
+        return 0
+
+    # Group the files by the manifest that covers them
+    groups = {}
+    for path in args.paths:
+        if os.path.isdir(path):
+            manifest_path = args.manifest or os.path.join(path, MANIFEST_NAME)
+            groups.setdefault(manifest_path, []).extend(list_markdown_files(path))
+        else:
+            groups.setdefault(args.manifest, []).append(path)
+
+    counts = {}
+    for manifest_path, paths in groups.items():
+        use_manifest = manifest_path is not None and not args.no_manifest
+        manifest = load_manifest(manifest_path) if use_manifest else {}
+        for result in clean_markdown_files(paths, manifest, args.workers):
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+            if result['status'] == 'cleaned':
+                print(f"Cleaned file: {result['path']}")
+            elif result['status'] == 'error':
+                print(f"An error occurred while processing {result['path']}: {result['error']}")
+        if use_manifest:
+            save_manifest(manifest_path, manifest)
+
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())) or "No markdown files found.")
+    return 1 if counts.get('error') else 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Pydantic models of the echo report, one module per component.
+
+`from echo_extraction.models import LeftVentricle` keeps working as it did with the
+single models module, but a component's module (and the modules it depends on) is
+only imported, and its models built, when one of its names is first accessed. A tool
+that works on one component no longer pays for building all of them.
+"""
+import importlib
+from typing import Any, Dict, List, Tuple
+
+# Public names defined by each submodule
+_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    "_common": (
+        "MeasurementValue", "common_model_config", "RangeCheckedModel", "get_default_component",
+        "PresenceEnum", "SeverityEnum", "ProstheticTypeEnum", "FunctionEnum",
+    ),
+    "left_ventricle": (
+        "LVSizeEnum", "LVSystolicFunctionEnum", "LVDiastolicFunctionEnum", "LVHypertrophyTypeEnum",
+        "LVHypertrophySeverityEnum", "LVWallMotionAbnormalityTypeEnum",
+        "LVWallMotionAbnormalityRegionEnum", "LVClotPresenceEnum", "LVASHPresenceEnum",
+        "LVEFMethodEnum", "LVHypertrophy", "LVWallMotionAbnormality", "LVAssessment",
+        "LVEjectionFraction", "LVDiameters", "LVVolumes", "LVFunctionIndices", "LVStrainMeasures",
+        "LVRegionalWallMotionScore", "LVRegionalWallMotionScores", "LVMass", "LVMeasurements",
+        "LeftVentricle",
+    ),
+    "right_ventricle": (
+        "RVSizeEnum", "RVSystolicFunctionEnum", "RVHypertrophyPresenceEnum",
+        "RVHypertrophySeverityEnum", "RVHypertrophy", "RVAssessment", "RVDimensions", "RVAreas",
+        "RVFunctionIndices", "RVMeasurements", "RightVentricle",
+    ),
+    "left_atrium": (
+        "LASizeEnum", "LASpontaneousEchoContrastEnum", "LAClotPresenceEnum",
+        "LAACSpontaneousEchoContrastEnum", "LAACClotPresenceEnum",
+        "LAACClosedInPreviousSurgeryEnum", "LAAppendageAssessment", "LAAssessment", "LAVolumes",
+        "LAFunctionIndices", "LAStrainMeasures", "LAAppendageMeasurements", "LAMeasurements",
+        "LeftAtrium",
+    ),
+    "right_atrium": (
+        "RASizeEnum", "RASpontaneousEchoContrastEnum", "RAClotPresenceEnum",
+        "RAASpontaneousEchoContrastEnum", "RAACClotPresenceEnum", "RAACClosedInPreviousSurgeryEnum",
+        "RAAppendageAssessment", "RAAssessment", "RAVolumes", "RAFunctionIndices",
+        "RAStrainMeasures", "RAAppendageMeasurements", "RAMeasurements", "RightAtrium",
+    ),
+    "pericardium": (
+        "PericardiumMorphologyEnum", "EffusionPresenceEnum", "EffusionSizeEnum",
+        "EffusionDistributionEnum", "EffusionHemodynamicImpactEnum",
+        "ConstrictivePericarditisFeatureEnum", "Effusion", "ConstrictivePericarditis",
+        "PericardiumAssessment", "EffusionSizeMeasurement", "PericardiumMeasurements", "Pericardium",
+    ),
+    "mitral_valve": (
+        "MitralShapeEnum", "SAMEnum", "MitralStenosis", "MitralRegurgitation", "MitralProsthetic",
+        "MitralValveAssessment", "MitralDimensions", "MitralRegurgitationParameters",
+        "MitralStenosisGradients", "MorphoFunctionalIndices", "MitralDopplerMeasurements",
+        "AnnulusMotion", "MitralValveMeasurements", "MitralValve",
+    ),
+    "tricuspid_valve": (
+        "TricuspidShapeEnum", "TricuspidStenosis", "TricuspidRegurgitation", "TricuspidProsthetic",
+        "TricuspidValveAssessment", "TricuspidDimensions", "TricuspidRegurgitationParameters",
+        "TricuspidGradients", "TricuspidDopplerMeasurements", "TricuspidValveMeasurements",
+        "TricuspidValve",
+    ),
+    "aortic_valve": (
+        "AorticShapeEnum", "AorticStenosis", "AorticRegurgitation", "AorticProsthetic",
+        "AorticValveAssessment", "AorticRegurgitationParameters", "AorticStenosisGradients",
+        "AorticDopplerMeasurements", "AorticValveMeasurements", "AorticValve",
+    ),
+    "pulmonary_valve": (
+        "PulmonaryShapeEnum", "PulmonaryStenosis", "PulmonaryRegurgitation", "PulmonaryProsthetic",
+        "PulmonaryValveAssessment", "PulmonaryDimensions", "PulmonaryRegurgitationParameters",
+        "PulmonaryGradients", "PulmonaryDopplerMeasurements", "PulmonaryHemodynamicPressures",
+        "PulmonaryValveMeasurements", "PulmonaryValve",
+    ),
+    "aorta": (
+        "AortaMorphologySegmentEnum", "AortaMorphologyEnum", "AortaFlowSegmentEnum",
+        "AortaFlowPatternEnum", "AtheroscleroticChangesEnum", "RightSidedAorticArchEnum",
+        "AortaMeasurementSegmentEnum", "AortaSegmentMorphology", "AortaSegmentFlow",
+        "AortaAssessment", "AortaSegmentDimension", "AortaDistances", "AortaMeasurements", "Aorta",
+    ),
+    "pulmonic_vein": (
+        "PulmonicVeinVenousDrainageEnum", "PulmonicVeinInflowPatternEnum", "PulmonicVeinAssessment",
+        "PulmonicVeinDopplerMeasurements", "PulmonicVeinMeasurements", "PulmonicVein",
+    ),
+    "ivc": (
+        "IVCSizeEnum", "IVCRespiratoryVariationEnum", "IVCPlethoraEnum", "IVCSniffTestResultEnum",
+        "IVCAssessment", "IVCMeasurements", "IVC",
+    ),
+    "vsd": (
+        "VSDPresenceEnum", "VSDLocationEnum", "VSDSizeEnum", "VSDShuntDirectionEnum",
+        "VSDAneurysmalTissueEnum", "VSDAssociatedDefectsEnum", "VSDAssessment", "VSDMeasurements",
+        "VSD",
+    ),
+    "asd": (
+        "ASDPresenceEnum", "ASDTypeEnum", "ASDSizeEnum", "ASDShuntDirectionEnum",
+        "ASDSeptalAneurysmEnum", "ASDAssociatedDefectsEnum", "ASDAssessment", "ASDMeasurements",
+        "ASD",
+    ),
+    "pfo": (
+        "PFOPresenceEnum", "PFOSizeEnum", "PFOShuntDirectionEnum", "PFOAssociatedAneurysmEnum",
+        "PFOBubbleStudyEnum", "PFOAssociatedDefectsEnum", "PFOAssessment", "PFOMeasurements", "PFO",
+    ),
+    "echo_report": (
+        "CardiacChambers", "ValvularApparatus", "GreatVesselsAndVenousReturn",
+        "CongenitalAndStructuralDefects", "EchoReport", "assemble_echo_report",
+    ),
+}
+
+_MODULE_BY_NAME: Dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_BY_NAME)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,258 @@
+"""Shared models, enums and configuration used by all component modules."""
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union, Literal
+from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic.fields import FieldInfo
+
+#------------------------------------------------------------------------------
+# Shared Models
+#------------------------------------------------------------------------------
+MeasurementValue = Union[float, int, Literal["Not Measured"]]
+
+common_model_config = ConfigDict(
+    populate_by_name=True,
+    use_enum_values=True,
+    alias_generator=lambda s: s.replace("_", " ").title()
+)
+
+
+#------------------------------------------------------------------------------
+# Range-Checked Measurements
+#------------------------------------------------------------------------------
+def _range_check(
+    label: str,
+    value_range: Tuple[float, float],
+    unit: Optional[str],
+    on_invalid: str,
+) -> Callable[[Any], Any]:
+    """
+    Builds the coercion function of one measurement field (`label` names it in error messages).
+
+    "Not Measured" passes through and numbers (or numeric strings) become floats. A value
+    that is not a number or is outside `value_range` becomes "Not Measured", or, with
+    on_invalid="raise", fails validation with a ValueError.
+    """
+    low, high = value_range
+    if on_invalid == "raise":
+        type_message = f"{label} value must be a number or 'Not Measured'"
+        range_message = f"{label} value must be between {low} and {high}" + (f" {unit}" if unit else "")
+
+        def check(v):
+            if v == "Not Measured":
+                return v
+            if isinstance(v, str):
+                try:
+                    v = float(v)
+                except ValueError:
+                    raise ValueError(type_message)
+            if isinstance(v, (int, float)):
+                val = float(v)
+                if not (low <= val <= high):
+                    raise ValueError(range_message)
+                return val
+            raise ValueError(type_message)
+    elif on_invalid == "default":
+        def check(v):
+            if v == "Not Measured":
+                return v
+            try:
+                val = float(v)
+            except Exception:
+                return "Not Measured"
+            return val if low <= val <= high else "Not Measured"
+    else:
+        raise ValueError(f"on_invalid must be 'default' or 'raise', not {on_invalid!r} ({label})")
+    return check
+
+
+class RangeCheckedModel(BaseModel):
+    """
+    Base for models with range-checked measurement fields.
+
+    A field declares its unit and accepted range once, in Field:
+
+        lvedd: MeasurementValue = Field(default="Not Measured", unit="cm", range=(2, 9))
+
+    When a subclass is created, every field with a `range` gets its own before-mode
+    validator built by _range_check (bounds and messages bound in a closure), so
+    validation makes one plain call per measurement. `on_invalid="raise"` makes invalid
+    values fail validation instead of defaulting to "Not Measured". Range and unit end
+    up in the JSON schema and in the generated prompt schemas.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        # Runs before pydantic collects the class' fields and validators, so the
+        # validators added here are compiled into the model like declared ones.
+        super().__init_subclass__(**kwargs)
+        alias_generator = getattr(cls, "model_config", {}).get("alias_generator")
+        for field_name in cls.__dict__.get("__annotations__", {}):
+            field_info = cls.__dict__.get(field_name)
+            if not isinstance(field_info, FieldInfo) or not isinstance(field_info.json_schema_extra, dict):
+                continue
+            extra = field_info.json_schema_extra
+            if extra.get("range") is None:
+                continue
+            # Errors name the field by the key the LLM sees
+            label = field_info.alias or (alias_generator(field_name) if callable(alias_generator) else field_name)
+            check = _range_check(label, tuple(extra["range"]), extra.get("unit"), extra.get("on_invalid", "default"))
+            setattr(cls, f"_check_{field_name}_range", field_validator(field_name, mode="before")(check))
+
+
+#------------------------------------------------------------------------------
+# Default Instances
+#------------------------------------------------------------------------------
+_default_components: Dict[Type[BaseModel], BaseModel] = {}
+
+
+def _build_default(model: Type[BaseModel]) -> BaseModel:
+    """Validates `model` with every required sub-model (e.g. assessment, measurements) built from its own defaults."""
+    required = {
+        name: _build_default(field_info.annotation)
+        for name, field_info in model.model_fields.items()
+        if field_info.is_required() and isinstance(field_info.annotation, type) and issubclass(field_info.annotation, BaseModel)
+    }
+    return model(**required)
+
+
+class _FrozenList(list):
+    """List of a shared default instance: mutating it raises TypeError; copies and pickles are plain lists."""
+    def _frozen(self, *args, **kwargs):
+        raise TypeError("This list belongs to a shared default instance; use model_copy(deep=True) for one that can be changed.")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _frozen
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo=None):
+        return [_copy_value(item) for item in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+# Model class -> its frozen subclass, and back
+_frozen_classes: Dict[Type[BaseModel], Type[BaseModel]] = {}
+_thawed_classes: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+
+def _frozen_class(cls: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    A subclass of `cls` whose instances cannot be changed. It is created with type.__new__,
+    bypassing pydantic's metaclass, so it reuses the schema, validator and serializer of
+    `cls` instead of building new ones. Its generic origin is `cls`, so its instances
+    compare equal to `cls` instances with the same values.
+    """
+    frozen = _frozen_classes.get(cls)
+    if frozen is None:
+        def refuse(self, name, *args):
+            raise TypeError(f"{cls.__name__} is a shared default instance; use model_copy(deep=True) for one that can be changed.")
+
+        namespace = {
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__setattr__': refuse,
+            '__delattr__': refuse,
+            '__pydantic_generic_metadata__': {'origin': cls, 'args': (), 'parameters': ()},
+            '__copy__': lambda self: _copy_tree(self, deep=False),
+            '__deepcopy__': lambda self, memo=None: _copy_tree(self),
+            '__reduce__': lambda self: _copy_tree(self).__reduce__(),
+        }
+        frozen = type.__new__(type(cls), cls.__name__, (cls,), namespace)
+        _thawed_classes[frozen] = cls
+        frozen = _frozen_classes.setdefault(cls, frozen)
+    return frozen
+
+
+def _freeze(instance: BaseModel) -> BaseModel:
+    """Makes a model tree (sub-models and lists included) immutable, in place."""
+    for name, value in instance.__dict__.items():
+        if isinstance(value, BaseModel):
+            _freeze(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, BaseModel):
+                    _freeze(item)
+            instance.__dict__[name] = _FrozenList(value)
+    object.__setattr__(instance, '__class__', _frozen_class(type(instance)))
+    return instance
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return _copy_tree(value)
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    return value
+
+
+def _copy_tree(instance: BaseModel, deep: bool = True) -> BaseModel:
+    """
+    Copies a frozen model tree into ordinary, changeable instances without validating
+    it again. Sub-models and lists are copied (only the top level if not `deep`); other
+    values (strings, enums, numbers) are immutable and shared.
+    """
+    cls = type(instance)
+    copy = object.__new__(_thawed_classes.get(cls, cls))
+    values = instance.__dict__.copy()
+    for name, value in values.items():
+        if isinstance(value, list):
+            values[name] = _copy_value(value) if deep else list(value)
+        elif deep and isinstance(value, (BaseModel, dict)):
+            values[name] = _copy_value(value)
+    object.__setattr__(copy, '__dict__', values)
+    object.__setattr__(copy, '__pydantic_fields_set__', set(instance.__pydantic_fields_set__))
+    object.__setattr__(copy, '__pydantic_extra__', _copy_value(instance.__pydantic_extra__))
+    object.__setattr__(copy, '__pydantic_private__', _copy_value(instance.__pydantic_private__))
+    return copy
+
+
+def get_default_component(model: Type[BaseModel]) -> BaseModel:
+    """
+    Returns the default instance of a component (every field "Not Assessed"/"Not Measured"),
+    such as `LeftVentricle(assessment=LVAssessment(), measurements=LVMeasurements())`.
+
+    The instance is validated once per model and shared, so assembling a report from
+    defaults costs neither validation nor copying. It is frozen: changing it (or its
+    sub-models and lists) raises TypeError, so no report can alter the defaults of
+    others. `model_copy(deep=True)` returns an ordinary copy that can be changed.
+    """
+    default = _default_components.get(model)
+    if default is None:
+        default = _default_components.setdefault(model, _freeze(_build_default(model)))
+    return default
+
+
+#------------------------------------------------------------------------------
+# Shared Enums
+#------------------------------------------------------------------------------
+class PresenceEnum(str, Enum):
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class SeverityEnum(str, Enum):
+    NO = "No"
+    TRIVIAL = "Trivial"
+    MILD = "Mild"
+    MILD_TO_MODERATE = "Mild to Moderate"
+    MODERATE = "Moderate"
+    MODERATE_TO_SEVERE = "Moderate to Severe"
+    SEVERE = "Severe"
+    VERY_SEVERE = "Very Severe"
+    NOT_ASSESSED = "Not Assessed"
+
+class ProstheticTypeEnum(str, Enum):
+    MECHANICAL_BILEAFLET = "Mechanical Bileaflet"
+    MECHANICAL_MONOLEAFLET = "Mechanical Monoleaflet"
+    BIOPROSTHETIC = "Bioprosthetic"
+    NOT_APPLICABLE = "Not Applicable"
+    NOT_ASSESSED = "Not Assessed"
+
+class FunctionEnum(str, Enum):
+    GOOD_FUNCTION = "Good Function"
+    MALFUNCTION = "Malfunction"
+    NOT_ASSESSED = "Not Assessed"
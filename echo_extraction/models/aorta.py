@@ -0,0 +1,186 @@
+"""Aorta models."""
+from enum import Enum
+from typing import List
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# Aorta
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Aorta Enums
+#------------------------------------------------------------------------------
+class AortaMorphologySegmentEnum(str, Enum):
+    """Enumeration for aortic segments assessed for morphology."""
+    ASCENDING_AORTA = "Ascending Aorta"
+    AORTIC_ARCH = "Aortic Arch"
+    DESCENDING_AORTA = "Descending Aorta"
+    NOT_ASSESSED = "Not Assessed" # Added for consistency, though not in JSON enum
+
+
+class AortaMorphologyEnum(str, Enum):
+    """Enumeration for aortic morphology."""
+    NORMAL = "Normal"
+    DILATED = "Dilated"
+    REPLACED_BY_TUBE_GRAFT = "Replaced by Tube Graft"
+    ANEURYSMAL = "Aneurysmal"
+    NOT_ASSESSED = "Not Assessed"
+
+
+class AortaFlowSegmentEnum(str, Enum):
+    """Enumeration for aortic segments assessed for flow."""
+    THORACIC_DESCENDING_AORTA = "Thoracic Descending Aorta"
+    ABDOMINAL_AORTA = "Abdominal Aorta"
+    NOT_ASSESSED = "Not Assessed" # Added for consistency, though not in JSON enum
+
+
+class AortaFlowPatternEnum(str, Enum):
+    """Enumeration for aortic flow patterns."""
+    NORMAL = "Normal"
+    HOLO_DIASTOLIC_REVERSAL = "Holo Diastolic Reversal"
+    EARLY_DIASTOLIC_REVERSAL = "Early Diastolic Reversal"
+    HOLO_ANTEGRADE_DIASTOLIC = "Holo Antegrade Diastolic"
+    EARLY_ANTEGRADE_DIASTOLIC = "Early Antegrade Diastolic"
+    NOT_ASSESSED = "Not Assessed"
+
+
+class AtheroscleroticChangesEnum(str, Enum):
+    """Enumeration for presence of atherosclerotic changes."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+
+class RightSidedAorticArchEnum(str, Enum):
+    """Enumeration for right-sided aortic arch variant."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+
+class AortaMeasurementSegmentEnum(str, Enum):
+    """Enumeration for aortic segments where dimensions are measured."""
+    AORTIC_ANNULUS = "Aortic Annulus"
+    SINUSES_OF_VALSALVA = "Sinuses of Valsalva (SOV)"
+    SINOTUBULAR_JUNCTION = "Sinotubular Junction (STJ)"
+    ASCENDING_AORTA = "Ascending Aorta"
+    AORTIC_ARCH = "Aortic Arch"
+    DESCENDING_AORTA = "Descending Aorta"
+    ABDOMINAL_AORTA = "Abdominal Aorta"
+    NOT_MEASURED = "Not Measured"
+
+
+#------------------------------------------------------------------------------
+# Aorta Assessment Models
+#------------------------------------------------------------------------------
+class AortaSegmentMorphology(BaseModel):
+    """Model for morphology assessment of a specific aortic segment."""
+    model_config = common_model_config
+
+    segment: AortaMorphologySegmentEnum = Field(
+        default=AortaMorphologySegmentEnum.NOT_ASSESSED,
+        description="Segment of the thoracic aorta"
+    )
+    morphology: AortaMorphologyEnum = Field(
+        default=AortaMorphologyEnum.NOT_ASSESSED,
+        description="Morphological state of the specified segment"
+    )
+
+class AortaSegmentFlow(BaseModel):
+    """Model for flow assessment of a specific aortic segment."""
+    model_config = common_model_config
+
+    segment: AortaFlowSegmentEnum = Field(
+        default=AortaFlowSegmentEnum.NOT_ASSESSED,
+        description="Aortic segment in which flow is assessed"
+    )
+    pattern: AortaFlowPatternEnum = Field(
+        default=AortaFlowPatternEnum.NOT_ASSESSED,
+        description="Flow pattern in the specified aortic segment"
+    )
+
+
+class AortaAssessment(BaseModel):
+    """Overall assessment of the aorta."""
+    model_config = common_model_config
+
+    morphology: List[AortaSegmentMorphology] = Field(
+        default_factory=list, # Use default_factory for mutable defaults
+        description="Morphology assessment for different aortic segments"
+    )
+    flow: List[AortaSegmentFlow] = Field(
+        default_factory=list, # Use default_factory for mutable defaults
+        description="Flow assessment for different aortic segments"
+    )
+    atherosclerotic_changes: AtheroscleroticChangesEnum = Field(
+        default=AtheroscleroticChangesEnum.NOT_ASSESSED,
+        description="Presence of atherosclerotic changes"
+    )
+    right_sided_aortic_arch: RightSidedAorticArchEnum = Field(
+        default=RightSidedAorticArchEnum.NOT_ASSESSED,
+        description="Right-sided aortic arch anatomical variant"
+    )
+
+#------------------------------------------------------------------------------
+# Aorta Measurement Models
+#------------------------------------------------------------------------------
+class AortaSegmentDimension(RangeCheckedModel):
+    """Model for quantitative dimension measurement of a specific aortic segment."""
+    model_config = common_model_config
+
+    segment: AortaMeasurementSegmentEnum = Field(
+        default=AortaMeasurementSegmentEnum.NOT_MEASURED,
+        description="Anatomical segment where diameter is measured"
+    )
+    diameter: MeasurementValue = Field(
+        default="Not Measured",
+        description="Measured diameter of the segment",
+        unit="cm",
+        range=(0.5, 6.0),
+        on_invalid="raise"
+    )
+
+
+class AortaDistances(RangeCheckedModel):
+    """Model for distance measurements related to the aortic root."""
+    model_config = common_model_config
+
+    annulus_to_stj: MeasurementValue = Field(
+        default="Not Measured",
+        description="Distance from aortic annulus to sinotubular junction",
+        unit="cm",
+        range=(0.5, 3.0),
+        on_invalid="raise"
+    )
+
+
+class AortaMeasurements(BaseModel):
+    """Quantitative measurements related to the aorta."""
+    model_config = common_model_config
+
+    dimensions: List[AortaSegmentDimension] = Field(
+        default_factory=list, # Use default_factory for mutable defaults
+        description="Quantitative dimensions for different aortic segments"
+    )
+    distances: AortaDistances = Field(
+         default_factory=AortaDistances, # Use default_factory for mutable defaults
+         description="Quantitative distance measurements for the aortic root"
+    )
+
+
+#------------------------------------------------------------------------------
+# Aorta Root
+#------------------------------------------------------------------------------
+class Aorta(BaseModel):
+    """Top-level model for the aorta section of the echo report."""
+    model_config = common_model_config
+
+    assessment: AortaAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the aorta"
+    )
+    measurements: AortaMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the aorta"
+    )
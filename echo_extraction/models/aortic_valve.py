@@ -0,0 +1,243 @@
+"""Aortic valve models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import (
+    MeasurementValue,
+    common_model_config,
+    RangeCheckedModel,
+    PresenceEnum,
+    SeverityEnum,
+    ProstheticTypeEnum,
+    FunctionEnum,
+)
+
+#------------------------------------------------------------------------------
+# Aortic Valve
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Aortic Enums
+#------------------------------------------------------------------------------
+class AorticShapeEnum(str, Enum):
+    NORMAL = "Normal"
+    THICKENED = "Thickened"
+    CALCIFIED = "Calcified"
+    PROLAPTIC = "Prolaptic"
+    REPAIRED = "Repaired"
+    FLAIL = "Flail"
+    TRICUSPID = "Tricuspid"
+    BICUSPID = "Bicuspid"
+    NOT_ASSESSED = "Not Assessed"
+
+
+#------------------------------------------------------------------------------
+# Aortic Valve Assessment Models
+#------------------------------------------------------------------------------
+class AorticStenosis(BaseModel):
+    """Model for aortic stenosis assessment."""
+    model_config = common_model_config
+
+    severity: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of Aortic Stenosis"
+    )
+
+
+class AorticRegurgitation(BaseModel):
+    """Model for aortic regurgitation assessment."""
+    model_config = common_model_config
+
+    severity: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of Aortic Regurgitation"
+    )
+    paravalvular_leak: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of paravalvular leak"
+    )
+    transvalvular_leak: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of transvalvular leak"
+    )
+
+
+class AorticProsthetic(BaseModel):
+    """Model for aortic prosthetic valve assessment."""
+    model_config = common_model_config
+
+    present: PresenceEnum = Field(
+        default=PresenceEnum.NOT_ASSESSED,
+        description="Presence of an aortic prosthetic valve"
+    )
+    type: ProstheticTypeEnum = Field(
+        default=ProstheticTypeEnum.NOT_ASSESSED,
+        description="Type of aortic prosthetic valve"
+    )
+    function: FunctionEnum = Field(
+        default=FunctionEnum.NOT_ASSESSED,
+        description="Function of the aortic prosthetic valve"
+    )
+
+#------------------------------------------------------------------------------
+# Full Aortic Valve Assessment Root
+#------------------------------------------------------------------------------
+class AorticValveAssessment(BaseModel):
+    """Overall assessment of the aortic valve."""
+    model_config = common_model_config
+
+    shape: AorticShapeEnum = Field(
+        default=AorticShapeEnum.NOT_ASSESSED,
+        description="Anatomical state of the aortic valve"
+    )
+    stenosis: AorticStenosis = Field(
+        default_factory=lambda: AorticStenosis(),
+        description="Aortic stenosis assessment"
+    )
+    regurgitation: AorticRegurgitation = Field(
+        default_factory=lambda: AorticRegurgitation(),
+        description="Aortic regurgitation assessment"
+    )
+    prosthetic: AorticProsthetic = Field(
+        default_factory=lambda: AorticProsthetic(),
+        description="Aortic prosthetic valve assessment"
+    )
+
+#------------------------------------------------------------------------------
+# Aortic Valve Measurements
+#------------------------------------------------------------------------------
+class AorticRegurgitationParameters(RangeCheckedModel):
+    """Quantitative measurements related to aortic regurgitation."""
+    model_config = common_model_config
+
+    ar_rv: MeasurementValue = Field(
+        default="Not Measured",
+        description="Aortic Regurgitation Regurgitant Volume",
+        unit="ml",
+        range=(1.0, 100.0)
+    )
+    ar_roa: MeasurementValue = Field(
+        default="Not Measured",
+        description="Aortic Regurgitation Regurgitant Orifice Area",
+        unit="cm²",
+        range=(0.01, 1.0)
+    )
+    vc: MeasurementValue = Field(
+        default="Not Measured",
+        description="Vena Contracta width",
+        unit="mm",
+        range=(1.0, 10.0)
+    )
+    ar_pht: MeasurementValue = Field(
+        default="Not Measured",
+        description="Aortic Regurgitation Pressure Half-Time",
+        unit="ms",
+        range=(100, 800)
+    )
+
+
+class AorticStenosisGradients(RangeCheckedModel):
+    """Quantitative measurements of aortic valve stenosis gradients."""
+    model_config = common_model_config
+
+    peak_velocity: MeasurementValue = Field(
+        default="Not Measured",
+        description="Aortic valve peak velocity",
+        unit="m/s",
+        range=(0.5, 6.0)
+    )
+    lvot_peak_velocity: MeasurementValue = Field(
+        default="Not Measured",
+        description="Left Ventricular Outflow Tract peak velocity",
+        unit="m/s",
+        range=(0.5, 6.0)
+    )
+    lvot_ao_peak_velocity_ratio: MeasurementValue = Field(
+        default="Not Measured",
+        alias="LVOT/Ao Peak Velocity Ratio",
+        description="Ratio of LVOT peak velocity to Aortic peak velocity",
+        range=(0.1, 1)
+    )
+    pressure_recovery: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pressure recovery",
+        unit="mmHg",
+        range=(0, 50)
+    )
+    aortic_ppg: MeasurementValue = Field(
+        default="Not Measured",
+        description="Aortic valve peak pressure gradient",
+        unit="mmHg",
+        range=(0, 150)
+    )
+    aortic_mpg: MeasurementValue = Field(
+        default="Not Measured",
+        description="Aortic valve mean pressure gradient",
+        unit="mmHg",
+        range=(0, 100)
+    )
+
+
+class AorticDopplerMeasurements(RangeCheckedModel):
+    """Quantitative Doppler measurements related to the aortic valve/LVOT."""
+    model_config = common_model_config
+
+    # alias_generator handles "Aortic VTI", "LVOT VTI"
+    aortic_vti: MeasurementValue = Field(
+        default="Not Measured",
+        description="Aortic valve Velocity Time Integral",
+        unit="cm",
+        range=(5.0, 150.0)
+    )
+    lvot_vti: MeasurementValue = Field(
+        default="Not Measured",
+        description="Left Ventricular Outflow Tract Velocity Time Integral",
+        unit="cm",
+        range=(5.0, 150.0)
+    )
+
+
+#------------------------------------------------------------------------------
+# Full AorticValveMeasurements Root
+#------------------------------------------------------------------------------
+class AorticValveMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the aortic valve."""
+    model_config = common_model_config
+
+    area: MeasurementValue = Field(
+        default="Not Measured",
+        description="Aortic Valve Area",
+        unit="cm²",
+        range=(0.5, 5.0),
+        on_invalid="raise"
+    )
+    regurgitation_parameters: AorticRegurgitationParameters = Field(
+        default_factory=AorticRegurgitationParameters,
+        description="Quantitative regurgitation parameters"
+    )
+    # Need explicit alias here
+    gradients: AorticStenosisGradients = Field(
+        default_factory=AorticStenosisGradients,
+        alias="Gradients (Aortic Valve Stenosis Hemodynamics)",
+        description="Aortic valve gradients"
+    )
+    doppler_measurements: AorticDopplerMeasurements = Field(
+        default_factory=AorticDopplerMeasurements,
+        description="Aortic Doppler measurements"
+    )
+
+
+#------------------------------------------------------------------------------
+# Aortic Valve Root
+#------------------------------------------------------------------------------
+class AorticValve(BaseModel):
+    """Top-level model for the aortic valve section of the echo report."""
+    model_config = common_model_config
+
+    assessment: AorticValveAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the aortic valve"
+    )
+    measurements: AorticValveMeasurements = Field(
+        ..., # This field is require
+        description="Quantitative measurements for the aortic valve"
+    )
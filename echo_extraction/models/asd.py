@@ -0,0 +1,131 @@
+"""Atrial septal defect models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# ASD
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# ASD Enums
+#------------------------------------------------------------------------------
+class ASDPresenceEnum(str, Enum):
+    """Enumeration for ASD presence assessment."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class ASDTypeEnum(str, Enum):
+    """Enumeration for ASD anatomical classification."""
+    SECUNDUM = "Secundum"
+    PRIMUM = "Primum"
+    SINUS_VENOSUS = "Sinus Venosus"
+    CORONARY_SINUS = "Coronary Sinus"
+    MULTIPLE = "Multiple"
+    NOT_ASSESSED = "Not Assessed"
+
+class ASDSizeEnum(str, Enum):
+    """Enumeration for ASD size estimation."""
+    SMALL = "Small"
+    MODERATE = "Moderate"
+    LARGE = "Large"
+    NOT_ASSESSED = "Not Assessed"
+
+class ASDShuntDirectionEnum(str, Enum):
+    """Enumeration for ASD shunt direction."""
+    LEFT_TO_RIGHT = "Left to Right"
+    RIGHT_TO_LEFT = "Right to Left"
+    BIDIRECTIONAL = "Bidirectional"
+    NOT_ASSESSED = "Not Assessed"
+
+class ASDSeptalAneurysmEnum(str, Enum):
+    """Enumeration for presence of septal aneurysm with ASD."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class ASDAssociatedDefectsEnum(str, Enum):
+    """Enumeration for associated structural cardiac anomalies with ASD."""
+    NONE = "None"
+    AV_CANAL = "AV Canal"
+    PARTIAL_ANOMALOUS_PULMONARY_VENOUS_RETURN = "Partial Anomalous Pulmonary Venous Return"
+    OTHER = "Other"
+    NOT_ASSESSED = "Not Assessed"
+
+#------------------------------------------------------------------------------
+# ASD Assessment Models
+#------------------------------------------------------------------------------
+class ASDAssessment(BaseModel):
+    """Model for ASD assessment details."""
+    model_config = common_model_config
+
+    present: ASDPresenceEnum = Field(
+        default=ASDPresenceEnum.NOT_ASSESSED,
+        description="Presence of ASD"
+    )
+    type: ASDTypeEnum = Field(
+        default=ASDTypeEnum.NOT_ASSESSED,
+        description="Anatomical classification of the ASD"
+    )
+    size: ASDSizeEnum = Field(
+        default=ASDSizeEnum.NOT_ASSESSED,
+        description="Visual/quantitative estimation of the defect size"
+    )
+    shunt_direction: ASDShuntDirectionEnum = Field(
+        default=ASDShuntDirectionEnum.NOT_ASSESSED,
+        description="Direction of shunting across the ASD"
+    )
+    septal_aneurysm: ASDSeptalAneurysmEnum = Field(
+        default=ASDSeptalAneurysmEnum.NOT_ASSESSED,
+        description="Presence of aneurysmal movement of the interatrial septum"
+    )
+    associated_defects: ASDAssociatedDefectsEnum = Field(
+        default=ASDAssociatedDefectsEnum.NOT_ASSESSED,
+        description="Associated structural cardiac anomalies"
+    )
+
+#------------------------------------------------------------------------------
+# ASD Measurement Models
+#------------------------------------------------------------------------------
+class ASDMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the ASD."""
+    model_config = common_model_config
+
+    diameter: MeasurementValue = Field(
+        default="Not Measured",
+        description="Measured maximum diameter of the ASD",
+        unit="mm",
+        range=(1.0, 40.0),
+        on_invalid="raise"
+    )
+    peak_gradient: MeasurementValue = Field(
+        default="Not Measured",
+        description="Peak pressure gradient across the ASD",
+        unit="mmHg",
+        range=(1.0, 50.0),
+        on_invalid="raise"
+    )
+    qp_qs: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary to systemic flow ratio",
+        range=(0.5, 5.0),
+        on_invalid="raise"
+    )
+
+
+#------------------------------------------------------------------------------
+# ASD Root
+#------------------------------------------------------------------------------
+class ASD(BaseModel):
+    """Top-level model for the ASD section of the echo report."""
+    model_config = common_model_config
+
+    assessment: ASDAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the ASD"
+    )
+    measurements: ASDMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the ASD"
+    )
@@ -0,0 +1,113 @@
+"""Section groupings, the root EchoReport model and its assembly from components."""
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+from ._common import common_model_config, get_default_component
+from .left_ventricle import LeftVentricle
+from .right_ventricle import RightVentricle
+from .left_atrium import LeftAtrium
+from .right_atrium import RightAtrium
+from .pericardium import Pericardium
+from .mitral_valve import MitralValve
+from .tricuspid_valve import TricuspidValve
+from .aortic_valve import AorticValve
+from .pulmonary_valve import PulmonaryValve
+from .aorta import Aorta
+from .pulmonic_vein import PulmonicVein
+from .ivc import IVC
+from .vsd import VSD
+from .asd import ASD
+from .pfo import PFO
+
+#------------------------------------------------------------------------------
+# Cardiac Chambers
+#------------------------------------------------------------------------------
+class CardiacChambers(BaseModel):
+    model_config = common_model_config
+
+    Left_Ventricle: LeftVentricle = Field(..., description="Left Ventricle assessments and measurements")
+    Right_Ventricle: RightVentricle = Field(..., description="Right Ventricle assessments and measurements")
+    Left_Atrium: LeftAtrium = Field(..., description="Left Atrium assessments and measurements")
+    Right_Atrium: RightAtrium = Field(..., description="Right Atrium assessments and measurements")
+
+
+#------------------------------------------------------------------------------
+# Valvular Apparatus
+#------------------------------------------------------------------------------
+class ValvularApparatus(BaseModel):
+    model_config = common_model_config
+
+    Mitral_Valve: MitralValve = Field(..., description="Mitral valve assessments and measurements")
+    Aortic_Valve: AorticValve = Field(..., description="Aortic valve assessments and measurements")
+    Pulmonary_Valve: PulmonaryValve = Field(..., description="Pulmonary valve assessments and measurements")
+    Tricuspid_Valve: TricuspidValve = Field(..., description="Tricuspid valve assessments and measurements")
+
+#------------------------------------------------------------------------------
+# Great Vessels and Venous Return
+#------------------------------------------------------------------------------
+class GreatVesselsAndVenousReturn(BaseModel):
+    model_config = common_model_config
+
+    aorta: Aorta = Field(..., description="Aorta assessments and measurements")
+    pulmonic_vein: PulmonicVein = Field(..., description="Pulmonic Vein assessments and measurements")
+    ivc: IVC = Field(..., description="Inferior Vena Cava assessments and measurements")
+
+#------------------------------------------------------------------------------
+# Congenital and Structural Defects
+#------------------------------------------------------------------------------
+class CongenitalAndStructuralDefects(BaseModel):
+    model_config = common_model_config
+
+    vsd:VSD = Field(..., description="Ventricular Septal Defect Assessments and Measurements")
+    asd:ASD = Field(..., description="Atrial Septal Defect Assessments and Measurements")
+    pfo:PFO = Field(..., description="Patent Foramen Ovale Assessments and Measurements")
+
+#------------------------------------------------------------------------------
+# Echo Report
+#------------------------------------------------------------------------------
+class EchoReport(BaseModel):
+    """Root model representing the extracted echo report data."""
+    model_config = common_model_config
+
+    Cardiac_Chambers: CardiacChambers = Field(..., description="Details of each cardiac chambers inluding left ventricle, left atrium, right ventricle, and right atrium")
+    Valvular_Apparatus: ValvularApparatus = Field(..., description="Valvular apparatus including Mitral, Aortic, Pulmonary, and Tricuspid valves and their assessments and measurements")
+    GreatVessels_and_VenousReturn: GreatVesselsAndVenousReturn = Field(..., description="great vessels and venous return including Aorta, Pulmonic Vein, and IVC")
+    Congenital_and_Structural_Defects: CongenitalAndStructuralDefects = Field(..., description="Details of congenital and structural defects including VSD, ASD, and PFO")
+    pericardium: Pericardium = Field(..., description="pericardium assessments and measurements")
+
+
+def assemble_echo_report(components: Dict[str, BaseModel]) -> EchoReport:
+    """
+    Assembles the EchoReport from extracted components keyed by model name (e.g.
+    "LeftVentricle"). Components that are missing get their default instance.
+    """
+    def component(model):
+        extracted = components.get(model.__name__)
+        return extracted if extracted is not None else get_default_component(model)
+
+    return EchoReport(
+        Cardiac_Chambers=CardiacChambers(
+            Left_Ventricle=component(LeftVentricle),
+            Right_Ventricle=component(RightVentricle),
+            Left_Atrium=component(LeftAtrium),
+            Right_Atrium=component(RightAtrium)
+        ),
+        Valvular_Apparatus=ValvularApparatus(
+            Mitral_Valve=component(MitralValve),
+            Aortic_Valve=component(AorticValve),
+            Pulmonary_Valve=component(PulmonaryValve),
+            Tricuspid_Valve=component(TricuspidValve)
+        ),
+        GreatVessels_and_VenousReturn=GreatVesselsAndVenousReturn(
+            aorta=component(Aorta),
+            pulmonic_vein=component(PulmonicVein),
+            ivc=component(IVC)
+        ),
+        Congenital_and_Structural_Defects=CongenitalAndStructuralDefects(
+            vsd=component(VSD),
+            asd=component(ASD),
+            pfo=component(PFO)
+        ),
+        pericardium=component(Pericardium)
+    )
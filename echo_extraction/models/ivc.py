@@ -0,0 +1,103 @@
+"""Inferior vena cava models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# IVC
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# IVC Enums
+#------------------------------------------------------------------------------
+class IVCSizeEnum(str, Enum):
+    """Enumeration for Inferior Vena Cava size assessment."""
+    NORMAL = "Normal"
+    SMALL = "Small"
+    DILATED = "Dilated"
+    PLETHORIC = "Plethoric"
+    NOT_ASSESSED = "Not Assessed"
+
+class IVCRespiratoryVariationEnum(str, Enum):
+    """Enumeration for IVC respiratory variation assessment."""
+    GREATER_THAN_50 = ">50%"
+    LESS_THAN_50 = "<50%"
+    GREATER_THAN_30 = ">30%" # Added based on common practice, though not in JSON enum
+    LESS_THAN_30 = "<30%"   # Added based on common practice, though not in JSON enum
+    ABSENT = "Absent"
+    NOT_ASSESSED = "Not Assessed"
+
+class IVCPlethoraEnum(str, Enum):
+    """Enumeration for visual assessment of IVC plethora."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class IVCSniffTestResultEnum(str, Enum):
+    """Enumeration for the result of the IVC sniff test."""
+    NORMAL_COLLAPSE = "Normal Collapse"
+    REDUCED_COLLAPSE = "Reduced Collapse"
+    NO_COLLAPSE = "No Collapse"
+    NOT_PERFORMED = "Not Performed"
+    NOT_ASSESSED = "Not Assessed"
+
+#------------------------------------------------------------------------------
+# IVC Assessment Models
+#------------------------------------------------------------------------------
+class IVCAssessment(BaseModel):
+    """Overall assessment of the IVC."""
+    model_config = common_model_config
+
+    size: IVCSizeEnum = Field(
+        default=IVCSizeEnum.NOT_ASSESSED,
+        description="Inferior Vena Cava size based on diameter and collapsibility"
+    )
+    respiratory_variation: IVCRespiratoryVariationEnum = Field(
+        default=IVCRespiratoryVariationEnum.NOT_ASSESSED,
+        description="Collapsibility index with respiratory effort"
+    )
+    ivc_plethora: IVCPlethoraEnum = Field(
+        default=IVCPlethoraEnum.NOT_ASSESSED,
+        description="Visual assessment of IVC plethora (lack of inspiratory collapse)"
+    )
+    sniff_test_result: IVCSniffTestResultEnum = Field(
+        default=IVCSniffTestResultEnum.NOT_ASSESSED,
+        description="Visual result of IVC collapse with a sniff maneuver"
+    )
+
+#------------------------------------------------------------------------------
+# IVC Measurement Models
+#------------------------------------------------------------------------------
+class IVCMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the IVC."""
+    model_config = common_model_config
+
+    diameter: MeasurementValue = Field(
+        default="Not Measured",
+        description="Inferior Vena Cava maximal diameter (end-expiration)",
+        unit="cm",
+        range=(0.5, 4.0)
+    )
+    collapsibility_index: MeasurementValue = Field(
+        default="Not Measured",
+        description="Percent reduction in IVC diameter during inspiration",
+        unit="%",
+        range=(0, 100)
+    )
+
+
+#------------------------------------------------------------------------------
+# IVC Root
+#------------------------------------------------------------------------------
+class IVC(BaseModel):
+    """Top-level model for the IVC section of the echo report."""
+    model_config = common_model_config
+
+    assessment: IVCAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the IVC"
+    )
+    measurements: IVCMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the IVC"
+    )
@@ -0,0 +1,246 @@
+"""Left atrium models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# Left Atrium
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Left Atrium Enums
+#------------------------------------------------------------------------------
+class LASizeEnum(str, Enum):
+    """Enumeration for Left Atrium size assessment."""
+    NORMAL = "Normal"
+    TOP_NORMAL = "Top Normal"
+    ENLARGED = "Enlarged"
+    MILD_ENLARGED = "Mild Enlarged"
+    MODERATE_ENLARGED = "Moderate Enlarged"
+    SEVERELY_ENLARGED = "Severe Enlarged"
+    NOT_ASSESSED = "Not Assessed"
+
+class LASpontaneousEchoContrastEnum(str, Enum):
+    """Enumeration for presence and severity of spontaneous echo contrast (SEC or 'smoke') in LA."""
+    NO = "No"
+    MILD = "Mild"
+    MODERATE = "Moderate"
+    SEVERE = "Severe"
+    NOT_ASSESSED = "Not Assessed"
+
+class LAClotPresenceEnum(str, Enum):
+    """Enumeration for presence of thrombus in Left Atrium."""
+    NO = "No"
+    SMALL = "Small"
+    LARGE = "Large"
+    NOT_ASSESSED = "Not Assessed"
+
+class LAACSpontaneousEchoContrastEnum(str, Enum):
+    """Enumeration for presence and severity of spontaneous echo contrast (SEC or 'smoke') in LAA."""
+    NO = "No"
+    MILD = "Mild"
+    MODERATE = "Moderate"
+    SEVERE = "Severe"
+    NOT_ASSESSED = "Not Assessed"
+
+class LAACClotPresenceEnum(str, Enum):
+    """Enumeration for presence of clot in LAA."""
+    NO = "No"
+    SMALL = "Small"
+    LARGE = "Large"
+    NOT_ASSESSED = "Not Assessed"
+
+class LAACClosedInPreviousSurgeryEnum(str, Enum):
+    """Enumeration for previous surgical closure of LAA."""
+    YES = "Yes"
+    PARTIAL = "Partial"
+    NO = "No"
+    UNKNOWN = "Unknown"
+    NOT_ASSESSED = "Not Assessed"
+
+
+#------------------------------------------------------------------------------
+# Left Atrium Assessment Models
+#------------------------------------------------------------------------------
+class LAAppendageAssessment(BaseModel):
+    """Model for Left Atrial Appendage assessment details."""
+    model_config = common_model_config
+
+    spontaneous_echo_contrast: LAACSpontaneousEchoContrastEnum = Field(
+        default=LAACSpontaneousEchoContrastEnum.NOT_ASSESSED,
+        alias="Spontaneous Echo Contrast",
+        description="Presence and severity of spontaneous echo contrast (SEC or 'smoke') in LAA"
+    )
+    clot: LAACClotPresenceEnum = Field(
+        default=LAACClotPresenceEnum.NOT_ASSESSED,
+        description="Presence of clot in LAA"
+    )
+    closed_in_previous_surgery: LAACClosedInPreviousSurgeryEnum = Field(
+        default=LAACClosedInPreviousSurgeryEnum.NOT_ASSESSED,
+        alias="Closed in Previous Surgery",
+        description="Previous surgical closure of LAA"
+    )
+
+
+class LAAssessment(BaseModel):
+    """Overall assessment of the Left Atrium."""
+    model_config = common_model_config
+
+    size: LASizeEnum = Field(
+        default=LASizeEnum.NOT_ASSESSED,
+        description="Left Atrium size assessment"
+    )
+    spontaneous_echo_contrast: LASpontaneousEchoContrastEnum = Field(
+        default=LASpontaneousEchoContrastEnum.NOT_ASSESSED,
+        alias="Spontaneous Echo Contrast (Smoke)",
+        description="Presence and severity of spontaneous echo contrast (SEC or 'smoke')"
+    )
+    clot: LAClotPresenceEnum = Field(
+        default=LAClotPresenceEnum.NOT_ASSESSED,
+        description="Presence of thrombus in Left Atrium"
+    )
+    appendage: LAAppendageAssessment = Field(
+        default_factory=LAAppendageAssessment,
+        alias="Appendage (LAA)",
+        description="Left Atrial Appendage assessment details"
+    )
+
+
+#------------------------------------------------------------------------------
+# Left Atrium Measurement Models
+#------------------------------------------------------------------------------
+class LAVolumes(RangeCheckedModel):
+    """Quantitative measurements of Left Atrial volumes."""
+    model_config = common_model_config
+
+    biplane_volume: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Biplane Volume",
+        description="Left Atrial Volume",
+        unit="cc",
+        range=(10, 250)
+    )
+    volume_4ch_view: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Volume (4Ch View)",
+        description="Left Atrial Volume from 4-Chamber View",
+        unit="cc",
+        range=(10, 250)
+    )
+    volume_2ch_view: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Volume (2Ch View)",
+        description="Left Atrial Volume from 2-Chamber View",
+        unit="cc",
+        range=(10, 250)
+    )
+
+
+class LAFunctionIndices(RangeCheckedModel):
+    """Quantitative measurements of Left Atrial function indices."""
+    model_config = common_model_config
+
+    la_ef: MeasurementValue = Field(
+        default="Not Measured",
+        alias="LA EF",
+        description="Left Atrial Ejection Fraction",
+        unit="%",
+        range=(10, 90)
+    )
+    active_ef: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Active EF",
+        description="Active Ejection Fraction",
+        unit="%",
+        range=(5, 60)
+    )
+    passive_ef: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Passive EF",
+        description="Passive Ejection Fraction",
+        unit="%",
+        range=(5, 60)
+    )
+
+
+class LAStrainMeasures(RangeCheckedModel):
+    """Quantitative measurements of Left Atrial strain."""
+    model_config = common_model_config
+
+    global_strain_2d_ste: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Global Strain (2D-STE)",
+        description="Global Strain by 2D Speckle Tracking Echocardiography",
+        unit="%",
+        range=(5, 60)
+    )
+
+
+class LAAppendageMeasurements(RangeCheckedModel):
+    """Quantitative measurements of Left Atrial Appendage."""
+    model_config = common_model_config
+
+    velocity: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Velocity",
+        description="Left Atrial Appendage velocity",
+        unit="cm/sec",
+        range=(10, 100)
+    )
+
+
+class LAMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the Left Atrium."""
+    model_config = common_model_config
+
+    diameter: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Diameter",
+        description="Left Atrial Diameter",
+        unit="cm",
+        range=(2.0, 7.0)
+    )
+    area: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Area",
+        description="Left Atrial Area",
+        unit="cm\u00b2",
+        range=(5.0, 60.0)
+    )
+    volumes: LAVolumes = Field(
+        default_factory=LAVolumes,
+        alias="Volumes",
+        description="Left Atrial volume measurements"
+    )
+    function_indices: LAFunctionIndices = Field(
+        default_factory=LAFunctionIndices,
+        alias="Function Indices",
+        description="Left Atrial function indices"
+    )
+    strain_measures: LAStrainMeasures = Field(
+        default_factory=LAStrainMeasures,
+        alias="Strain Measures",
+        description="Left Atrial strain measurements"
+    )
+    appendage: LAAppendageMeasurements = Field(
+        default_factory=LAAppendageMeasurements,
+        alias="Appendage (LAA)",
+        description="Quantitative measurements for Left Atrial Appendage"
+    )
+
+
+#------------------------------------------------------------------------------
+# Left Atrium Root
+#------------------------------------------------------------------------------
+class LeftAtrium(BaseModel):
+    """Top-level model for the Left Atrium section of the echo report."""
+    model_config = common_model_config
+
+    assessment: LAAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the Left Atrium"
+    )
+    measurements: LAMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the Left Atrium"
+    )
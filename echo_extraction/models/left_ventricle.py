@@ -0,0 +1,407 @@
+"""Left ventricle models."""
+from enum import Enum
+from typing import List
+from pydantic import BaseModel, Field, field_validator
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# Left Ventricle
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Left Ventricle Enums
+#------------------------------------------------------------------------------
+class LVSizeEnum(str, Enum):
+    """Enumeration for Left Ventricular size assessment."""
+    NORMAL = "Normal"
+    SMALL = "Small"
+    ENLARGED = "Enlarged"
+    MILD_ENLARGED = "Mild Enlarged"
+    MILD_TO_MODERATE_ENLARGED = "Mild to Moderate Enlarged"
+    MODERATE_ENLARGED = "Moderate Enlarged"
+    MODERATE_TO_SEVERE_ENLARGED = "Moderate to Severe Enlarged"
+    SEVERELY_ENLARGED = "Severe Enlarged"
+    NOT_ASSESSED = "Not Assessed"
+
+class LVSystolicFunctionEnum(str, Enum):
+    """Enumeration for Left Ventricular systolic function assessment."""
+    NORMAL = "Normal"
+    REDUCED = "Reduced"
+    MILDLY_REDUCED = "Mildly Reduced"
+    MILD_TO_MODERATELY_REDUCED = "Mild to Moderately Reduced"
+    MODERATELY_REDUCED = "Moderately Reduced"
+    MODERATE_TO_SEVERELY_REDUCED = "Moderate to Severely Reduced"
+    SEVERELY_REDUCED = "Severely Reduced"
+    NOT_ASSESSED = "Not Assessed"
+
+class LVDiastolicFunctionEnum(str, Enum):
+    """Enumeration for Left Ventricular diastolic function grade."""
+    NORMAL = "Normal"
+    GRADE_I = "Grade I" # Impaired Relaxation
+    GRADE_II = "Grade II" # Pseudonormal
+    GRADE_III = "Grade III" # Restrictive - Reversible
+    GRADE_IV = "Grade IV" # Restrictive - Irreversible
+    NOT_ASSESSED = "Not Assessed"
+
+class LVHypertrophyTypeEnum(str, Enum):
+    """Enumeration for Left Ventricular hypertrophy type."""
+    NO = "No"
+    CONCENTRIC_REMODELING = "Concentric Remodeling"
+    CONCENTRIC = "Concentric"
+    ECCENTRIC = "Eccentric"
+    NOT_ASSESSED = "Not Assessed"
+
+class LVHypertrophySeverityEnum(str, Enum):
+    """Enumeration for Left Ventricular hypertrophy severity."""
+    MILD = "Mild"
+    MILD_TO_MODERATE = "Mild to Moderate"
+    MODERATE = "Moderate"
+    MODERATE_TO_SEVERE = "Moderate to Severe"
+    SEVERE = "Severe"
+    NOT_ASSESSED = "Not Assessed"
+
+class LVWallMotionAbnormalityTypeEnum(str, Enum):
+    """Enumeration for Left Ventricular wall motion abnormality type."""
+    NO = "No"
+    GLOBAL_HYPOKINESIA = "Global Hypokinesia"
+    RWMA = "RWMA" # Regional Wall Motion Abnormality
+    NOT_ASSESSED = "Not Assessed"
+
+class LVWallMotionAbnormalityRegionEnum(str, Enum):
+    """Enumeration for Left Ventricular wall motion abnormality regions (AHA 17-segment model)."""
+    INFEROSEPTUM_BASE = "Inferoseptum_Base"
+    INFEROSEPTUM_MID = "Inferoseptum_Mid"
+    INFEROSEPTUM_APEX = "Inferoseptum_Apex"
+    ANTEROLATERAL_BASE = "Anterolateral_Base"
+    ANTEROLATERAL_MID = "Anterolateral_Mid"
+    ANTEROLATERAL_APEX = "Anterolateral_Apex"
+    INFERIOR_BASE = "Inferior_Base"
+    INFERIOR_MID = "Inferior_Mid"
+    INFERIOR_APEX = "Inferior_Apex"
+    ANTERIOR_BASE = "Anterior_Base"
+    ANTERIOR_MID = "Anterior_Mid"
+    ANTERIOR_APEX = "Anterior_Apex"
+    ANTEROSEPTUM_BASE = "Anteroseptum_Base"
+    ANTEROSEPTUM_MID = "Anteroseptum_Mid"
+    INFEROLATERAL_BASE = "Inferolateral_Base"
+    INFEROLATERAL_MID = "Inferolateral_Mid"
+    POSTERIOR_CIRCULATION = "Posterior Circulation"
+    INFERIOR_CIRCULATION = "Inferior Circulation"
+    NOT_ASSESSED = "Not Assessed"
+
+class LVClotPresenceEnum(str, Enum):
+    """Enumeration for presence of thrombus in Left Ventricle."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class LVASHPresenceEnum(str, Enum):
+    """Enumeration for presence of Asymmetric septal hypertrophy in Left Ventricle."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class LVEFMethodEnum(str, Enum):
+    """Enumeration for method of EF measurement."""
+    EYE_BALL = "Eye ball"
+    SIMPSON = "Simpson"
+
+
+#------------------------------------------------------------------------------
+# Left Ventricle Assessment Models
+#------------------------------------------------------------------------------
+class LVHypertrophy(BaseModel):
+    """Model for Left Ventricular hypertrophy assessment."""
+    model_config = common_model_config
+
+    type: LVHypertrophyTypeEnum = Field(
+        default=LVHypertrophyTypeEnum.NOT_ASSESSED,
+        description="Hypertrophy type assessment"
+    )
+    severity: LVHypertrophySeverityEnum = Field(
+        default=LVHypertrophySeverityEnum.NOT_ASSESSED,
+        description="Hypertrophy severity assessment"
+    )
+
+class LVWallMotionAbnormality(BaseModel):
+    """Model for Left Ventricular wall motion abnormality assessment."""
+    model_config = common_model_config
+
+    type: LVWallMotionAbnormalityTypeEnum = Field(
+        default=LVWallMotionAbnormalityTypeEnum.NOT_ASSESSED,
+        description="Wall motion abnormality type"
+    )
+    regions: List[LVWallMotionAbnormalityRegionEnum] = Field(
+        default_factory=lambda: [LVWallMotionAbnormalityRegionEnum.NOT_ASSESSED],
+        description="Wall motion abnormality regions"
+    )
+
+
+class LVAssessment(BaseModel):
+    """Overall assessment of the Left Ventricle."""
+    model_config = common_model_config
+
+    size: LVSizeEnum = Field(
+        default=LVSizeEnum.NOT_ASSESSED,
+        description="Left Ventricular size assessment"
+    )
+    systolic_function: LVSystolicFunctionEnum = Field(
+        default=LVSystolicFunctionEnum.NOT_ASSESSED,
+        description="Systolic function assessment"
+    )
+    diastolic_function: LVDiastolicFunctionEnum = Field(
+        default=LVDiastolicFunctionEnum.NOT_ASSESSED,
+        description="Diastolic function grade"
+    )
+    hypertrophy: LVHypertrophy = Field(
+        default_factory=LVHypertrophy,
+        description="Hypertrophy type and severity assessment"
+    )
+    wall_motion_abnormality: LVWallMotionAbnormality = Field(
+        default_factory=LVWallMotionAbnormality,
+        description="Wall motion abnormality assessment"
+    )
+    clot: LVClotPresenceEnum = Field(
+        default=LVClotPresenceEnum.NOT_ASSESSED,
+        description="Presence of thrombus in Left Ventricle"
+    )
+    ash: LVASHPresenceEnum = Field(
+        default=LVASHPresenceEnum.NOT_ASSESSED,
+        description="Presence of Asymmetric septal hypertrophy in Left Ventricle"
+    )
+
+
+#------------------------------------------------------------------------------
+# Left Ventricle Measurement Models
+#------------------------------------------------------------------------------
+
+class LVEjectionFraction(RangeCheckedModel):
+    """Quantitative measurements of Ejection Fraction."""
+    model_config = common_model_config
+
+    value: MeasurementValue = Field(
+        default="Not Measured",
+        description="Ejection Fraction (%)",
+        unit="%",
+        range=(5, 90)
+    )
+    method: LVEFMethodEnum = Field(
+        default=LVEFMethodEnum.SIMPSON,
+        description="Method of EF measurement"
+    )
+
+    # Field-level validator: If method is invalid, only default method
+    @field_validator("method", mode="before")
+    @classmethod
+    def validate_ef_method(cls, v, info):
+        """If method is invalid, return default method only for this field."""
+        valid_methods = [e.value for e in LVEFMethodEnum]
+        if v in valid_methods:
+            return v
+        return LVEFMethodEnum.SIMPSON
+
+class LVDiameters(RangeCheckedModel):
+    """Quantitative measurements of Left Ventricular diameters."""
+    model_config = common_model_config
+
+    lvedd: MeasurementValue = Field(
+        default="Not Measured",
+        description="LV End-Diastolic Diameter",
+        unit="cm",
+        range=(2, 9)
+    )
+    lvesd: MeasurementValue = Field(
+        default="Not Measured",
+        description="LV End-Systolic Diameter",
+        unit="cm",
+        range=(1, 8)
+    )
+    ivsd: MeasurementValue = Field(
+        default="Not Measured",
+        description="Interventricular Septum Diameter",
+        unit="cm",
+        range=(0.5, 3)
+    )
+    pwd: MeasurementValue = Field(
+        default="Not Measured",
+        description="Posterior Wall Diameter",
+        unit="cm",
+        range=(0.5, 3)
+    )
+
+
+class LVVolumes(RangeCheckedModel):
+    """Quantitative measurements of Left Ventricular volumes."""
+    model_config = common_model_config
+
+    lvedv: MeasurementValue = Field(
+        default="Not Measured",
+        description="Left Ventricle End-Diastolic Volume",
+        unit="cc",
+        range=(50, 300)
+    )
+    lvesv: MeasurementValue = Field(
+        default="Not Measured",
+        description="Left Ventricle End-Systolic Volume",
+        unit="cc",
+        range=(10, 200)
+    )
+    lveddi: MeasurementValue = Field(
+        default="Not Measured",
+        description="Left Ventricle End-Diastolic Diameter Index",
+        unit="cm/m\u00b2",
+        range=(2.0, 4.5)
+    )
+    lvedvi: MeasurementValue = Field(
+        default="Not Measured",
+        description="Left Ventricle End-Diastolic Volume Index",
+        unit="cc/m\u00b2",
+        range=(30, 150)
+    )
+
+
+class LVFunctionIndices(RangeCheckedModel):
+    """Quantitative measurements of Left Ventricular function indices."""
+    model_config = common_model_config
+
+    fs: MeasurementValue = Field(
+        default="Not Measured",
+        description="Fractional Shortening (%)",
+        unit="%",
+        range=(10, 50)
+    )
+    tei_index: MeasurementValue = Field(
+        default="Not Measured",
+        description="myocardial performance index",
+        range=(0, 1)
+    )
+    dp_dt: MeasurementValue = Field(
+        default="Not Measured",
+        description="Rate of rise of LV pressure during isovolumetric contraction",
+        range=(400, 3000)
+    )
+    sphericity_index: MeasurementValue = Field(
+        default="Not Measured",
+        description="sphericity index (Ratio comparing the LV's long and short axis dimensions)",
+        range=(0, 1)
+    )
+
+
+class LVStrainMeasures(RangeCheckedModel):
+    """Quantitative measurements of Left Ventricular strain."""
+    model_config = common_model_config
+
+    global_longitudinal_strain: MeasurementValue = Field(
+        default="Not Measured",
+        description="Average percentage of myocardial shortening in the longitudinal plane",
+        unit="%",
+        range=(-30, -5)
+    )
+    longitudinal_strain_4ch: MeasurementValue = Field(
+        default="Not Measured",
+        description="Strain measured in the apical four-chamber view",
+        unit="%",
+        range=(-30, -5)
+    )
+    longitudinal_strain_2ch: MeasurementValue = Field(
+        default="Not Measured",
+        description="Strain from the apical two-chamber view",
+        unit="%",
+        range=(-30, -5)
+    )
+    longitudinal_strain_apical_long_axis: MeasurementValue = Field(
+        default="Not Measured",
+        description="Strain from the apical long-axis (3-chamber) view",
+        unit="%",
+        range=(-30, -5)
+    )
+
+
+class LVRegionalWallMotionScore(RangeCheckedModel):
+    """Model for a single Regional Wall Motion Score."""
+    model_config = common_model_config
+
+    region: LVWallMotionAbnormalityRegionEnum = Field(
+        default=LVWallMotionAbnormalityRegionEnum.NOT_ASSESSED,
+        description="LV segment name (AHA 17-segment model)"
+    )
+    score: MeasurementValue = Field(
+        default="Not Measured",
+        description="Numeric score (1 = Normal, 2 = Hypokinetic, 3 = Severely Hypokinetic, 4 = Akinetic, 5 = Dyskinetic)",
+        range=(1, 5)
+    )
+
+class LVRegionalWallMotionScores(RangeCheckedModel):
+    """Quantitative measurements of Regional Wall Motion Scores."""
+    model_config = common_model_config
+
+    rwmsi: MeasurementValue = Field(
+        default="Not Measured",
+        description="Regional Wall Motion Score Index",
+        range=(1, 5)
+    )
+    rwms: List[LVRegionalWallMotionScore] = Field(
+        default_factory=lambda: [LVRegionalWallMotionScore(region=LVWallMotionAbnormalityRegionEnum.NOT_ASSESSED, score="Not Measured")],
+        description="Regional Wall Motion Scores"
+    )
+
+
+class LVMass(BaseModel):
+    """Quantitative measurement of Left Ventricular Mass."""
+    model_config = common_model_config
+
+    value: MeasurementValue = Field(
+        default="Not Measured",
+        description="Left Ventricular Mass",
+        unit="gr"
+    )
+
+
+class LVMeasurements(BaseModel):
+    """Quantitative measurements related to the Left Ventricle."""
+    model_config = common_model_config
+
+    ef: LVEjectionFraction = Field(
+        default_factory=LVEjectionFraction,
+        description="Ejection Fraction details"
+    )
+    diameter: LVDiameters = Field(
+        default_factory=LVDiameters,
+        description="Left Ventricular diameter measurements"
+    )
+    volumes: LVVolumes = Field(
+        default_factory=LVVolumes,
+        description="Left Ventricular volume measurements"
+    )
+    function_indices: LVFunctionIndices = Field(
+        default_factory=LVFunctionIndices,
+        description="Left Ventricular function indices"
+    )
+    strain_measures: LVStrainMeasures = Field(
+        default_factory=LVStrainMeasures,
+        description="Left Ventricular strain measurements"
+    )
+    regional_wall_motion_scores: LVRegionalWallMotionScores = Field(
+        default_factory=LVRegionalWallMotionScores,
+        description="Regional Wall Motion Scores"
+    )
+    mass: LVMass = Field(
+        default_factory=LVMass,
+        description="Left Ventricular Mass"
+    )
+
+#------------------------------------------------------------------------------
+# Left Ventricle Root
+#------------------------------------------------------------------------------
+class LeftVentricle(BaseModel):
+    """Top-level model for the Left Ventricle section of the echo report."""
+    model_config = common_model_config
+
+    assessment: LVAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the Left Ventricle"
+    )
+    measurements: LVMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the Left Ventricle"
+    )
@@ -0,0 +1,375 @@
+"""Mitral valve models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import (
+    MeasurementValue,
+    common_model_config,
+    RangeCheckedModel,
+    PresenceEnum,
+    SeverityEnum,
+    ProstheticTypeEnum,
+    FunctionEnum,
+)
+
+#------------------------------------------------------------------------------
+# Mitral Valve
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Mitral Enums
+#------------------------------------------------------------------------------
+class MitralShapeEnum(str, Enum):
+    NORMAL = "Normal"
+    THICKENED = "Thickened"
+    CALCIFIED = "Calcified"
+    PROLAPTIC = "Prolaptic"
+    MYXOMATOUS = "Myxomatous"
+    REPAIRED = "Repaired"
+    FLAIL = "Flail"
+    NOT_ASSESSED = "Not Assessed"
+
+class SAMEnum(str, Enum):
+    NO = "No"
+    MILD = "Mild"
+    MODERATE = "Moderate"
+    SEVERE = "Severe"
+    NOT_ASSESSED = "Not Assessed"
+
+
+#------------------------------------------------------------------------------
+# Mitral Valve Assessment Models
+#------------------------------------------------------------------------------
+class MitralStenosis(BaseModel):
+    """Model for mitral stenosis assessment."""
+    model_config = common_model_config
+
+    severity: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of Mitral Stenosis"
+    )
+
+
+class MitralRegurgitation(BaseModel):
+    """Model for mitral regurgitation assessment."""
+    model_config = common_model_config
+
+    severity: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of MR"
+    )
+    paravalvular_leak: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        alias="Paravalvular Leak",
+        description="Severity of paravalvular leak"
+    )
+    transvalvular_leak: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        alias="Transvalvular Leak",
+        description="Severity of transvalvular leak"
+    )
+
+
+class MitralProsthetic(BaseModel):
+    """Model for mitral prosthetic valve assessment."""
+    model_config = common_model_config
+
+    present: PresenceEnum = Field(
+        default=PresenceEnum.NOT_ASSESSED,
+        description="Presence of a mitral prosthetic valve"
+    )
+    type: ProstheticTypeEnum = Field(
+        default=ProstheticTypeEnum.NOT_ASSESSED,
+        description="Type of mitral prosthetic valve"
+    )
+    function: FunctionEnum = Field(
+        default=FunctionEnum.NOT_ASSESSED,
+        description="Function of the mitral prosthetic valve"
+    )
+
+
+#------------------------------------------------------------------------------
+# Full Mitral Valve Assessment Root
+#------------------------------------------------------------------------------
+class MitralValveAssessment(BaseModel):
+    """Overall assessment of the mitral valve."""
+    model_config = common_model_config
+
+    shape: MitralShapeEnum = Field(
+        default=MitralShapeEnum.NOT_ASSESSED,
+        description="Anatomical state of the mitral valve"
+    )
+    sam: SAMEnum = Field(
+        default=SAMEnum.NOT_ASSESSED,
+        alias="SAM", # Explicit alias needed as generator would make it "Sam"
+        description="Systolic Anterior Motion of the mitral valve"
+    )
+    stenosis: MitralStenosis = Field(
+        default_factory=lambda: MitralStenosis(),
+        description="Mitral stenosis assessment"
+    )
+    regurgitation: MitralRegurgitation = Field(
+        default_factory=lambda: MitralRegurgitation(),
+        description="Mitral regurgitation assessment"
+    )
+    prosthetic: MitralProsthetic = Field(
+        default_factory=lambda: MitralProsthetic(),
+        description="Mitral prosthetic valve assessment"
+    )
+
+
+#------------------------------------------------------------------------------
+# Mitral Valve Measurements
+#------------------------------------------------------------------------------
+class MitralDimensions(RangeCheckedModel):
+    """Quantitative measurements of mitral valve dimensions."""
+    model_config = common_model_config
+
+    annulus_diameter: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Annulus Diameter",
+        description="Mitral annulus diameter",
+        unit="cm",
+        range=(2.0, 5.0)
+    )
+    amvl_length: MeasurementValue = Field(
+        default="Not Measured",
+        alias="AMVL Length",
+        description="Anterior Mitral Valve Leaflet length",
+        unit="cm",
+        range=(1.5, 4.0)
+    )
+    pmvl_length: MeasurementValue = Field(
+        default="Not Measured",
+        alias="PMVL Length",
+        description="Posterior Mitral Valve Leaflet length",
+        unit="cm",
+        range=(1.5, 4.0)
+    )
+
+
+class MitralRegurgitationParameters(RangeCheckedModel):
+    """Quantitative measurements related to mitral regurgitation."""
+    model_config = common_model_config
+
+    mr_rv: MeasurementValue = Field(
+        default="Not Measured",
+        alias="MR RV",
+        description="Mitral Regurgitation Regurgitant Volume",
+        unit="ml",
+        range=(1.0, 200.0)
+    )
+    mr_roa: MeasurementValue = Field(
+        default="Not Measured",
+        alias="MR ROA",
+        description="Mitral Regurgitation Regurgitant Orifice Area",
+        unit="cm²",
+        range=(0.01, 1.5)
+    )
+    mr_vc_area: MeasurementValue = Field(
+        default="Not Measured",
+        alias="MR VC Area",
+        description="Mitral Regurgitation Vena Contracta Area",
+        unit="cm²",
+        range=(0.01, 1.0)
+    )
+
+
+class MitralStenosisGradients(RangeCheckedModel):
+    """Quantitative measurements of mitral valve stenosis gradients."""
+    model_config = common_model_config
+
+    mean_gradient: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Mean Gradient",
+        description="Mitral valve mean pressure gradient",
+        unit="mmHg",
+        range=(0.0, 40.0)
+    )
+    pht: MeasurementValue = Field(
+        default="Not Measured",
+        # No alias needed, generator handles "Pht"
+        description="Mitral valve Pressure Half-Time",
+        unit="ms",
+        range=(30.0, 400.0)
+    )
+
+
+class MorphoFunctionalIndices(RangeCheckedModel):
+    """Quantitative morpho-functional measurements of the mitral valve."""
+    model_config = common_model_config
+
+    tenting_area: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Tenting Area",
+        description="Mitral valve tenting area",
+        unit="cm²",
+        range=(0.0, 6.0)
+    )
+    coaptation_depth: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Coaptation Depth",
+        description="Mitral valve coaptation depth",
+        unit="mm",
+        range=(0.0, 20.0)
+    )
+    ivrt: MeasurementValue = Field(
+        default="Not Measured",
+        description="Isovolumetric Relaxation Time",
+        unit="ms",
+        range=(0.0, 150.0)
+    )
+
+
+class MitralDopplerMeasurements(RangeCheckedModel):
+    """Quantitative Doppler measurements related to the mitral valve (Diastolic Function)."""
+    model_config = common_model_config
+
+    e_septal: MeasurementValue = Field(
+        default="Not Measured",
+        alias="E Septal",
+        description="Mitral annular E' velocity (septal)",
+        unit="cm/sec",
+        range=(2.0, 16.0)
+    )
+    e_lateral: MeasurementValue = Field(
+        default="Not Measured",
+        alias="E Lateral",
+        description="Mitral annular E' velocity (lateral)",
+        unit="cm/sec",
+        range=(4.0, 20.0)
+    )
+    a: MeasurementValue = Field(
+        default="Not Measured",
+        alias="A", # Explicit alias needed as generator would make it "A"
+        description="Mitral valve A wave velocity",
+        unit="cm/sec",
+        range=(2.0, 14.0)
+    )
+    s: MeasurementValue = Field(
+        default="Not Measured",
+        alias="S", # Explicit alias needed as generator would make it "S"
+        description="Pulmonary vein S wave velocity",
+        unit="cm/sec",
+        range=(5.0, 112.0)
+    )
+    mve: MeasurementValue = Field(
+        default="Not Measured",
+        alias="MVE", # Explicit alias needed as generator would make it "Mve"
+        description="Mitral Valve E wave velocity",
+        unit="m/s",
+        range=(0.3, 3.5)
+    )
+    vti: MeasurementValue = Field(
+        default="Not Measured",
+        alias="VTI", # Explicit alias needed as generator would make it "Vti"
+        description="Mitral Valve Velocity Time Integral",
+        unit="cm",
+        range=(5.0, 150.0)
+    )
+    vp: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Vp", # Explicit alias needed as generator would make it "Vp"
+        description="Propagation Velocity",
+        unit="cm/sec",
+        range=(20.0, 90.0)
+    )
+    e_a_ratio: MeasurementValue = Field(
+        default="Not Measured",
+        alias="E/A Ratio",
+        description="Ratio of Mitral valve E to A wave velocity",
+        range=(0.5, 5.0)
+    )
+    e_e_prime_ratio: MeasurementValue = Field(
+        default="Not Measured",
+        alias="E/e' Ratio",
+        description="Ratio of Mitral valve E wave to average annular E' velocity",
+        range=(3.0, 30.0)
+    )
+    deceleration_time: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Deceleration Time",
+        description="Mitral valve E wave deceleration time",
+        unit="ms",
+        range=(100.0, 400.0)
+    )
+
+
+class AnnulusMotion(RangeCheckedModel):
+    """Quantitative measurements of mitral annular motion."""
+    model_config = common_model_config
+
+    mapse: MeasurementValue = Field(
+        default="Not Measured",
+        alias="MAPSE", # Explicit alias needed as generator would make it "Mapse"
+        description="Mitral Annular Plane Systolic Excursion",
+        unit="cm",
+        range=(5.0, 25.0)
+    )
+    tmad: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TMAD", # Explicit alias needed as generator would make it "Tmad"
+        description="Tricuspid Annular Motion during Diastole (should this be Mitral? Assuming typo and keeping TMAD for now)",
+        unit="mm",
+        range=(5.0, 25.0)
+    )
+
+
+#------------------------------------------------------------------------------
+# Final MitralValveMeasurements Root
+#------------------------------------------------------------------------------
+class MitralValveMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the mitral valve."""
+    model_config = common_model_config
+
+    area: MeasurementValue = Field(
+        default="Not Measured",
+        description="Mitral Valve Area",
+        unit="cm²",
+        range=(0.5, 6.0)
+    )
+    dimensions: MitralDimensions = Field(
+        default_factory=MitralDimensions,
+        description="Mitral valve dimensions"
+    )
+    regurgitation_parameters: MitralRegurgitationParameters = Field(
+        default_factory=MitralRegurgitationParameters,
+        alias="Regurgitation Parameters",
+        description="Quantitative regurgitation parameters"
+    )
+    gradients: MitralStenosisGradients = Field(
+        default_factory=MitralStenosisGradients,
+        alias="Gradients (Mitral Stenosis Hemodynamics)",
+        description="Mitral valve gradients"
+    )
+    morpho_functional_indices: MorphoFunctionalIndices = Field(
+        default_factory=MorphoFunctionalIndices,
+        alias="Morpho-Functional Indices",
+        description="Quantitative morpho-functional indices"
+    )
+    doppler_measurements: MitralDopplerMeasurements = Field(
+        default_factory=MitralDopplerMeasurements,
+        alias="Doppler Measurements (Diastolic Function)",
+        description="Mitral Doppler measurements related to diastolic function"
+    )
+    annulus_motion: AnnulusMotion = Field(
+        default_factory=AnnulusMotion,
+        alias="Annulus Motion",
+        description="Mitral annular motion measurements"
+    )
+
+
+#------------------------------------------------------------------------------
+# Mitral Valve Root
+#------------------------------------------------------------------------------
+class MitralValve(BaseModel):
+    """Top-level model for the mitral valve section of the echo report."""
+    model_config = common_model_config
+
+    assessment: MitralValveAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the mitral valve"
+    )
+    measurements: MitralValveMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the mitral valve"
+    )
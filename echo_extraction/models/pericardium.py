@@ -0,0 +1,172 @@
+"""Pericardium models."""
+from enum import Enum
+from typing import List
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# Pericardium
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Pericardium Enums
+#------------------------------------------------------------------------------
+class PericardiumMorphologyEnum(str, Enum):
+    """Enumeration for pericardial morphology."""
+    NORMAL = "Normal"
+    THICKENED = "Thickened"
+    CALCIFIED = "Calcified"
+    ABSENT = "Absent"
+    NOT_ASSESSED = "Not Assessed"
+
+class EffusionPresenceEnum(str, Enum):
+    """Enumeration for presence assessment."""
+    NO = "No"
+    YES = "Yes"
+    NOT_ASSESSED = "Not Assessed"
+
+class EffusionSizeEnum(str, Enum):
+    """Enumeration for pericardial effusion size."""
+    SMALL = "Small"
+    SMALL_TO_MODERATE = "Small to Moderate"
+    MODERATE = "Moderate"
+    MODERATE_TO_LARGE = "Moderate to Large"
+    LARGE = "Large"
+    NOT_ASSESSED = "Not Assessed"
+
+class EffusionDistributionEnum(str, Enum):
+    """Enumeration for effusion distribution."""
+    CIRCUMFERENTIAL = "Circumferential"
+    POSTERIOR = "Posterior"
+    ANTERIOR = "Anterior"
+    LOCALIZED = "Localized"
+    NOT_ASSESSED = "Not Assessed"
+
+class EffusionHemodynamicImpactEnum(str, Enum):
+    """Enumeration for hemodynamic impact of effusion."""
+    NONE = "None"
+    TAMPONADE_PHYSIOLOGY = "Tamponade Physiology"
+    EFFUSIVE_CONSTRICTIVE = "Effusive-Constrictive"
+    NOT_ASSESSED = "Not Assessed"
+
+class ConstrictivePericarditisFeatureEnum(str, Enum):
+    """Enumeration for features of constrictive pericarditis."""
+    SEPTAL_BOUNCE = "Septal Bounce"
+    RESPIRATORY_VARIATION_IN_AV_INFLOW = "Respiratory Variation in AV inflow"
+    ANNULUS_REVERSUS = "Annulus Reversus"
+    ANNULUS_PARADOXUS = "Annulus Paradoxus"
+    DILATED_IVC_WITH_REDUCED_COLLAPSE = "Dilated IVC with Reduced Collapse"
+    NOT_ASSESSED = "Not Assessed"
+
+#------------------------------------------------------------------------------
+# Pericardium Assessment Models
+#------------------------------------------------------------------------------
+class Effusion(BaseModel):
+    """Model for pericardial effusion details."""
+    model_config = common_model_config
+
+    presence: EffusionPresenceEnum = Field(
+        default=EffusionPresenceEnum.NOT_ASSESSED,
+        description="Presence of pericardial effusion"
+    )
+    size: EffusionSizeEnum = Field(
+        default=EffusionSizeEnum.NOT_ASSESSED,
+        description="Size/grade of pericardial effusion"
+    )
+    distribution: EffusionDistributionEnum = Field(
+        default=EffusionDistributionEnum.NOT_ASSESSED,
+        description="Anatomical distribution of pericardial effusion"
+    )
+    hemodynamic_impact: EffusionHemodynamicImpactEnum = Field(
+        default=EffusionHemodynamicImpactEnum.NOT_ASSESSED,
+        description="Hemodynamic consequence of the effusion"
+    )
+
+class ConstrictivePericarditis(BaseModel):
+    """Model for assessment of constrictive pericarditis."""
+    model_config = common_model_config
+
+    presence: EffusionPresenceEnum = Field(
+        default=EffusionPresenceEnum.NOT_ASSESSED,
+        description="Presence of constrictive physiology"
+    )
+    features: List[ConstrictivePericarditisFeatureEnum] = Field(
+        default_factory=lambda: [ConstrictivePericarditisFeatureEnum.NOT_ASSESSED],
+        description="Echocardiographic features supportive of constriction"
+    )
+
+
+#------------------------------------------------------------------------------
+# Full Pericardium Assessment Root
+#------------------------------------------------------------------------------
+class PericardiumAssessment(BaseModel):
+    """Overall assessment of the pericardium."""
+    model_config = common_model_config
+
+    morphology: PericardiumMorphologyEnum = Field(
+        default=PericardiumMorphologyEnum.NOT_ASSESSED,
+        description="Anatomical state of the pericardium"
+    )
+    effusion: Effusion = Field(
+        default_factory=lambda: Effusion(),
+        description="Pericardial effusion details"
+    )
+    constrictive_pericarditis: ConstrictivePericarditis = Field(
+        default_factory=lambda: ConstrictivePericarditis(),
+        description="Assessment of constrictive pericarditis"
+    )
+
+#------------------------------------------------------------------------------
+# Pericardium Measurement Models
+#------------------------------------------------------------------------------
+class EffusionSizeMeasurement(RangeCheckedModel):
+    """Quantitative measurements of effusion size."""
+    model_config = common_model_config
+
+    posterior: MeasurementValue = Field(
+        default="Not Measured",
+        description="Measurement of effusion posterior to LV",
+        unit="mm",
+        range=(0, 50)
+    )
+    anterior: MeasurementValue = Field(
+        default="Not Measured",
+        description="Measurement of effusion anterior to RV",
+        unit="mm",
+        range=(0, 50)
+    )
+
+#------------------------------------------------------------------------------
+# Full Pericardium Measurements Root
+#------------------------------------------------------------------------------
+class PericardiumMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the pericardium."""
+    model_config = common_model_config
+
+    pericardial_thickness: MeasurementValue = Field(
+        default="Not Measured",
+        description="Thickness of pericardium",
+        unit="mm",
+        range=(0.5, 10.0)
+    )
+    effusion_size: EffusionSizeMeasurement = Field(
+        default_factory=EffusionSizeMeasurement,
+        description="Quantitative effusion measurements"
+    )
+
+
+#------------------------------------------------------------------------------
+# Pericardium Root
+#------------------------------------------------------------------------------
+class Pericardium(BaseModel):
+    """Top-level model for the pericardium section of the echo report."""
+    model_config = common_model_config
+
+    assessment: PericardiumAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the pericardium"
+    )
+    measurements: PericardiumMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the pericardium"
+    )
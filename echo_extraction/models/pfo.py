@@ -0,0 +1,118 @@
+"""Patent foramen ovale models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# PFO Enums
+#------------------------------------------------------------------------------
+class PFOPresenceEnum(str, Enum):
+    """Enumeration for PFO presence assessment."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class PFOSizeEnum(str, Enum):
+    """Enumeration for PFO size estimation."""
+    SMALL = "Small"
+    MODERATE = "Moderate"
+    LARGE = "Large"
+    NOT_ASSESSED = "Not Assessed"
+
+class PFOShuntDirectionEnum(str, Enum):
+    """Enumeration for PFO shunt direction."""
+    LEFT_TO_RIGHT = "Left to Right"
+    RIGHT_TO_LEFT = "Right to Left"
+    BIDIRECTIONAL = "Bidirectional"
+    NOT_ASSESSED = "Not Assessed"
+
+class PFOAssociatedAneurysmEnum(str, Enum):
+    """Enumeration for presence of associated atrial septal aneurysm with PFO."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class PFOBubbleStudyEnum(str, Enum):
+    """Enumeration for bubble study results for PFO."""
+    POSITIVE = "Positive"
+    NEGATIVE = "Negative"
+    NOT_PERFORMED = "Not Performed"
+    NOT_ASSESSED = "Not Assessed"
+
+class PFOAssociatedDefectsEnum(str, Enum):
+    """Enumeration for other structural anomalies associated with PFO."""
+    NONE = "None"
+    ASD = "ASD"
+    ANEURYSMAL_SEPTUM = "Aneurysmal Septum"
+    CHIARI_NETWORK = "Chiari Network"
+    OTHER = "Other"
+    NOT_ASSESSED = "Not Assessed"
+
+#------------------------------------------------------------------------------
+# PFO Assessment Models
+#------------------------------------------------------------------------------
+class PFOAssessment(BaseModel):
+    """Model for PFO assessment details."""
+    model_config = common_model_config
+
+    present: PFOPresenceEnum = Field(
+        default=PFOPresenceEnum.NOT_ASSESSED,
+        description="Presence of PFO"
+    )
+    size: PFOSizeEnum = Field(
+        default=PFOSizeEnum.NOT_ASSESSED,
+        description="Visual/quantitative estimation of PFO size"
+    )
+    shunt_direction: PFOShuntDirectionEnum = Field(
+        default=PFOShuntDirectionEnum.NOT_ASSESSED,
+        description="Direction of shunting through the PFO, may depend on provocative maneuvers"
+    )
+    associated_aneurysm: PFOAssociatedAneurysmEnum = Field(
+        default=PFOAssociatedAneurysmEnum.NOT_ASSESSED,
+        description="Presence of atrial septal aneurysm (ASA) associated with the PFO"
+    )
+    bubble_study: PFOBubbleStudyEnum = Field(
+        default=PFOBubbleStudyEnum.NOT_ASSESSED,
+        description="Result of contrast bubble test used to detect right-to-left shunt"
+    )
+    associated_defects: PFOAssociatedDefectsEnum = Field(
+        default=PFOAssociatedDefectsEnum.NOT_ASSESSED,
+        description="Other structural anomalies associated with PFO"
+    )
+
+#------------------------------------------------------------------------------
+# PFO Measurement Models
+#------------------------------------------------------------------------------
+class PFOMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the PFO."""
+    model_config = common_model_config
+
+    tunnel_length: MeasurementValue = Field(
+        default="Not Measured",
+        description="Length of the PFO tunnel measured in millimeters",
+        unit="mm",
+        range=(1.0, 20.0)
+    )
+    qp_qs: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary to systemic flow ratio",
+        range=(0.5, 5.0)
+    )
+
+
+#------------------------------------------------------------------------------
+# PFO Root
+#------------------------------------------------------------------------------
+class PFO(BaseModel):
+    """Top-level model for the PFO section of the echo report."""
+    model_config = common_model_config
+
+    assessment: PFOAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the PFO"
+    )
+    measurements: PFOMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the PFO"
+    )
@@ -0,0 +1,288 @@
+"""Pulmonary valve models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import (
+    MeasurementValue,
+    common_model_config,
+    RangeCheckedModel,
+    PresenceEnum,
+    SeverityEnum,
+    ProstheticTypeEnum,
+    FunctionEnum,
+)
+
+#------------------------------------------------------------------------------
+# Pulmonary Valve
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Pulmonary Enums
+#------------------------------------------------------------------------------
+class PulmonaryShapeEnum(str, Enum):
+    NORMAL = "Normal"
+    THICKENED = "Thickened"
+    HYPOPLASTIC = "Hypoplastic"
+    ATRETIC = "Atretic"
+    REPAIRED = "Repaired"
+    FLAIL = "Flail"
+    A_REMNANT = "A Remnant"
+    NOT_ASSESSED = "Not Assessed"
+
+
+#------------------------------------------------------------------------------
+# Pulmonary Valve Assessment Models
+#------------------------------------------------------------------------------
+class PulmonaryStenosis(BaseModel):
+    """Model for pulmonary stenosis assessment."""
+    model_config = common_model_config
+
+    severity: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of Pulmonary Stenosis"
+    )
+
+
+class PulmonaryRegurgitation(BaseModel):
+    """Model for pulmonary regurgitation assessment."""
+    model_config = common_model_config
+
+    severity: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of Pulmonary Regurgitation"
+    )
+    paravalvular_leak: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of paravalvular leak"
+    )
+    transvalvular_leak: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of transvalvular leak"
+    )
+
+
+class PulmonaryProsthetic(BaseModel):
+    """Model for pulmonary prosthetic valve assessment."""
+    model_config = common_model_config
+
+    present: PresenceEnum = Field(
+        default=PresenceEnum.NOT_ASSESSED,
+        description="Presence of a pulmonary prosthetic valve"
+    )
+    type: ProstheticTypeEnum = Field(
+        default=ProstheticTypeEnum.NOT_ASSESSED,
+        description="Type of pulmonary prosthetic valve"
+    )
+    function: FunctionEnum = Field(
+        default=FunctionEnum.NOT_ASSESSED,
+        description="Function of the pulmonary prosthetic valve"
+    )
+
+
+#------------------------------------------------------------------------------
+# Full PulmonaryValveAssessment Root
+#------------------------------------------------------------------------------
+class PulmonaryValveAssessment(BaseModel):
+    """Overall assessment of the pulmonary valve."""
+    model_config = common_model_config
+
+    shape: PulmonaryShapeEnum = Field(
+        default=PulmonaryShapeEnum.NOT_ASSESSED,
+        description="Anatomical state of the pulmonary valve"
+    )
+    stenosis: PulmonaryStenosis = Field(
+        default_factory=lambda: PulmonaryStenosis(),
+        description="Pulmonary stenosis assessment"
+    )
+    regurgitation: PulmonaryRegurgitation = Field(
+        default_factory=lambda: PulmonaryRegurgitation(),
+        description="Pulmonary regurgitation assessment"
+    )
+    prosthetic: PulmonaryProsthetic = Field(
+        default_factory=lambda: PulmonaryProsthetic(),
+        description="Pulmonary prosthetic valve assessment"
+    )
+
+
+#------------------------------------------------------------------------------
+# Pulmonary Valve Measurements
+#------------------------------------------------------------------------------
+class PulmonaryDimensions(RangeCheckedModel):
+    """Quantitative measurements of pulmonary artery dimensions."""
+    model_config = common_model_config
+
+    pa_annulus: MeasurementValue = Field(
+        default="Not Measured",
+        description="Measurement of the pulmonary artery annulus",
+        unit="cm",
+        range=(0.5, 4.0),
+        on_invalid="raise"
+    )
+    main_pa: MeasurementValue = Field(
+        default="Not Measured",
+        description="Measurement of the main pulmonary artery",
+        unit="cm",
+        range=(0.5, 5.0),
+        on_invalid="raise"
+    )
+    lpa_diameter: MeasurementValue = Field(
+        default="Not Measured",
+        description="Diameter of the left pulmonary artery",
+        unit="cm",
+        range=(0.2, 3.0),
+        on_invalid="raise"
+    )
+    rpa_diameter: MeasurementValue = Field(
+        default="Not Measured",
+        description="Diameter of the right pulmonary artery",
+        unit="cm",
+        range=(0.2, 3.0),
+        on_invalid="raise"
+    )
+
+
+class PulmonaryRegurgitationParameters(RangeCheckedModel):
+    """Quantitative measurements related to pulmonary regurgitation."""
+    model_config = common_model_config
+
+    pr_pht: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary regurgitation pressure half-time",
+        unit="ms",
+        range=(50, 800),
+        on_invalid="raise"
+    )
+
+
+class PulmonaryGradients(RangeCheckedModel):
+    """Quantitative measurements of pulmonary valve gradients."""
+    model_config = common_model_config
+
+    pv_peak_velocity: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary valve peak velocity",
+        unit="m/s",
+        range=(0.5, 8.0)
+    )
+    pv_ppg: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary valve peak pressure gradient",
+        unit="mmHg",
+        range=(0, 120.0)
+    )
+    pv_mpg: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary valve mean pressure gradient",
+        unit="mmHg",
+        range=(0, 80.0)
+    )
+
+
+class PulmonaryDopplerMeasurements(RangeCheckedModel):
+    """Quantitative Doppler measurements related to the pulmonary valve/RVOT."""
+    model_config = common_model_config
+
+    # Use snake_case, alias_generator handles "PV VTI", "RVOT VTI", etc.
+    pv_vti: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary valve Velocity Time Integral",
+        unit="cm",
+        range=(5.0, 30.0),
+        on_invalid="raise"
+    )
+    rvot_vti: MeasurementValue = Field(
+        default="Not Measured",
+        description="Right Ventricular Outflow Tract Velocity Time Integral",
+        unit="cm",
+        range=(5.0, 30.0),
+        on_invalid="raise"
+    )
+    pulmonary_acc_time: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary acceleration time",
+        unit="ms",
+        range=(30, 200),
+        on_invalid="raise"
+    )
+
+
+class PulmonaryHemodynamicPressures(RangeCheckedModel):
+    """Estimated hemodynamic pressures related to the pulmonary circulation."""
+    model_config = common_model_config
+
+    mean_pap: MeasurementValue = Field(
+        default="Not Measured",
+        description="Estimated mean pulmonary artery pressure",
+        unit="mmHg",
+        range=(5, 70),
+        on_invalid="raise"
+    )
+    ra_pressure: MeasurementValue = Field(
+        default="Not Measured",
+        description="Estimated right atrial pressure",
+        unit="mmHg",
+        range=(0, 20),
+        on_invalid="raise"
+    )
+    # RVSP and PAP are already snake_case
+    rvsp: MeasurementValue = Field(
+        default="Not Measured",
+        description="Estimated right ventricular systolic pressure",
+        unit="mmHg",
+        range=(10, 120),
+        on_invalid="raise"
+    )
+    pap: MeasurementValue = Field(
+        default="Not Measured",
+        description="Estimated pulmonary artery pressure",
+        unit="mmHg",
+        range=(10, 120),
+        on_invalid="raise"
+    )
+
+
+#------------------------------------------------------------------------------
+# Full PulmonaryValveMeasurements Root
+#------------------------------------------------------------------------------
+class PulmonaryValveMeasurements(BaseModel):
+    """Quantitative measurements related to the pulmonary valve."""
+    model_config = common_model_config
+
+    dimensions: PulmonaryDimensions = Field(
+        default_factory=PulmonaryDimensions,
+        description="Pulmonary artery dimensions"
+    )
+    regurgitation_parameters: PulmonaryRegurgitationParameters = Field(
+        default_factory=PulmonaryRegurgitationParameters,
+        description="Quantitative regurgitation parameters"
+    )
+    gradients: PulmonaryGradients = Field(
+        default_factory=PulmonaryGradients,
+        alias="Gradients (Pulmonary Valve Stenosis Hemodynamics)",
+        description="Pulmonary valve gradients"
+    )
+    doppler_measurements: PulmonaryDopplerMeasurements = Field(
+        default_factory=PulmonaryDopplerMeasurements,
+        description="Pulmonary Doppler measurements"
+    )
+    hemodynamic_pressures: PulmonaryHemodynamicPressures = Field(
+        default_factory=PulmonaryHemodynamicPressures,
+        description="Estimated hemodynamic pressures"
+    )
+
+
+#------------------------------------------------------------------------------
+# Pulmonary Valve Root
+#------------------------------------------------------------------------------
+class PulmonaryValve(BaseModel):
+    """Top-level model for the pulmonary valve section of the echo report."""
+    model_config = common_model_config
+
+    # Use lowercase field names to match Pericardium root
+    assessment: PulmonaryValveAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the pulmonary valve"
+    )
+    measurements: PulmonaryValveMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the pulmonary valve"
+    )
@@ -0,0 +1,101 @@
+"""Pulmonic vein models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# Pulmonic Vein
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Pulmonic Vein Enums
+#------------------------------------------------------------------------------
+class PulmonicVeinVenousDrainageEnum(str, Enum):
+    """Enumeration for pulmonary venous drainage pattern."""
+    NORMAL = "Normal"
+    ABNORMAL = "Abnormal"
+    NOT_ASSESSED = "Not Assessed"
+
+class PulmonicVeinInflowPatternEnum(str, Enum):
+    """Enumeration for pulmonary vein inflow pattern based on Doppler."""
+    S_GREATER_THAN_D = "S > D"
+    S_EQUALS_D = "S = D"
+    S_LESS_THAN_D = "S < D"
+    BLUNTED_S_WAVE = "Blunted S Wave"
+    SYSTOLIC_FLOW_REVERSAL = "Systolic Flow Reversal"
+    NOT_ASSESSED = "Not Assessed"
+
+#------------------------------------------------------------------------------
+# Pulmonic Vein Assessment Models
+#------------------------------------------------------------------------------
+class PulmonicVeinAssessment(BaseModel):
+    """Overall assessment of the pulmonic veins."""
+    model_config = common_model_config
+
+    venous_drainage: PulmonicVeinVenousDrainageEnum = Field(
+        default=PulmonicVeinVenousDrainageEnum.NOT_ASSESSED,
+        description="Pattern of pulmonary venous drainage into the left atrium"
+    )
+    inflow_pattern: PulmonicVeinInflowPatternEnum = Field(
+        default=PulmonicVeinInflowPatternEnum.NOT_ASSESSED,
+        description="Pulmonary vein flow pattern based on spectral Doppler (S and D wave relationship)"
+    )
+
+#------------------------------------------------------------------------------
+# Pulmonic Vein Measurement Models
+#------------------------------------------------------------------------------
+class PulmonicVeinDopplerMeasurements(RangeCheckedModel):
+    """Quantitative Doppler measurements for pulmonic veins."""
+    model_config = common_model_config
+
+    peak_s_velocity: MeasurementValue = Field(
+        default="Not Measured",
+        description="Peak systolic (S wave) flow velocity",
+        unit="cm/sec",
+        range=(10, 150)
+    )
+    peak_d_velocity: MeasurementValue = Field(
+        default="Not Measured",
+        description="Peak diastolic (D wave) flow velocity",
+        unit="cm/sec",
+        range=(10, 150)
+    )
+    peak_ar_velocity: MeasurementValue = Field(
+        default="Not Measured",
+        description="Peak Atrial Reversal (AR wave) velocity",
+        unit="cm/sec",
+        range=(5, 100)
+    )
+
+
+class PulmonicVeinMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the pulmonic veins."""
+    model_config = common_model_config
+
+    doppler_measurements: PulmonicVeinDopplerMeasurements = Field(
+        default_factory=PulmonicVeinDopplerMeasurements,
+        description="Quantitative Doppler measurements for pulmonic veins"
+    )
+    ar_duration: MeasurementValue = Field(
+        default="Not Measured",
+        description="Duration of atrial reversal wave (AR) in milliseconds",
+        unit="ms",
+        range=(10, 300)
+    )
+
+
+#------------------------------------------------------------------------------
+# Pulmonic Vein Root
+#------------------------------------------------------------------------------
+class PulmonicVein(BaseModel):
+    """Top-level model for the pulmonic vein section of the echo report."""
+    model_config = common_model_config
+
+    assessment: PulmonicVeinAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the pulmonic veins"
+    )
+    measurements: PulmonicVeinMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the pulmonic veins"
+    )
@@ -0,0 +1,238 @@
+"""Right atrium models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# Right Atrium
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Right Atrium Enums
+#------------------------------------------------------------------------------
+class RASizeEnum(str, Enum):
+    """Enumeration for Right Atrium size assessment."""
+    NORMAL = "Normal"
+    TOP_NORMAL = "Top Normal"
+    ENLARGED = "Enlarged"
+    MILD_ENLARGED = "Mild Enlarged"
+    MODERATE_ENLARGED = "Moderate Enlarged"
+    SEVERELY_ENLARGED = "Severe Enlarged"
+    NOT_ASSESSED = "Not Assessed"
+
+class RASpontaneousEchoContrastEnum(str, Enum):
+    """Enumeration for presence and severity of spontaneous echo contrast (SEC or 'smoke') in RA."""
+    NO = "No"
+    MILD = "Mild"
+    MODERATE = "Moderate"
+    SEVERE = "Severe"
+    NOT_ASSESSED = "Not Assessed"
+
+class RAClotPresenceEnum(str, Enum):
+    """Enumeration for presence of thrombus in Right Atrium."""
+    NO = "No"
+    SMALL = "Small"
+    LARGE = "Large"
+    NOT_ASSESSED = "Not Assessed"
+
+class RAASpontaneousEchoContrastEnum(str, Enum):
+    """Enumeration for presence and severity of spontaneous echo contrast (SEC or 'smoke') in RAA."""
+    NO = "No"
+    MILD = "Mild"
+    MODERATE = "Moderate"
+    SEVERE = "Severe"
+    NOT_ASSESSED = "Not Assessed"
+
+class RAACClotPresenceEnum(str, Enum):
+    """Enumeration for presence of clot in RAA."""
+    NO = "No"
+    SMALL = "Small"
+    LARGE = "Large"
+    NOT_ASSESSED = "Not Assessed"
+
+class RAACClosedInPreviousSurgeryEnum(str, Enum):
+    """Enumeration for previous surgical closure of RAA."""
+    YES = "Yes"
+    PARTIAL = "Partial"
+    NO = "No"
+    UNKNOWN = "Unknown"
+    NOT_ASSESSED = "Not Assessed"
+
+
+#------------------------------------------------------------------------------
+# Right Atrium Assessment Models
+#------------------------------------------------------------------------------
+class RAAppendageAssessment(BaseModel):
+    """Model for Right Atrial Appendage assessment details."""
+    model_config = common_model_config
+
+    spontaneous_echo_contrast: RAASpontaneousEchoContrastEnum = Field(
+        default=RAASpontaneousEchoContrastEnum.NOT_ASSESSED,
+        alias="Spontaneous Echo Contrast",
+        description="Presence and severity of spontaneous echo contrast (SEC or 'smoke') in RAA"
+    )
+    clot: RAACClotPresenceEnum = Field(
+        default=RAACClotPresenceEnum.NOT_ASSESSED,
+        description="Presence of clot in RAA"
+    )
+    closed_in_previous_surgery: RAACClosedInPreviousSurgeryEnum = Field(
+        default=RAACClosedInPreviousSurgeryEnum.NOT_ASSESSED,
+        alias="Closed in Previous Surgery",
+        description="Previous surgical closure of RAA"
+    )
+
+
+class RAAssessment(BaseModel):
+    """Overall assessment of the Right Atrium."""
+    model_config = common_model_config
+
+    size: RASizeEnum = Field(
+        default=RASizeEnum.NOT_ASSESSED,
+        description="Right Atrium size assessment"
+    )
+    spontaneous_echo_contrast: RASpontaneousEchoContrastEnum = Field(
+        default=RASpontaneousEchoContrastEnum.NOT_ASSESSED,
+        alias="Spontaneous Echo Contrast (Smoke)",
+        description="Presence and severity of spontaneous echo contrast (SEC or 'smoke')"
+    )
+    clot: RAClotPresenceEnum = Field(
+        default=RAClotPresenceEnum.NOT_ASSESSED,
+        description="Presence of thrombus in Right Atrium"
+    )
+    appendage: RAAppendageAssessment = Field(
+        default_factory=RAAppendageAssessment,
+        alias="Appendage (RAA)",
+        description="Right Atrial Appendage assessment details"
+    )
+
+
+#------------------------------------------------------------------------------
+# Right Atrium Measurement Models
+#------------------------------------------------------------------------------
+class RAVolumes(RangeCheckedModel):
+    """Quantitative measurements of Right Atrial volumes."""
+    model_config = common_model_config
+
+    volume_4ch_view: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Volume (4Ch View)",
+        description="Right Atrial Volume from 4-Chamber Apical View",
+        unit="cc",
+        range=(10, 250),
+        on_invalid="raise"
+    )
+
+
+class RAFunctionIndices(RangeCheckedModel):
+    """Quantitative measurements of Right Atrial function indices."""
+    model_config = common_model_config
+
+    ra_ef: MeasurementValue = Field(
+        default="Not Measured",
+        alias="RA EF",
+        description="Right Atrial Ejection Fraction",
+        unit="%",
+        range=(10, 90),
+        on_invalid="raise"
+    )
+    active_ef: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Active EF",
+        description="Active Ejection Fraction",
+        unit="%",
+        range=(5, 60),
+        on_invalid="raise"
+    )
+    passive_ef: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Passive EF",
+        description="Passive Ejection Fraction",
+        unit="%",
+        range=(5, 60),
+        on_invalid="raise"
+    )
+
+
+class RAStrainMeasures(RangeCheckedModel):
+    """Quantitative measurements of Right Atrial strain."""
+    model_config = common_model_config
+
+    global_strain_2d_ste: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Global Strain (2D-STE)",
+        description="Global Strain by 2D Speckle Tracking Echocardiography",
+        unit="%",
+        range=(5, 60),
+        on_invalid="raise"
+    )
+
+
+class RAAppendageMeasurements(RangeCheckedModel):
+    """Quantitative measurements of Right Atrial Appendage."""
+    model_config = common_model_config
+
+    velocity: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Velocity",
+        description="Right Atrial Appendage velocity",
+        unit="cm/sec",
+        range=(10, 100),
+        on_invalid="raise"
+    )
+
+
+class RAMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the Right Atrium."""
+    model_config = common_model_config
+
+    diameter: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Diameter",
+        description="Right Atrial Diameter",
+        unit="cm",
+        range=(2.0, 7.0)
+    )
+    area: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Area",
+        description="Right Atrial Area",
+        unit="cm\u00b2",
+        range=(5.0, 60.0)
+    )
+    volumes: RAVolumes = Field(
+        default_factory=RAVolumes,
+        alias="Volumes",
+        description="Right Atrial volume measurements"
+    )
+    function_indices: RAFunctionIndices = Field(
+        default_factory=RAFunctionIndices,
+        alias="Function Indices",
+        description="Right Atrial function indices"
+    )
+    strain_measures: RAStrainMeasures = Field(
+        default_factory=RAStrainMeasures,
+        alias="Strain Measures",
+        description="Right Atrial strain measurements"
+    )
+    appendage: RAAppendageMeasurements = Field(
+        default_factory=RAAppendageMeasurements,
+        alias="Appendage (RAA)",
+        description="Quantitative measurements for Right Atrial Appendage"
+    )
+
+
+#------------------------------------------------------------------------------
+# Right Atrium Root
+#------------------------------------------------------------------------------
+class RightAtrium(BaseModel):
+    """Top-level model for the Right Atrium section of the echo report."""
+    model_config = common_model_config
+
+    assessment: RAAssessment = Field(
+        ...,
+        description="Assessment findings for the Right Atrium"
+    )
+    measurements: RAMeasurements = Field(
+        ...,
+        description="Quantitative measurements for the Right Atrium"
+    )
@@ -0,0 +1,211 @@
+"""Right ventricle models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# Right Ventricle
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Right Ventricle Enums
+#------------------------------------------------------------------------------
+class RVSizeEnum(str, Enum):
+    """Enumeration for Right Ventricular size assessment."""
+    NORMAL = "Normal"
+    TOP_NORMAL = "Top Normal"
+    SMALL = "Small"
+    ENLARGED = "Enlarged"
+    MILD_ENLARGED = "Mild Enlarged"
+    MILD_TO_MODERATE_ENLARGED = "Mild to Moderate Enlarged"
+    MODERATE_ENLARGED = "Moderate Enlarged"
+    MODERATE_TO_SEVERE_ENLARGED = "Moderate to Severe Enlarged"
+    SEVERELY_ENLARGED = "Severe Enlarged"
+    NOT_ASSESSED = "Not Assessed"
+
+class RVSystolicFunctionEnum(str, Enum):
+    """Enumeration for Right Ventricular systolic function assessment."""
+    NORMAL = "Normal"
+    PRESERVED = "Preserved"
+    MILDLY_REDUCED = "Mildly Reduced"
+    MILD_TO_MODERATELY_REDUCED = "Mild to Moderately Reduced"
+    MODERATELY_REDUCED = "Moderately Reduced"
+    MODERATE_TO_SEVERELY_REDUCED = "Moderate to Severely Reduced"
+    SEVERELY_REDUCED = "Severely Reduced"
+    NOT_ASSESSED = "Not Assessed"
+
+class RVHypertrophyPresenceEnum(str, Enum):
+    """Enumeration for presence of right ventricular hypertrophy."""
+    NO = "No"
+    YES = "Yes"
+    NOT_ASSESSED = "Not Assessed"
+
+class RVHypertrophySeverityEnum(str, Enum):
+    """Enumeration for severity of right ventricular hypertrophy."""
+    MILD = "Mild"
+    MODERATE = "Moderate"
+    SEVERE = "Severe"
+    NOT_ASSESSED = "Not Assessed"
+
+
+#------------------------------------------------------------------------------
+# Right Ventricle Assessment Models
+#------------------------------------------------------------------------------
+class RVHypertrophy(BaseModel):
+    """Model for Right Ventricular hypertrophy assessment."""
+    model_config = common_model_config
+
+    presence: RVHypertrophyPresenceEnum = Field(
+        default=RVHypertrophyPresenceEnum.NOT_ASSESSED,
+        description="Presence of right ventricular hypertrophy"
+    )
+    severity: RVHypertrophySeverityEnum = Field(
+        default=RVHypertrophySeverityEnum.NOT_ASSESSED,
+        description="Severity of right ventricular hypertrophy"
+    )
+
+
+class RVAssessment(BaseModel):
+    """Overall assessment of the Right Ventricle."""
+    model_config = common_model_config
+
+    size: RVSizeEnum = Field(
+        default=RVSizeEnum.NOT_ASSESSED,
+        description="Right Ventricular size assessment"
+    )
+    systolic_function: RVSystolicFunctionEnum = Field(
+        default=RVSystolicFunctionEnum.NOT_ASSESSED,
+        description="Right Ventricular systolic function assessment"
+    )
+    hypertrophy: RVHypertrophy = Field(
+        default_factory=RVHypertrophy,
+        description="Right Ventricular hypertrophy assessment"
+    )
+
+
+#------------------------------------------------------------------------------
+# Right Ventricle Measurement Models
+#------------------------------------------------------------------------------
+class RVDimensions(RangeCheckedModel):
+    """Quantitative measurements of Right Ventricular dimensions."""
+    model_config = common_model_config
+
+    mid_rv_diameter: MeasurementValue = Field(
+        default="Not Measured",
+        description="Mid Right Ventricular Diameter",
+        unit="cm",
+        range=(1.0, 5.0)
+    )
+    longitudinal_rv_diameter: MeasurementValue = Field(
+        default="Not Measured",
+        description="Longitudinal Right Ventricular Diameter",
+        unit="cm",
+        range=(2.0, 9.0)
+    )
+    rv_thickness: MeasurementValue = Field(
+        default="Not Measured",
+        description="Right Ventricular Free Wall Thickness",
+        unit="mm",
+        range=(1.0, 15.0)
+    )
+    rvot_diameter_sax: MeasurementValue = Field(
+        default="Not Measured",
+        alias="RVOT diameter (in SAX View)",
+        description="RVOT diameter in Short Axis View",
+        unit="mm",
+        range=(5.0, 45.0)
+    )
+    rvot_diameter_plax: MeasurementValue = Field(
+        default="Not Measured",
+        alias="RVOT diameter (in PLAX View)",
+        description="RVOT diameter in Parasternal Long Axis View",
+        unit="mm",
+        range=(5.0, 45.0)
+    )
+
+
+class RVAreas(RangeCheckedModel):
+    """Quantitative measurements of Right Ventricular areas."""
+    model_config = common_model_config
+
+    rved_area: MeasurementValue = Field(
+        default="Not Measured",
+        alias="RVED Area",
+        description="Right Ventricular End-Diastolic Area",
+        unit="cm\u00b2",
+        range=(5.0, 40.0)
+    )
+    rves_area: MeasurementValue = Field(
+        default="Not Measured",
+        alias="RVES Area",
+        description="Right Ventricular End-Systolic Area",
+        unit="cm\u00b2",
+        range=(2.0, 30.0)
+    )
+    fac: MeasurementValue = Field(
+        default="Not Measured",
+        alias="FAC",
+        description="Fractional Area Change",
+        unit="%",
+        range=(10, 70)
+    )
+
+
+class RVFunctionIndices(RangeCheckedModel):
+    """Quantitative measurements of Right Ventricular function indices."""
+    model_config = common_model_config
+
+    rv_mpi: MeasurementValue = Field(
+        default="Not Measured",
+        alias="RV MPI",
+        description="Myocardial Performance Index (Tei Index) of RV",
+        range=(0.0, 1.5)
+    )
+    tapse: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TAPSE",
+        description="Tricuspid Annular Plane Systolic Excursion",
+        unit="mm",
+        range=(5.0, 40.0)
+    )
+    sm: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Sm",
+        description="Tricuspid annular systolic velocity",
+        unit="cm/sec",
+        range=(0.0, 20.0)
+    )
+
+
+class RVMeasurements(BaseModel):
+    """Quantitative measurements related to the Right Ventricle."""
+    model_config = common_model_config
+
+    dimensions: RVDimensions = Field(
+        default_factory=RVDimensions,
+        description="Right Ventricular dimension measurements"
+    )
+    areas: RVAreas = Field(
+        default_factory=RVAreas,
+        description="Right Ventricular area measurements"
+    )
+    function_indices: RVFunctionIndices = Field(
+        default_factory=RVFunctionIndices,
+        description="Right Ventricular function indices"
+    )
+
+#------------------------------------------------------------------------------
+# Right Ventricle Root
+#------------------------------------------------------------------------------
+class RightVentricle(BaseModel):
+    """Top-level model for the Right Ventricle section of the echo report."""
+    model_config = common_model_config
+
+    assessment: RVAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the Right Ventricle"
+    )
+    measurements: RVMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the Right Ventricle"
+    )
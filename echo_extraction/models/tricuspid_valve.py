@@ -0,0 +1,280 @@
+"""Tricuspid valve models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import (
+    MeasurementValue,
+    common_model_config,
+    RangeCheckedModel,
+    PresenceEnum,
+    SeverityEnum,
+    ProstheticTypeEnum,
+    FunctionEnum,
+)
+
+#------------------------------------------------------------------------------
+# Tricuspid Valve
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# Tricuspid Enums
+#------------------------------------------------------------------------------
+class TricuspidShapeEnum(str, Enum):
+    NORMAL = "Normal"
+    MALCOAPTED = "Malcoapted"
+    DISPLACED_INFERIORLY = "Displaced Inferiorly"
+    PROLAPTIC = "Prolaptic"
+    REPAIRED = "Repaired"
+    FLAIL = "Flail"
+    DISPLACED = "Displaced"
+    NOT_ASSESSED = "Not Assessed"
+
+
+#------------------------------------------------------------------------------
+# Tricuspid Valve Assessment Models
+#------------------------------------------------------------------------------
+class TricuspidStenosis(BaseModel):
+    """Model for tricuspid stenosis assessment."""
+    model_config = common_model_config
+
+    severity: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of Tricuspid Stenosis"
+    )
+
+
+class TricuspidRegurgitation(BaseModel):
+    """Model for tricuspid regurgitation assessment."""
+    model_config = common_model_config
+
+    severity: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        description="Severity of Tricuspid Regurgitation"
+    )
+    paravalvular_leak: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        alias="Paravalvular Leak",
+        description="Severity of paravalvular leak"
+    )
+    transvalvular_leak: SeverityEnum = Field(
+        default=SeverityEnum.NOT_ASSESSED,
+        alias="Transvalvular Leak",
+        description="Severity of transvalvular leak"
+    )
+
+
+class TricuspidProsthetic(BaseModel):
+    """Model for tricuspid prosthetic valve assessment."""
+    model_config = common_model_config
+
+    present: PresenceEnum = Field(
+        default=PresenceEnum.NOT_ASSESSED,
+        description="Presence of a tricuspid prosthetic valve"
+    )
+    type: ProstheticTypeEnum = Field(
+        default=ProstheticTypeEnum.NOT_ASSESSED,
+        description="Type of tricuspid prosthetic valve"
+    )
+    function: FunctionEnum = Field(
+        default=FunctionEnum.NOT_ASSESSED,
+        description="Function of the tricuspid prosthetic valve"
+    )
+
+
+#------------------------------------------------------------------------------
+# Full TricuspidValveAssessment Root
+#------------------------------------------------------------------------------
+class TricuspidValveAssessment(BaseModel):
+    """Overall assessment of the tricuspid valve."""
+    model_config = common_model_config
+
+    shape: TricuspidShapeEnum = Field(
+        default=TricuspidShapeEnum.NOT_ASSESSED,
+        description="Anatomical state of the tricuspid valve"
+    )
+    stenosis: TricuspidStenosis = Field(
+        default_factory=lambda: TricuspidStenosis(),
+        description="Tricuspid stenosis assessment"
+    )
+    regurgitation: TricuspidRegurgitation = Field(
+        default_factory=lambda: TricuspidRegurgitation(),
+        description="Tricuspid regurgitation assessment"
+    )
+    prosthetic: TricuspidProsthetic = Field(
+        default_factory=lambda: TricuspidProsthetic(),
+        description="Tricuspid prosthetic valve assessment"
+    )
+
+
+#------------------------------------------------------------------------------
+# Tricuspid Valve Measurements Models
+#------------------------------------------------------------------------------
+class TricuspidDimensions(RangeCheckedModel):
+    """Quantitative measurements of tricuspid valve dimensions."""
+    model_config = common_model_config
+
+    annulus_diameter: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Annulus Diameter",
+        description="Tricuspid annulus diameter",
+        unit="cm",
+        range=(2.0, 6.0)
+    )
+    annulus_area: MeasurementValue = Field(
+        default="Not Measured",
+        alias="Annulus Area",
+        description="Tricuspid annulus area",
+        unit="cm²",
+        range=(3.0, 20.0)
+    )
+
+
+class TricuspidRegurgitationParameters(RangeCheckedModel):
+    """Quantitative measurements related to tricuspid regurgitation."""
+    model_config = common_model_config
+
+    tr_vc: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TR VC",
+        description="Tricuspid Regurgitation Vena Contracta width",
+        unit="mm",
+        range=(1.0, 20.0)
+    )
+    tr_pisa_radius: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TR PISA Radius",
+        description="Tricuspid Regurgitation PISA Radius",
+        unit="mm",
+        range=(1.0, 20.0)
+    )
+    tr_pg: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TR PG",
+        description="Tricuspid Regurgitation Peak Gradient",
+        unit="mmHg",
+        range=(5.0, 100.0)
+    )
+
+
+class TricuspidGradients(RangeCheckedModel):
+    """Quantitative measurements of tricuspid valve gradients."""
+    model_config = common_model_config
+
+    tv_mean_gradient: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TV Mean Gradient",
+        description="Tricuspid valve mean pressure gradient",
+        unit="mmHg",
+        range=(0.0, 20.0)
+    )
+    tv_pht: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TV PHT",
+        description="Tricuspid valve Pressure Half-Time",
+        unit="ms",
+        range=(30.0, 400.0)
+    )
+
+
+class TricuspidDopplerMeasurements(RangeCheckedModel):
+    """Quantitative Doppler measurements related to the tricuspid valve."""
+    model_config = common_model_config
+
+    tv_e_velocity: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TV E Velocity",
+        description="Tricuspid valve E wave velocity",
+        unit="m/s",
+        range=(0.1, 2.0),
+        on_invalid="raise"
+    )
+    tv_a_velocity: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TV A Velocity",
+        description="Tricuspid valve A wave velocity",
+        unit="m/s",
+        range=(0.1, 2.0),
+        on_invalid="raise"
+    )
+    tv_ea_ratio: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TV E/A Ratio",
+        description="Ratio of Tricuspid valve E to A wave velocity",
+        range=(0.5, 3.5),
+        on_invalid="raise"
+    )
+    tv_deceleration_time: MeasurementValue = Field(
+        default="Not Measured",
+        alias="TV Deceleration Time",
+        description="Tricuspid valve E wave deceleration time",
+        unit="ms",
+        range=(100.0, 400.0),
+        on_invalid="raise"
+    )
+    e_prime: MeasurementValue = Field(
+        default="Not Measured",
+        alias="E'",
+        description="Tricuspid annular E' velocity",
+        unit="cm/sec",
+        range=(2.0, 15.0),
+        on_invalid="raise"
+    )
+    a_prime: MeasurementValue = Field(
+        default="Not Measured",
+        alias="A'",
+        description="Tricuspid annular A' velocity",
+        unit="cm/sec",
+        range=(2.0, 15.0),
+        on_invalid="raise"
+    )
+    e_a_prime_ratio: MeasurementValue = Field(
+        default="Not Measured",
+        alias="E'/A' Ratio",
+        description="Ratio of Tricuspid annular E' to A' velocity",
+        range=(0.5, 30.0),
+        on_invalid="raise"
+    )
+
+
+#------------------------------------------------------------------------------
+# Full Tricuspid Valve Measurements Root
+#------------------------------------------------------------------------------
+class TricuspidValveMeasurements(BaseModel):
+    """Quantitative measurements related to the tricuspid valve."""
+    model_config = common_model_config
+
+    dimensions: TricuspidDimensions = Field(
+        default_factory=TricuspidDimensions,
+        description="Tricuspid valve dimensions"
+    )
+    regurgitation_parameters: TricuspidRegurgitationParameters = Field(
+        default_factory=TricuspidRegurgitationParameters,
+        alias="Regurgitation Parameters",
+        description="Quantitative regurgitation parameters"
+    )
+    gradients: TricuspidGradients = Field(
+        default_factory=TricuspidGradients,
+        alias="Gradients (Tricuspid Valve Stenosis Hemodynamics)",
+        description="Tricuspid valve gradients"
+    )
+    doppler_measurements: TricuspidDopplerMeasurements = Field(
+        default_factory=TricuspidDopplerMeasurements,
+        alias="Doppler Measurements",
+        description="Tricuspid Doppler measurements"
+    )
+
+
+#------------------------------------------------------------------------------
+# Tricuspid Valve Root
+#------------------------------------------------------------------------------
+class TricuspidValve(BaseModel):
+    """Top-level model for the tricuspid valve section of the echo report."""
+    model_config = common_model_config
+
+    assessment: TricuspidValveAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the tricuspid valve"
+    )
+    measurements: TricuspidValveMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the tricuspid valve"
+    )
@@ -0,0 +1,134 @@
+"""Ventricular septal defect models."""
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from ._common import MeasurementValue, common_model_config, RangeCheckedModel
+
+#------------------------------------------------------------------------------
+# VSD
+#------------------------------------------------------------------------------
+#------------------------------------------------------------------------------
+# VSD Enums
+#------------------------------------------------------------------------------
+class VSDPresenceEnum(str, Enum):
+    """Enumeration for VSD presence assessment."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class VSDLocationEnum(str, Enum):
+    """Enumeration for VSD anatomical location."""
+    PERIMEMBRANOUS = "Perimembranous"
+    MUSCULAR = "Muscular"
+    INLET = "Inlet"
+    OUTLET = "Outlet"
+    SUBPULMONARY = "Subpulmonary"
+    MULTIPLE = "Multiple"
+    NOT_ASSESSED = "Not Assessed"
+
+class VSDSizeEnum(str, Enum):
+    """Enumeration for VSD size estimation."""
+    SMALL = "Small"
+    MODERATE = "Moderate"
+    LARGE = "Large"
+    NOT_ASSESSED = "Not Assessed"
+
+class VSDShuntDirectionEnum(str, Enum):
+    """Enumeration for VSD shunt direction."""
+    LEFT_TO_RIGHT = "Left to Right"
+    RIGHT_TO_LEFT = "Right to Left"
+    BIDIRECTIONAL = "Bidirectional"
+    NOT_ASSESSED = "Not Assessed"
+
+class VSDAneurysmalTissueEnum(str, Enum):
+    """Enumeration for presence of aneurysmal tissue with VSD."""
+    YES = "Yes"
+    NO = "No"
+    NOT_ASSESSED = "Not Assessed"
+
+class VSDAssociatedDefectsEnum(str, Enum):
+    """Enumeration for associated structural cardiac anomalies with VSD."""
+    NONE = "None"
+    AV_CANAL = "AV Canal"
+    TETRALOGY_OF_FALLOT = "Tetralogy of Fallot"
+    AORTIC_VALVE_PROLAPSE = "Aortic Valve Prolapse"
+    SUBAORTIC_STENOSIS = "Subaortic Stenosis"
+    OTHER = "Other"
+    NOT_ASSESSED = "Not Assessed"
+
+#------------------------------------------------------------------------------
+# VSD Assessment Models
+#------------------------------------------------------------------------------
+class VSDAssessment(BaseModel):
+    """Model for VSD assessment details."""
+    model_config = common_model_config
+
+    present: VSDPresenceEnum = Field(
+        default=VSDPresenceEnum.NOT_ASSESSED,
+        description="Presence of VSD"
+    )
+    location: VSDLocationEnum = Field(
+        default=VSDLocationEnum.NOT_ASSESSED,
+        description="Anatomical location of the VSD"
+    )
+    size: VSDSizeEnum = Field(
+        default=VSDSizeEnum.NOT_ASSESSED,
+        description="Visual/quantitative size estimation of the VSD"
+    )
+    shunt_direction: VSDShuntDirectionEnum = Field(
+        default=VSDShuntDirectionEnum.NOT_ASSESSED,
+        description="Direction of shunting across the VSD"
+    )
+    aneurysmal_tissue: VSDAneurysmalTissueEnum = Field(
+        default=VSDAneurysmalTissueEnum.NOT_ASSESSED,
+        description="Presence of aneurysmal tissue surrounding the defect"
+    )
+    associated_defects: VSDAssociatedDefectsEnum = Field(
+        default=VSDAssociatedDefectsEnum.NOT_ASSESSED,
+        description="Associated structural cardiac anomalies"
+    )
+
+#------------------------------------------------------------------------------
+# VSD Measurement Models
+#------------------------------------------------------------------------------
+class VSDMeasurements(RangeCheckedModel):
+    """Quantitative measurements related to the VSD."""
+    model_config = common_model_config
+
+    diameter: MeasurementValue = Field(
+        default="Not Measured",
+        description="Diameter of the VSD as measured by imaging",
+        unit="mm",
+        range=(1.0, 20.0),
+        on_invalid="raise"
+    )
+    peak_gradient: MeasurementValue = Field(
+        default="Not Measured",
+        description="Peak systolic gradient across the VSD",
+        unit="mmHg",
+        range=(5.0, 120.0),
+        on_invalid="raise"
+    )
+    qp_qs: MeasurementValue = Field(
+        default="Not Measured",
+        description="Pulmonary to Systemic Flow Ratio",
+        range=(0.5, 5.0),
+        on_invalid="raise"
+    )
+
+
+#------------------------------------------------------------------------------
+# VSD Root
+#------------------------------------------------------------------------------
+class VSD(BaseModel):
+    """Top-level model for the VSD section of the echo report."""
+    model_config = common_model_config
+
+    assessment: VSDAssessment = Field(
+        ..., # This field is required
+        description="Assessment findings for the VSD"
+    )
+    measurements: VSDMeasurements = Field(
+        ..., # This field is required
+        description="Quantitative measurements for the VSD"
+    )
@@ -0,0 +1,204 @@
+import os
+import re
+import sys
+import json
+import enum
+import typing
+import inspect
+import logging
+import argparse
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+logger = logging.getLogger(__name__)
+
+# Token budget per component for the generated prompt schema; others use PROMPT_SCHEMA_TOKEN_BUDGET
+PROMPT_SCHEMA_TOKEN_BUDGETS: Dict[str, int] = {
+    "LeftVentricle": 800,
+    "RightVentricle": 500,
+    "LeftAtrium": 450,
+    "RightAtrium": 350,
+    "MitralValve": 900,
+    "AorticValve": 800,
+    "PulmonaryValve": 550,
+    "TricuspidValve": 650,
+}
+DEFAULT_TOKEN_BUDGET = int(os.getenv("PROMPT_SCHEMA_TOKEN_BUDGET", "400"))
+# Descriptions longer than this are cut (with "...") when they are included
+MAX_DESCRIPTION_LENGTH = 60
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count (words and punctuation marks). No tokenizer of the served model
+    is available here; for schema-like text this tracks BPE counts closely enough to
+    compare schemas and enforce budgets.
+    """
+    return len(_TOKEN_RE.findall(text))
+
+
+#--------------------------------------------------------------------------
+# Generation
+#--------------------------------------------------------------------------
+def _field_range(field_info: FieldInfo) -> Optional[Tuple[Any, Any]]:
+    """The accepted (min, max) of a numeric field, from `range=` in Field or ge/le constraints."""
+    extra = field_info.json_schema_extra if isinstance(field_info.json_schema_extra, dict) else {}
+    if extra.get("range") is not None:
+        low, high = extra["range"]
+        return low, high
+    low = high = None
+    for constraint in field_info.metadata:
+        low = getattr(constraint, "ge", getattr(constraint, "gt", low))
+        high = getattr(constraint, "le", getattr(constraint, "lt", high))
+    return (low, high) if low is not None or high is not None else None
+
+
+def _format_number(value: Any) -> str:
+    return str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+
+
+def _describe_number(unit: Optional[str], value_range: Optional[Tuple[Any, Any]]) -> str:
+    described = "number"
+    if unit:
+        described += f" {unit}"
+    if value_range is not None:
+        low, high = value_range
+        described += f" {'' if low is None else _format_number(low)}..{'' if high is None else _format_number(high)}"
+    return described
+
+
+def _describe_type(
+    annotation: Any,
+    unit: Optional[str] = None,
+    value_range: Optional[Tuple[Any, Any]] = None,
+    include_descriptions: bool = False,
+) -> Any:
+    """Compact descriptor of a type: a dict for models, a one-item list for lists, a string otherwise."""
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return _describe_model(annotation, include_descriptions)
+    if inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
+        return "|".join(str(member.value) for member in annotation)
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (list, List):
+        return [_describe_type(args[0], unit, value_range, include_descriptions) if args else "any"]
+    if origin is typing.Literal:
+        return "|".join(str(arg) for arg in args)
+    if origin is typing.Union:
+        alternatives: List[str] = []
+        for arg in args:
+            if arg is type(None):
+                described = "null"
+            elif arg in (int, float):
+                described = _describe_number(unit, value_range)
+            else:
+                described = _describe_type(arg, include_descriptions=include_descriptions)
+                if not isinstance(described, str):
+                    described = json.dumps(described, separators=(",", ":"))
+            if described not in alternatives:
+                alternatives.append(described)
+        return "|".join(alternatives)
+    if annotation in (int, float):
+        return _describe_number(unit, value_range)
+    if annotation is bool:
+        return "true|false"
+    if annotation is str:
+        return "text"
+    return getattr(annotation, "__name__", str(annotation))
+
+
+def _describe_model(model: Type[BaseModel], include_descriptions: bool = False) -> Dict[str, Any]:
+    """Skeleton of a model keyed by alias: only types, enum values, units and ranges (and optionally descriptions)."""
+    skeleton: Dict[str, Any] = {}
+    for field_name, field_info in model.model_fields.items():
+        key = field_info.alias or field_name
+        extra = field_info.json_schema_extra if isinstance(field_info.json_schema_extra, dict) else {}
+        described = _describe_type(field_info.annotation, extra.get("unit"), _field_range(field_info), include_descriptions)
+        if include_descriptions and field_info.description and isinstance(described, str):
+            description = field_info.description
+            if len(description) > MAX_DESCRIPTION_LENGTH:
+                description = description[:MAX_DESCRIPTION_LENGTH - 3].rstrip() + "..."
+            described = f"{described} ({description})"
+        skeleton[key] = described
+    return skeleton
+
+
+def generate_prompt_schema(model: Type[BaseModel], include_descriptions: bool = False) -> str:
+    """Renders the token-minimal prompt schema of a component model as compact JSON."""
+    return json.dumps(_describe_model(model, include_descriptions), separators=(",", ":"), ensure_ascii=False)
+
+
+def token_budget(component_name: str) -> int:
+    return PROMPT_SCHEMA_TOKEN_BUDGETS.get(component_name, DEFAULT_TOKEN_BUDGET)
+
+
+def build_prompt_schema(model: Type[BaseModel], include_descriptions: bool = False) -> str:
+    """
+    Generates the prompt schema of a component and checks it against the component's
+    token budget. With descriptions, a schema over budget falls back to the version
+    without them; a schema still over budget is used anyway, with a warning.
+    """
+    component_name = model.__name__
+    budget = token_budget(component_name)
+    schema = generate_prompt_schema(model, include_descriptions)
+    tokens = estimate_tokens(schema)
+    if tokens > budget and include_descriptions:
+        logger.warning(f"Prompt schema for {component_name} with descriptions is ~{tokens} tokens (budget {budget}). Dropping descriptions.")
+        schema = generate_prompt_schema(model, include_descriptions=False)
+        tokens = estimate_tokens(schema)
+    if tokens > budget:
+        logger.warning(f"Prompt schema for {component_name} is ~{tokens} tokens, over its budget of {budget}.")
+    return schema
+
+
+#--------------------------------------------------------------------------
+# CLI
+#--------------------------------------------------------------------------
+COMPONENT_NAMES = [
+    "LeftVentricle", "RightVentricle", "LeftAtrium", "RightAtrium",
+    "MitralValve", "AorticValve", "PulmonaryValve", "TricuspidValve",
+    "Aorta", "PulmonicVein", "IVC", "VSD", "ASD", "PFO", "Pericardium",
+]
+
+
+def _hand_schema_text(component_name: str) -> Optional[str]:
+    """The hand-maintained JSON_Schema file as it is put into the prompt (indent=2), if it exists."""
+    schema_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "JSON_Schema")
+    for fname in (f"{component_name}.json", f"{component_name}.schema.json"):
+        path = os.path.join(schema_dir, fname)
+        if os.path.isfile(path):
+            with open(path, "r") as f:
+                return json.dumps(json.load(f), indent=2)
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate token-minimal prompt schemas from the component models.")
+    parser.add_argument("components", nargs="*", help="Components to generate (default: all).")
+    parser.add_argument("--descriptions", action="store_true", help="Include shortened field descriptions.")
+    parser.add_argument("--show", action="store_true", help="Print the generated schemas.")
+    args = parser.parse_args(argv)
+
+    from . import models
+    over_budget = 0
+    print(f"{'Component':<16}{'hand file':>11}{'generated':>11}{'budget':>8}")
+    for component_name in args.components or COMPONENT_NAMES:
+        model = getattr(models, component_name)
+        schema = generate_prompt_schema(model, args.descriptions)
+        tokens = estimate_tokens(schema)
+        hand = _hand_schema_text(component_name)
+        budget = token_budget(component_name)
+        over_budget += tokens > budget
+        flag = "  OVER BUDGET" if tokens > budget else ""
+        print(f"{component_name:<16}{estimate_tokens(hand) if hand else '-':>11}{tokens:>11}{budget:>8}{flag}")
+        if args.show:
+            print(schema)
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
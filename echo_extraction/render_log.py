@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+import logging
+import argparse
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .utils import MarkdownBookFormatter
+from .log_store import find_report_log, open_log_file, strip_compression_suffix
+
+
+def read_trace(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the events of a report's JSONL trace log (compressed or not), skipping lines
+    that are not valid JSON (e.g. a truncated last line).
+    """
+    with open_log_file(path, "r") as f:
+        try:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+        except EOFError:
+            # Compressed log cut short (e.g. the process was killed): keep what was readable
+            return
+
+
+class BlobResolver:
+    """Replaces {"$blob": "<sha256>"} references in trace events with the blob text, reading each blob once."""
+    def __init__(self, blob_dir: str):
+        self.blob_dir = blob_dir
+        self._texts: Dict[str, str] = {}
+
+    def text(self, digest: str) -> str:
+        text = self._texts.get(digest)
+        if text is None:
+            try:
+                with open(os.path.join(self.blob_dir, digest), "r", encoding="utf-8") as f:
+                    text = f.read()
+            except OSError:
+                text = f"[missing blob {digest}]"
+            self._texts[digest] = text
+        return text
+
+    def resolve(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and "$blob" in value:
+                return self.text(value["$blob"])
+            return {k: self.resolve(v) for k, v in value.items()}
+        return value
+
+    def events(self, events: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for event in events:
+            yield self.resolve(event)
+
+
+def render_book(events: Iterable[Dict[str, Any]]) -> str:
+    """
+    Renders trace events as the Markdown book. Each event is turned back into a log
+    record and formatted by MarkdownBookFormatter, so the result is the book that the
+    Markdown log format writes eagerly. Blob references must be resolved first (see
+    BlobResolver).
+    """
+    formatter = MarkdownBookFormatter()
+    parts = []
+    for event in events:
+        record = logging.makeLogRecord(event)
+        record.msg = event.get("message", "")
+        parts.append(formatter.format(record) + "\n")
+    return "".join(parts)
+
+
+def trace_path(report: str, log_dir: str) -> str:
+    """The trace file of a report given by `_id` (looked up in the log store's shards) or by path."""
+    if os.path.isfile(report):
+        return report
+    return find_report_log(log_dir, report, [".jsonl"]) or os.path.join(log_dir, f"{report}.jsonl")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render the Markdown book of a report from its JSONL trace log.")
+    parser.add_argument("reports", nargs="+", help="Report _id(s) or trace file path(s).")
+    parser.add_argument("--log-dir", default=os.getenv("LOG_FILE_DIR", "main_app/logs"), help="Directory of the trace logs.")
+    parser.add_argument("--blob-dir", default=None, help="Blob directory of the traces (default: blobs/ next to the trace).")
+    parser.add_argument("--output-dir", default=None, help="Where to write <_id>.md (default: next to the trace).")
+    parser.add_argument("--stdout", action="store_true", help="Print the book instead of writing it.")
+    args = parser.parse_args(argv)
+
+    missing = 0
+    for report in args.reports:
+        path = trace_path(report, args.log_dir)
+        if not os.path.isfile(path):
+            print(f"Trace log not found: {path}", file=sys.stderr)
+            missing += 1
+            continue
+        resolver = BlobResolver(args.blob_dir or os.path.join(os.path.dirname(path), "blobs"))
+        book = render_book(resolver.events(read_trace(path)))
+        if args.stdout:
+            sys.stdout.write(book)
+            continue
+        report_id = os.path.splitext(os.path.basename(strip_compression_suffix(path)))[0]
+        output_path = os.path.join(args.output_dir or os.path.dirname(path), f"{report_id}.md")
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(book)
+        print(f"Rendered {output_path}")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
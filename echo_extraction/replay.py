@@ -0,0 +1,245 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from .llm_mapping_utils import parse_component_output
+from .revalidate import diff_values, list_report_files
+
+logger = logging.getLogger(__name__)
+
+
+#--------------------------------------------------------------------------
+# Raw-output store
+#--------------------------------------------------------------------------
+def read_raw_outputs(path: str) -> List[Dict[str, Any]]:
+    """Reads the attempts of one report from its raw-output JSONL file (written via set_log_file)."""
+    attempts = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                attempts.append(json.loads(line))
+    return attempts
+
+
+def _group_by_component(attempts: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Attempts per component, in the order they were made."""
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in attempts:
+        grouped.setdefault(entry["component"], []).append(entry)
+    return grouped
+
+
+#--------------------------------------------------------------------------
+# Replay
+#--------------------------------------------------------------------------
+def _error_summary(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        errors = error.errors()
+        first = errors[0]
+        loc = ".".join(str(part) for part in first["loc"])
+        return f"ValidationError ({len(errors)}): {loc}: {first['msg']}"
+    return f"{type(error).__name__}: {error}"
+
+
+def replay_component(component_model, attempts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Re-runs parse → remap → validate over a component's stored attempts, in order, as the
+    extraction loop would: the first attempt that validates now wins (later attempts
+    would not have been made).
+
+    Returns:
+        {'stored': attempt number that passed originally or None, 'replayed': attempt number
+        that passes now or None, 'component': validated model or None, 'error': summary of
+        the last error if no attempt passes now}
+    """
+    stored = next((entry["attempt"] for entry in attempts if entry.get("status") == "Successful"), None)
+    last_error = None
+    for entry in attempts:
+        try:
+            data, _ = parse_component_output(entry.get("raw_output") or "", component_model)
+            return {"stored": stored, "replayed": entry["attempt"], "component": component_model.model_validate(data), "error": None}
+        except Exception as e:
+            last_error = e
+    return {"stored": stored, "replayed": None, "component": None,
+            "error": _error_summary(last_error) if last_error is not None else "No stored attempts"}
+
+
+def _outcome_change(stored: Optional[int], replayed: Optional[int]) -> Optional[str]:
+    if stored == replayed:
+        return None
+    if stored is None:
+        return "now_passes"
+    if replayed is None:
+        return "now_fails"
+    return "passes_at_other_attempt"
+
+
+def replay_report(raw_output_path: str, final_reports_dir: Optional[str] = None,
+                  write_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Replays one report from its stored raw outputs, with no LLM calls: every component
+    goes through parse → remap → validate again and the EchoReport is re-assembled.
+
+    Args:
+        raw_output_path: The report's raw-output JSONL file.
+        final_reports_dir: Where the stored final reports are; the replayed report is
+            compared with `<_id>.json` there if it exists.
+        write_dir: If given, the replayed final report is written there as `<_id>.json`.
+
+    Returns:
+        {'id', 'components': {name: {'stored', 'replayed', 'change', 'error'}},
+         'changed': [[path, stored, replayed], ...] or None if there is no stored report,
+         'error': message if the report could not be replayed}
+    """
+    from . import models
+
+    report_id = os.path.splitext(os.path.basename(raw_output_path))[0]
+    result: Dict[str, Any] = {"id": report_id, "components": {}, "changed": None, "error": None}
+    try:
+        attempts = read_raw_outputs(raw_output_path)
+    except (OSError, ValueError) as e:
+        result["error"] = f"Could not read raw outputs: {e}"
+        return result
+
+    extracted = {}
+    for component_name, component_attempts in _group_by_component(attempts).items():
+        component_model = getattr(models, component_name, None)
+        if component_model is None:
+            result["components"][component_name] = {"stored": None, "replayed": None, "change": None,
+                                                    "error": f"Unknown component {component_name}"}
+            continue
+        outcome = replay_component(component_model, component_attempts)
+        if outcome["component"] is not None:
+            extracted[component_name] = outcome["component"]
+        result["components"][component_name] = {
+            "stored": outcome["stored"],
+            "replayed": outcome["replayed"],
+            "change": _outcome_change(outcome["stored"], outcome["replayed"]),
+            "error": outcome["error"],
+        }
+
+    try:
+        final_echo_report = models.assemble_echo_report(extracted)
+    except Exception as e:
+        result["error"] = f"Failed to assemble EchoReport: {e}"
+        return result
+
+    if write_dir:
+        with open(os.path.join(write_dir, f"{report_id}.json"), "w") as f:
+            f.write(final_echo_report.model_dump_json(indent=2))
+
+    stored_path = os.path.join(final_reports_dir, f"{report_id}.json") if final_reports_dir else None
+    if stored_path and os.path.isfile(stored_path):
+        with open(stored_path, "r", encoding="utf-8") as f:
+            stored_report = json.load(f)
+        result["changed"] = diff_values(stored_report, final_echo_report.model_dump(mode="json"))
+    return result
+
+
+def _replay_task(args):
+    return replay_report(*args)
+
+
+def replay_reports(
+    raw_output_paths: List[str],
+    final_reports_dir: Optional[str] = None,
+    write_dir: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Replays many reports (see replay_report), optionally over a process pool (None or 1 = serial)."""
+    tasks = [(path, final_reports_dir, write_dir) for path in raw_output_paths]
+    if workers and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_replay_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    return [_replay_task(task) for task in tasks]
+
+
+#--------------------------------------------------------------------------
+# Replay report
+#--------------------------------------------------------------------------
+def build_replay_report(results: List[Dict[str, Any]], elapsed: float = 0.0) -> Dict[str, Any]:
+    """
+    Summary of a replay: how many components now pass or fail differently (overall and
+    per component), and per report the components whose outcome changed and the final
+    report fields whose value changed.
+    """
+    change_counts: Dict[str, int] = {}
+    by_component: Dict[str, Dict[str, int]] = {}
+    reports: Dict[str, Any] = {}
+    n_components = 0
+    n_reports_changed = 0
+    for result in results:
+        entry: Dict[str, Any] = {}
+        for component_name, outcome in result["components"].items():
+            n_components += 1
+            change = outcome["change"]
+            if change is None:
+                continue
+            change_counts[change] = change_counts.get(change, 0) + 1
+            counts = by_component.setdefault(component_name, {})
+            counts[change] = counts.get(change, 0) + 1
+            entry.setdefault("components", {})[component_name] = outcome
+        if result["changed"]:
+            n_reports_changed += 1
+            entry["changed"] = result["changed"]
+        if result["error"]:
+            entry["error"] = result["error"]
+        if entry:
+            reports[result["id"]] = entry
+    return {
+        "summary": {
+            "reports": len(results),
+            "components": n_components,
+            "component_changes": change_counts,
+            "final_reports_changed": n_reports_changed,
+            "errors": sum(1 for result in results if result["error"]),
+            "elapsed_seconds": round(elapsed, 3),
+        },
+        "by_component": by_component,
+        "reports": reports,
+    }
+
+
+#--------------------------------------------------------------------------
+# CLI
+#--------------------------------------------------------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay stored raw LLM outputs through parse, remap, validate and assembly (no LLM calls).")
+    parser.add_argument("--raw-dir", default=os.getenv("RAW_OUTPUTS_DIR", "main_app/raw_outputs"), help="Directory of raw-output JSONL files.")
+    parser.add_argument("--reports-dir", default=os.getenv("FINAL_REPORTS_DIR", "main_app/final_reports"), help="Stored final reports to compare against.")
+    parser.add_argument("--write-dir", default=None, help="Write the replayed final reports to this directory.")
+    parser.add_argument("--output", default="replay_report.json", help="Where to write the replay report.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (1 = serial).")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.write_dir:
+        os.makedirs(args.write_dir, exist_ok=True)
+    paths = list_report_files(args.raw_dir, suffix=".jsonl")
+    logger.info(f"Replaying {len(paths)} reports from {args.raw_dir} ({args.workers} workers)...")
+    start = time.perf_counter()
+    results = replay_reports(paths, args.reports_dir, args.write_dir, args.workers)
+    report = build_replay_report(results, time.perf_counter() - start)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, ensure_ascii=False)
+
+    summary = report["summary"]
+    changes = ", ".join(f"{count} {change}" for change, count in sorted(summary["component_changes"].items())) or "none"
+    logger.info(f"Done in {summary['elapsed_seconds']}s: {summary['components']} components replayed, outcome changes: {changes}; "
+                f"{summary['final_reports_changed']} final reports changed, {summary['errors']} errors")
+    for component_name, counts in sorted(report["by_component"].items()):
+        logger.info(f"  {component_name:<16}" + ", ".join(f"{count} {change}" for change, count in sorted(counts.items())))
+    logger.info(f"Replay report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+import os
+import json
+import logging
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Feedback used instead of a feedback-agent call when the policy decides it is not worth it
+STATIC_FEEDBACK = "Your previous output was rejected. Please ensure your output is ONLY valid JSON and strictly conforms to the schema."
+
+
+def _empty_component_stats() -> Dict[str, Any]:
+    return {
+        'attempts': {},            # attempt number -> {'tried', 'succeeded', 'latency_total'}
+        'escalated_attempts': {},  # same shape, for attempts run on the escalation model
+        'speculative_attempts': {},  # same shape, for attempts run as speculative variants
+        'error_types': {},         # error type name -> count
+        'feedback': {},            # error type name -> {'given', 'next_succeeded', 'latency_total'}
+    }
+
+
+class RetryPolicy:
+    """
+    History-driven retry policy for component extraction.
+
+    Persists per-component statistics (success rate by attempt number, error types,
+    attempt and feedback latency) and uses them to decide:
+    - how many attempts a component gets (futile trailing attempts are cut),
+    - whether the feedback agent is called after a failed attempt,
+    - from which attempt on the escalation model is used (if one is configured).
+    - whether a component's attempts run speculatively (if variants are enabled).
+
+    Decisions are based on plain attempts only: escalated and speculative attempts are
+    recorded separately, so their outcomes do not feed back into the decisions that
+    trigger them. Decisions only deviate from the defaults once a statistic has at least
+    `min_samples` observations, so a fresh policy behaves like the fixed loop.
+    A cut attempt, skipped feedback or escalated attempt still runs (on the main model)
+    every `explore_every`-th time the decision is made, so its statistics keep updating and a bad early sample (e.g.
+    while the model was down) is corrected.
+    """
+
+    def __init__(
+        self,
+        stats_path: Optional[str] = None,
+        default_max_attempts: int = 5,
+        min_attempts: int = 1,
+        min_samples: int = 20,
+        min_attempt_success_rate: float = 0.02,
+        min_feedback_success_rate: float = 0.02,
+        escalate_below_success_rate: float = 0.0,
+        speculate_below_success_rate: float = 0.5,
+        explore_every: int = 20,
+    ):
+        """
+        Args:
+            stats_path: JSON file the statistics are loaded from and saved to (None keeps them in memory).
+            default_max_attempts: Attempt cap used until history says otherwise.
+            min_attempts: The cap is never lowered below this number of attempts.
+            min_samples: Observations required before a statistic influences a decision.
+            min_attempt_success_rate: Trailing attempts whose historical success rate is below this are cut.
+            min_feedback_success_rate: Feedback for an error type is skipped (static feedback is used instead)
+                if the attempts that followed it succeeded less often than this.
+            escalate_below_success_rate: Attempts whose historical success rate is below this run on the
+                escalation model. 0 disables escalation.
+            speculate_below_success_rate: Components whose first-attempt success rate is below this
+                run their attempts speculatively (when speculative variants are enabled).
+            explore_every: Every this many decisions to cut an attempt, skip feedback or escalate an
+                attempt, it is run anyway, on the main model (0 never re-explores).
+        """
+        self.stats_path = stats_path
+        self.default_max_attempts = default_max_attempts
+        self.min_attempts = min_attempts
+        self.min_samples = min_samples
+        self.min_attempt_success_rate = min_attempt_success_rate
+        self.min_feedback_success_rate = min_feedback_success_rate
+        self.escalate_below_success_rate = escalate_below_success_rate
+        self.speculate_below_success_rate = speculate_below_success_rate
+        self.explore_every = explore_every
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._explore_counts: Dict[Tuple[str, ...], int] = {}
+        if stats_path:
+            self.load()
+
+    @classmethod
+    def from_env(cls, stats_path: Optional[str] = None) -> "RetryPolicy":
+        """Builds a policy configured from RETRY_* environment variables."""
+        return cls(
+            stats_path=stats_path if stats_path is not None else os.getenv("RETRY_STATS_PATH"),
+            default_max_attempts=int(os.getenv("RETRY_MAX_ATTEMPTS", "5")),
+            min_attempts=int(os.getenv("RETRY_MIN_ATTEMPTS", "1")),
+            min_samples=int(os.getenv("RETRY_MIN_SAMPLES", "20")),
+            min_attempt_success_rate=float(os.getenv("RETRY_MIN_ATTEMPT_SUCCESS_RATE", "0.02")),
+            min_feedback_success_rate=float(os.getenv("RETRY_MIN_FEEDBACK_SUCCESS_RATE", "0.02")),
+            escalate_below_success_rate=float(os.getenv("RETRY_ESCALATE_BELOW_SUCCESS_RATE", "0.0")),
+            speculate_below_success_rate=float(os.getenv("RETRY_SPECULATE_BELOW_SUCCESS_RATE", "0.5")),
+            explore_every=int(os.getenv("RETRY_EXPLORE_EVERY", "20")),
+        )
+
+    #--------------------------------------------------------------------------
+    # Persistence
+    #--------------------------------------------------------------------------
+    def load(self) -> None:
+        """Loads statistics from `stats_path`, starting empty if the file is missing or unreadable."""
+        if not self.stats_path or not os.path.isfile(self.stats_path):
+            return
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            with self._lock:
+                self._stats = {name: {**_empty_component_stats(), **stats} for name, stats in loaded.items()}
+            logger.info(f"Retry statistics loaded from {self.stats_path}.")
+        except Exception as e:
+            logger.error(f"Error loading retry statistics from {self.stats_path}: {e}. Starting with empty history.")
+
+    def save(self) -> None:
+        """Atomically writes the statistics to `stats_path`."""
+        if not self.stats_path:
+            return
+        with self._lock:
+            payload = json.dumps(self._stats, indent=2)
+        tmp_path = f"{self.stats_path}.tmp"
+        try:
+            stats_dir = os.path.dirname(self.stats_path)
+            if stats_dir:
+                os.makedirs(stats_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.stats_path)
+        except Exception as e:
+            logger.error(f"Error saving retry statistics to {self.stats_path}: {e}")
+
+    #--------------------------------------------------------------------------
+    # Recording
+    #--------------------------------------------------------------------------
+    def record_attempt(
+        self,
+        component_name: str,
+        attempt_num: int,
+        succeeded: bool,
+        latency: float,
+        error_type: Optional[str] = None,
+        escalated: bool = False,
+        feedback_error_type: Optional[str] = None,
+        speculative: bool = False,
+    ) -> None:
+        """
+        Records the outcome of one extraction attempt.
+
+        Args:
+            feedback_error_type: If the attempt was run with feedback generated by the
+                feedback agent, the error type that feedback addressed.
+            speculative: The attempt ran as speculative variants. It is recorded in its own
+                bucket and not counted for the feedback statistics, since the variants
+                succeed more often than a plain attempt.
+        """
+        with self._lock:
+            stats = self._stats.setdefault(component_name, _empty_component_stats())
+            bucket = stats['escalated_attempts' if escalated else 'speculative_attempts' if speculative else 'attempts']
+            entry = bucket.setdefault(str(attempt_num), {'tried': 0, 'succeeded': 0, 'latency_total': 0.0})
+            entry['tried'] += 1
+            entry['succeeded'] += int(succeeded)
+            entry['latency_total'] += latency
+            if error_type:
+                stats['error_types'][error_type] = stats['error_types'].get(error_type, 0) + 1
+            if feedback_error_type and not speculative:
+                fb = stats['feedback'].setdefault(feedback_error_type, {'given': 0, 'next_succeeded': 0, 'latency_total': 0.0})
+                fb['given'] += 1
+                fb['next_succeeded'] += int(succeeded)
+
+    def record_feedback_latency(self, component_name: str, error_type: str, latency: float) -> None:
+        """Records how long the feedback agent took for an error of `error_type`."""
+        with self._lock:
+            stats = self._stats.setdefault(component_name, _empty_component_stats())
+            fb = stats['feedback'].setdefault(error_type, {'given': 0, 'next_succeeded': 0, 'latency_total': 0.0})
+            fb['latency_total'] += latency
+
+    #--------------------------------------------------------------------------
+    # Decisions
+    #--------------------------------------------------------------------------
+    def _attempt_success_rate(self, component_name: str, attempt_num: int) -> Optional[float]:
+        """Historical success rate of `attempt_num`, or None if there are too few samples."""
+        entry = self._stats.get(component_name, {}).get('attempts', {}).get(str(attempt_num))
+        if not entry or entry['tried'] < self.min_samples:
+            return None
+        return entry['succeeded'] / entry['tried']
+
+    def _explore(self, *key: str) -> bool:
+        """Counts a decision against history (under the lock); True every `explore_every`-th time."""
+        if self.explore_every <= 0:
+            return False
+        count = self._explore_counts.get(key, 0) + 1
+        self._explore_counts[key] = count
+        return count % self.explore_every == 0
+
+    def max_attempts(self, component_name: str, upper_bound: Optional[int] = None, explore: bool = True) -> int:
+        """
+        Returns the attempt cap for a component: the default cap with trailing attempts
+        that historically (almost) never succeed removed. With `explore`, a cut attempt is
+        kept every `explore_every`-th time (the summary reports the cap without it).
+        """
+        cap = self.default_max_attempts if upper_bound is None else min(self.default_max_attempts, upper_bound)
+        with self._lock:
+            while cap > self.min_attempts:
+                rate = self._attempt_success_rate(component_name, cap)
+                if rate is None or rate >= self.min_attempt_success_rate:
+                    break
+                if explore and self._explore(component_name, 'attempt', str(cap)):
+                    logger.info(f"Re-exploring attempt {cap} of {component_name} (historical success rate {rate:.1%}).")
+                    break
+                cap -= 1
+        return cap
+
+    def should_generate_feedback(self, component_name: str, attempt_num: int, max_attempts: int, error_type: str) -> bool:
+        """
+        Decides whether the feedback agent should be called after a failed attempt.
+        Feedback is never generated after the last attempt, and is skipped for error
+        types where the attempt that followed feedback historically did not succeed
+        (except every `explore_every`-th time).
+        """
+        if attempt_num >= max_attempts:
+            return False
+        with self._lock:
+            fb = self._stats.get(component_name, {}).get('feedback', {}).get(error_type)
+            if not fb or fb['given'] < self.min_samples:
+                return True
+            if fb['next_succeeded'] / fb['given'] >= self.min_feedback_success_rate:
+                return True
+            return self._explore(component_name, 'feedback', error_type)
+
+    def escalate_from_attempt(self, component_name: str, max_attempts: int, explore: bool = True) -> Optional[int]:
+        """
+        Returns the first attempt number (from 2 on) that should run on the escalation
+        model, i.e. the first retry whose historical success rate is below
+        `escalate_below_success_rate`, or None if no escalation is warranted. With
+        `explore`, such an attempt still runs on the main model every `explore_every`-th
+        time, so its (plain) success rate keeps updating.
+        """
+        if self.escalate_below_success_rate <= 0:
+            return None
+        with self._lock:
+            for attempt_num in range(2, max_attempts + 1):
+                rate = self._attempt_success_rate(component_name, attempt_num)
+                if rate is None or rate >= self.escalate_below_success_rate:
+                    continue
+                if explore and self._explore(component_name, 'escalate', str(attempt_num)):
+                    logger.info(f"Re-exploring attempt {attempt_num} of {component_name} on the main model (historical success rate {rate:.1%}).")
+                    continue
+                return attempt_num
+        return None
+
+    def first_attempt_success_rate(self, component_name: str) -> Optional[float]:
+        """Historical first-attempt success rate, or None if there are too few samples."""
+        with self._lock:
+            return self._attempt_success_rate(component_name, 1)
+
+    def should_speculate(self, component_name: str, explore: bool = True) -> bool:
+        """
+        True if the component's first (plain) attempt historically succeeds less often than
+        `speculate_below_success_rate`. With `explore`, every `explore_every`-th call still
+        returns False, so the plain first-attempt rate keeps being measured.
+        """
+        with self._lock:
+            rate = self._attempt_success_rate(component_name, 1)
+            if rate is None or rate >= self.speculate_below_success_rate:
+                return False
+            return not (explore and self._explore(component_name, 'plain'))
+
+    #--------------------------------------------------------------------------
+    # Reporting
+    #--------------------------------------------------------------------------
+    def summary(self) -> Dict[str, Any]:
+        """Returns the configuration, statistics and current decisions per component, for the batch summary."""
+        components: Dict[str, Any] = {}
+        with self._lock:
+            snapshot = json.loads(json.dumps(self._stats))
+        for component_name, stats in sorted(snapshot.items()):
+            attempts = {}
+            for attempt_num, entry in sorted(stats['attempts'].items(), key=lambda kv: int(kv[0])):
+                attempts[attempt_num] = {
+                    'tried': entry['tried'],
+                    'succeeded': entry['succeeded'],
+                    'success_rate': round(entry['succeeded'] / entry['tried'], 4) if entry['tried'] else None,
+                    'mean_latency': round(entry['latency_total'] / entry['tried'], 3) if entry['tried'] else None,
+                }
+            feedback = {
+                error_type: {
+                    'given': fb['given'],
+                    'next_success_rate': round(fb['next_succeeded'] / fb['given'], 4) if fb['given'] else None,
+                    'mean_latency': round(fb['latency_total'] / fb['given'], 3) if fb['given'] else None,
+                }
+                for error_type, fb in stats['feedback'].items()
+            }
+            max_attempts = self.max_attempts(component_name, explore=False)
+            components[component_name] = {
+                'max_attempts': max_attempts,
+                'escalate_from_attempt': self.escalate_from_attempt(component_name, max_attempts, explore=False),
+                'speculative': self.should_speculate(component_name, explore=False),
+                'attempts': attempts,
+                'escalated_attempts': stats['escalated_attempts'],
+                'speculative_attempts': stats['speculative_attempts'],
+                'error_types': stats['error_types'],
+                'feedback': feedback,
+            }
+        return {
+            'config': {
+                'default_max_attempts': self.default_max_attempts,
+                'min_attempts': self.min_attempts,
+                'min_samples': self.min_samples,
+                'min_attempt_success_rate': self.min_attempt_success_rate,
+                'min_feedback_success_rate': self.min_feedback_success_rate,
+                'escalate_below_success_rate': self.escalate_below_success_rate,
+                'speculate_below_success_rate': self.speculate_below_success_rate,
+                'explore_every': self.explore_every,
+            },
+            'components': components,
+        }
@@ -0,0 +1,283 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Marks a field that exists on one side of a comparison only
+_MISSING = "<missing>"
+
+# List of reports adapter, built once per process
+_report_adapter: Optional[TypeAdapter] = None
+
+
+def get_report_adapter() -> TypeAdapter:
+    """Returns the cached TypeAdapter for a list of EchoReport objects."""
+    global _report_adapter
+    if _report_adapter is None:
+        from .models import EchoReport
+        _report_adapter = TypeAdapter(List[EchoReport])
+    return _report_adapter
+
+
+#--------------------------------------------------------------------------
+# Comparison
+#--------------------------------------------------------------------------
+def _join(path: str, part: Any) -> str:
+    if isinstance(part, int):
+        return f"{path}[{part}]"
+    return f"{path}.{part}" if path else str(part)
+
+
+def _flatten(value: Any, path: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yields (path, leaf value) pairs, with paths like 'Cardiac_Chambers.Left_Ventricle.measurements[0]'."""
+    if isinstance(value, dict) and value:
+        for key, child in value.items():
+            yield from _flatten(child, _join(path, key))
+    elif isinstance(value, list) and value:
+        for i, child in enumerate(value):
+            yield from _flatten(child, _join(path, i))
+    else:
+        yield path, value
+
+
+def diff_values(stored: Any, revalidated: Any) -> List[List[Any]]:
+    """Returns [path, stored value, revalidated value] for every leaf that differs."""
+    old = dict(_flatten(stored))
+    new = dict(_flatten(revalidated))
+    changes = []
+    for path in list(old) + [p for p in new if p not in old]:
+        before = old.get(path, _MISSING)
+        after = new.get(path, _MISSING)
+        if before != after or isinstance(before, bool) != isinstance(after, bool):
+            changes.append([path, before, after])
+    return changes
+
+
+def _normalize(key: Any) -> str:
+    return str(key).replace(" ", "").replace("_", "").lower()
+
+
+def _error_path(loc: Tuple[Any, ...], data: Any, missing: bool = False) -> str:
+    """
+    The error location as a path into the stored report: the longest prefix of `loc`
+    that exists in the data (so union member tags like 'float' are dropped), plus the
+    absent key itself for 'missing' errors.
+    """
+    path = ""
+    node = data
+    for part in loc:
+        if isinstance(node, dict):
+            # Errors are located by alias ('Left Ventricle'), stored reports are keyed by name
+            key = part if part in node else next((k for k in node if _normalize(k) == _normalize(part)), None)
+            if key is None:
+                return _join(path, part) if missing else path
+            node = node[key]
+            part = key
+        elif isinstance(node, list) and isinstance(part, int) and 0 <= part < len(node):
+            node = node[part]
+        else:
+            return path
+        path = _join(path, part)
+    return path
+
+
+def _failures(error: ValidationError, reports: List[Any]) -> Dict[int, List[Dict[str, Any]]]:
+    """Groups the errors of a list validation by report index, one entry per field path."""
+    grouped: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    for err in error.errors():
+        index, loc = err["loc"][0], err["loc"][1:]
+        path = _error_path(loc, reports[index], missing=err["type"] == "missing")
+        entry = grouped.setdefault(index, {}).setdefault(path, {
+            "path": path,
+            "types": [],
+            "message": err["msg"],
+            # Only scalar inputs; a missing field would otherwise repeat its whole parent
+            "input": err.get("input") if not isinstance(err.get("input"), (dict, list)) else None,
+        })
+        if err["type"] not in entry["types"]:
+            entry["types"].append(err["type"])
+    return {index: list(paths.values()) for index, paths in grouped.items()}
+
+
+#--------------------------------------------------------------------------
+# Batches
+#--------------------------------------------------------------------------
+def revalidate_batch(paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Loads and revalidates one batch of stored reports.
+
+    The batch is validated as one list with the cached adapter. Reports that fail are
+    recorded with their errors, and the rest are validated again as a list so their
+    values can be compared with the stored ones.
+
+    Returns:
+        One result per file: {'id', 'path', 'status', 'changed', 'failed'}, where status
+        is 'unchanged', 'changed', 'failed' or 'unreadable'.
+    """
+    adapter = get_report_adapter()
+    results: List[Dict[str, Any]] = []
+    reports: List[Any] = []
+    loaded: List[Dict[str, Any]] = []
+    for path in paths:
+        result = {"id": os.path.splitext(os.path.basename(path))[0], "path": path, "status": "unchanged", "changed": [], "failed": []}
+        results.append(result)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                reports.append(json.load(f))
+            loaded.append(result)
+        except (OSError, ValueError) as e:
+            result["status"] = "unreadable"
+            result["failed"] = [{"path": "<file>", "types": ["unreadable"], "message": str(e), "input": None}]
+
+    pending = list(range(len(reports)))
+    while pending:
+        batch = [reports[i] for i in pending]
+        try:
+            validated = adapter.validate_python(batch)
+        except ValidationError as e:
+            failures = _failures(e, batch)
+            for position, errors in failures.items():
+                loaded[pending[position]]["status"] = "failed"
+                loaded[pending[position]]["failed"] = errors
+            pending = [i for position, i in enumerate(pending) if position not in failures]
+            continue
+        for i, revalidated in zip(pending, adapter.dump_python(validated, mode="json")):
+            changes = diff_values(reports[i], revalidated)
+            if changes:
+                loaded[i]["status"] = "changed"
+                loaded[i]["changed"] = changes
+        break
+    return results
+
+
+def _batches(paths: List[str], batch_size: int) -> List[List[str]]:
+    return [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+
+
+def list_report_files(reports_dir: str, suffix: str = ".json") -> List[str]:
+    """Paths of the stored reports in `reports_dir`, sorted by name."""
+    with os.scandir(reports_dir) as entries:
+        return sorted(entry.path for entry in entries if entry.is_file() and entry.name.endswith(suffix))
+
+
+def revalidate_reports(
+    paths: List[str],
+    workers: Optional[int] = None,
+    batch_size: int = 200,
+) -> List[Dict[str, Any]]:
+    """
+    Revalidates stored reports against the current models, without any LLM calls.
+
+    Args:
+        paths: The report JSON files (as written to FINAL_REPORTS_DIR).
+        workers: Number of worker processes (None or 1 processes serially).
+        batch_size: Reports validated together as one list.
+
+    Returns:
+        The per-report results of revalidate_batch, in input order.
+    """
+    batches = _batches(paths, batch_size)
+    if workers and workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batch_results = list(pool.map(revalidate_batch, batches))
+    else:
+        batch_results = [revalidate_batch(batch) for batch in batches]
+    return [result for batch in batch_results for result in batch]
+
+
+#--------------------------------------------------------------------------
+# Diff report
+#--------------------------------------------------------------------------
+def _field_pattern(path: str) -> str:
+    """Collapses list indices so the same field of different list items is counted together."""
+    out = []
+    skipping = False
+    for ch in path:
+        if ch == "[":
+            skipping = True
+            out.append("[]")
+        elif ch == "]":
+            skipping = False
+        elif not skipping:
+            out.append(ch)
+    return "".join(out)
+
+
+def build_diff_report(results: List[Dict[str, Any]], elapsed: float = 0.0) -> Dict[str, Any]:
+    """
+    Compact diff report: status counts, how often each field changed or failed, and
+    the changed/failed fields of every report that is not unchanged.
+    """
+    status_counts: Dict[str, int] = {}
+    changed_fields: Dict[str, int] = {}
+    failed_fields: Dict[str, int] = {}
+    reports: Dict[str, Any] = {}
+    for result in results:
+        status_counts[result["status"]] = status_counts.get(result["status"], 0) + 1
+        if result["status"] == "unchanged":
+            continue
+        for path, _, _ in result["changed"]:
+            pattern = _field_pattern(path)
+            changed_fields[pattern] = changed_fields.get(pattern, 0) + 1
+        for failure in result["failed"]:
+            pattern = _field_pattern(failure["path"])
+            failed_fields[pattern] = failed_fields.get(pattern, 0) + 1
+        entry: Dict[str, Any] = {"status": result["status"]}
+        if result["changed"]:
+            entry["changed"] = result["changed"]
+        if result["failed"]:
+            entry["failed"] = result["failed"]
+        reports[result["id"]] = entry
+    return {
+        "summary": {
+            "reports": len(results),
+            "status": status_counts,
+            "elapsed_seconds": round(elapsed, 3),
+        },
+        "changed_fields": dict(sorted(changed_fields.items(), key=lambda kv: -kv[1])),
+        "failed_fields": dict(sorted(failed_fields.items(), key=lambda kv: -kv[1])),
+        "reports": reports,
+    }
+
+
+#--------------------------------------------------------------------------
+# CLI
+#--------------------------------------------------------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Revalidate stored final reports against the current models (no LLM calls).")
+    parser.add_argument("--reports-dir", default=os.getenv("FINAL_REPORTS_DIR", "main_app/final_reports"), help="Directory of stored report JSON files.")
+    parser.add_argument("--output", default="revalidation_report.json", help="Where to write the diff report.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (1 = serial).")
+    parser.add_argument("--batch-size", type=int, default=200, help="Reports validated together as one list.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    paths = list_report_files(args.reports_dir)
+    logger.info(f"Revalidating {len(paths)} reports from {args.reports_dir} ({args.workers} workers, batches of {args.batch_size})...")
+    start = time.perf_counter()
+    results = revalidate_reports(paths, workers=args.workers, batch_size=args.batch_size)
+    report = build_diff_report(results, time.perf_counter() - start)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, ensure_ascii=False)
+
+    summary = report["summary"]
+    logger.info(f"Done in {summary['elapsed_seconds']}s: " + ", ".join(f"{count} {status}" for status, count in sorted(summary["status"].items())))
+    for title, fields in (("Changed fields", report["changed_fields"]), ("Failed fields", report["failed_fields"])):
+        if fields:
+            logger.info(f"{title}:")
+            for pattern, count in list(fields.items())[:20]:
+                logger.info(f"  {count:>6}  {pattern}")
+    logger.info(f"Diff report written to {args.output}")
+    return 1 if summary["status"].get("failed") or summary["status"].get("unreadable") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,11 @@
 import json
 import copy
 import textwrap
-from typing import Dict, Any, List, Union
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple, Type, Union
+
+from pydantic import BaseModel
 
 
 def resolve_ref(schema: Dict[str, Any], ref: str) -> Dict[str, Any]:
@@ -55,7 +59,13 @@ def get_schema_snippet(schema: Dict[str, Any], loc: tuple, max_resolve_depth: in
     """
     Navigates the JSON schema based on the Pydantic error location tuple
     and returns the relevant sub-schema snippet, resolving references recursively.
+    For repeated lookups, get_schema_index(schema).snippet() returns a cached, read-only copy.
     """
+    return recursively_resolve_refs(_navigate(schema, loc), schema, 0, max_resolve_depth)
+
+
+def _navigate(schema: Dict[str, Any], loc: tuple) -> Any:
+    """Returns the sub-schema at an error location (unresolved), or an error dict."""
     current_schema = schema
     original_schema = schema 
 
@@ -105,7 +115,128 @@ def get_schema_snippet(schema: Dict[str, Any], loc: tuple, max_resolve_depth: in
         else:
             return {"error": f"Unexpected part type '{type(part)}' in loc at path {'.'.join(map(str, loc[:i+1]))}"}
 
-    return recursively_resolve_refs(current_schema, original_schema, 0, max_resolve_depth)
+    return current_schema
+
+
+# ── Memoized Snippet Index ────────────────────────────────────────────────────
+class FrozenDict(dict):
+    """Read-only dict for cached schema snippets (still a dict, so json.dumps handles it)."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached schema snippets are read-only; copy.deepcopy() one to modify it.")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Deep copies are mutable, like the snippets get_schema_snippet returns
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+
+def _freeze(value: Any) -> Any:
+    """Deep, immutable copy of a JSON-like value (dicts become FrozenDict, lists tuples)."""
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _resolve_frozen(snippet: Any, full_schema: Dict[str, Any], depth: int, max_depth: int) -> Any:
+    """Same result as recursively_resolve_refs, built directly as an immutable value without deep copies."""
+    if depth >= max_depth or not isinstance(snippet, (dict, list)):
+        return _freeze(snippet)
+    if isinstance(snippet, dict):
+        if '$ref' in snippet and isinstance(snippet['$ref'], str):
+            resolved_target = resolve_ref(full_schema, snippet['$ref'])
+            if 'error' not in resolved_target:
+                return _resolve_frozen(resolved_target, full_schema, depth + 1, max_depth)
+            return _freeze({**snippet, '$ref_error': resolved_target['error']})
+        return FrozenDict((key, _resolve_frozen(value, full_schema, depth + 1, max_depth)) for key, value in snippet.items())
+    return tuple(_resolve_frozen(item, full_schema, depth + 1, max_depth) for item in snippet)
+
+
+class SchemaSnippetIndex:
+    """
+    Index from (error location, resolve depth) to the resolved schema snippet of one
+    schema, together with its rendered JSON text.
+
+    Each entry is computed once, on first lookup, and shared afterwards: snippets are
+    immutable (FrozenDict / tuples), so no per-error deep copy is needed. Error locations
+    contain list indices and keys made up by the LLM, so both caches are bounded LRUs of
+    `maxsize` entries.
+    """
+
+    def __init__(self, schema: Dict[str, Any], maxsize: int = 4096):
+        self.schema = schema
+        self.maxsize = maxsize
+        self._snippets: "OrderedDict[Tuple[tuple, int], Any]" = OrderedDict()
+        self._rendered: "OrderedDict[Tuple[tuple, int, bool, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, cache: OrderedDict, key: tuple) -> Any:
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _put(self, cache: OrderedDict, key: tuple, value: Any) -> Any:
+        """Stores `value` unless another thread stored one first; returns the stored value."""
+        with self._lock:
+            value = cache.setdefault(key, value)
+            cache.move_to_end(key)
+            while len(cache) > self.maxsize:
+                cache.popitem(last=False)
+            return value
+
+    def snippet(self, loc: tuple, max_resolve_depth: int = 5) -> Any:
+        """The resolved snippet for `loc`, as get_schema_snippet would return it (but read-only)."""
+        key = (loc, max_resolve_depth)
+        snippet = self._get(self._snippets, key)
+        if snippet is None:
+            snippet = self._put(self._snippets, key, _resolve_frozen(_navigate(self.schema, loc), self.schema, 0, max_resolve_depth))
+        return snippet
+
+    def render(self, loc: tuple, max_resolve_depth: int = 5, ensure_ascii: bool = True, prefix: str = "") -> str:
+        """The snippet for `loc` as indented JSON text, with `prefix` added to every line."""
+        key = (loc, max_resolve_depth, ensure_ascii, prefix)
+        rendered = self._get(self._rendered, key)
+        if rendered is None:
+            rendered = json.dumps(self.snippet(loc, max_resolve_depth), indent=2, ensure_ascii=ensure_ascii)
+            if prefix:
+                rendered = textwrap.indent(rendered, prefix)
+            rendered = self._put(self._rendered, key, rendered)
+        return rendered
+
+
+# Indexes keyed by id() of their schema; the schema is kept alive by its index
+_schema_indexes: Dict[int, SchemaSnippetIndex] = {}
+_model_schemas: Dict[Type[BaseModel], Dict[str, Any]] = {}
+
+
+def get_schema_index(schema: Dict[str, Any]) -> SchemaSnippetIndex:
+    """Returns the snippet index of a schema, creating it on first use. Schemas are treated as immutable."""
+    index = _schema_indexes.get(id(schema))
+    if index is None or index.schema is not schema:
+        if len(_schema_indexes) >= 64:
+            _schema_indexes.clear()
+        index = SchemaSnippetIndex(schema)
+        _schema_indexes[id(schema)] = index
+    return index
+
+
+def get_model_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Returns `model.model_json_schema()`, generated once per model. Do not modify the returned schema."""
+    schema = _model_schemas.get(model)
+    if schema is None:
+        schema = _model_schemas.setdefault(model, model.model_json_schema())
+    return schema
 
 
 # ── Error Formatting for LLM Feedback Agent ───────────────────────────────────
@@ -130,15 +261,14 @@ def format_validation_errors_for_agent(errors: List[Dict[str, Any]], schema: Dic
         formatted_parts.append(f"Path: {'.'.join(map(str, loc_tuple))}")
         formatted_parts.append(f"Message: {msg} (Type: {error_type})")
 
-        schema_snippet = get_schema_snippet(schema, loc_tuple, max_resolve_depth=3) # Use max_resolve_depth 3
+        schema_index = get_schema_index(schema) # Snippets are resolved and rendered once per schema and location
 
         formatted_parts.append("Relevant Schema Snippet for this Error:")
         formatted_parts.append("```json")
         try:
-            snippet_json = json.dumps(schema_snippet, indent=2)
-            formatted_parts.extend(textwrap.indent(snippet_json, "  ").splitlines())
+            formatted_parts.append(schema_index.render(loc_tuple, max_resolve_depth=3, prefix="  ")) # Use max_resolve_depth 3
         except TypeError: # Handle cases where snippet might not be directly serializable (e.g. error dict from get_schema_snippet)
-            formatted_parts.append(textwrap.indent(str(schema_snippet), "  "))
+            formatted_parts.append(textwrap.indent(str(schema_index.snippet(loc_tuple, max_resolve_depth=3)), "  "))
         formatted_parts.append("```")
 
         if i < total_errors - 1:
@@ -157,8 +287,11 @@ def format_pydantic_errors_for_book(
 ) -> List[Dict[str, Any]]:
     """
     Formats Pydantic validation errors into a list of dictionaries suitable for
-    the Markdown book log. Each dictionary contains an ID, message, and schema snippet.
+    the Markdown book log. Each dictionary contains an ID, message, and schema snippet
+    (read-only and shared, with its JSON rendering under 'schema_snippet_json', which
+    JSONL traces leave out).
     """
+    schema_index = get_schema_index(relevant_schema)
     formatted_errors_for_book = []
     for i, error in enumerate(pydantic_errors):
         loc_tuple = tuple(error.get('loc', ('Unknown Location',))) # Ensure loc is a tuple
@@ -167,14 +300,15 @@ def format_pydantic_errors_for_book(
         
         # Get the schema snippet relevant to the error's location within the passed relevant_schema
         # (which could be a component schema or the full EchoReport schema)
-        schema_snippet_dict = get_schema_snippet(relevant_schema, loc_tuple, max_resolve_depth=2) # Keep snippet concise
+        schema_snippet_dict = schema_index.snippet(loc_tuple, max_resolve_depth=2) # Keep snippet concise
 
         full_error_message = f"Path: {component_name}.{'.'.join(map(str, loc_tuple))} - Message: {msg} (Type: {error_type})"
         
         formatted_errors_for_book.append({
             'id': f'V{i+1}', # Validation Error ID
             'message': full_error_message,
-            'schema_snippet': schema_snippet_dict 
+            'schema_snippet': schema_snippet_dict,
+            'schema_snippet_json': schema_index.render(loc_tuple, max_resolve_depth=2, ensure_ascii=False)
         })
     return formatted_errors_for_book
 
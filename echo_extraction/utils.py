@@ -1,15 +1,46 @@
 import logging
+import logging.handlers
+import atexit
+import contextlib
+import contextvars
+import hashlib
 import json
+import queue
+import re
 import textwrap
+import threading
 import os
 
+from .log_store import BLOB_DIR_NAME, CompressedFileHandler, strip_compression_suffix
+
 logger = logging.getLogger(__name__)
 
+# Per-report log: "jsonl" trace events (Markdown rendered on demand by render_log.py) or an eager "markdown" book
+LOG_FORMAT = os.getenv("LOG_FORMAT", "jsonl").lower()
+# Book records waiting for the background writer; when full, logging waits instead of dropping records
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "1000"))
+# Strings of these fields at least this long are stored once as blobs and referenced by hash in the trace (0 disables)
+LOG_BLOB_MIN_SIZE = int(os.getenv("LOG_BLOB_MIN_SIZE", "1024"))
+BLOB_FIELDS = frozenset({'raw_input', 'processed_input', 'report', 'schema'})
+
 class BookLogFilter(logging.Filter):
     """Filter log records intended for the Markdown book format."""
     def filter(self, record):
         return hasattr(record, 'log_type')
 
+_BACKTICK_RUN_RE = re.compile(r'`{3,}')
+
+def _code_block(content, info=''):
+    """
+    Fenced code block for `content`. The fence is longer than any backtick run in the
+    content (e.g. an LLM answer wrapped in ```json), so the content cannot close the
+    block early and the book needs no cleaning afterwards.
+    """
+    fence = '```'
+    if fence in content:
+        fence = '`' * (max(len(run) for run in _BACKTICK_RUN_RE.findall(content)) + 1)
+    return f"{fence}{info}\n{content}\n{fence}\n"
+
 class MarkdownBookFormatter(logging.Formatter):
     """Format log records into a structured Markdown document."""
     def format(self, record):
@@ -22,15 +53,14 @@ class MarkdownBookFormatter(logging.Formatter):
         if log_type == 'INPUT_SECTION':
             raw_input = getattr(record, 'raw_input', 'No raw input provided.')
             processed_input = getattr(record, 'processed_input', 'No processed input provided.')
+            abbreviation_version = getattr(record, 'abbreviation_version', None)
             parts.append("# 📥 Input\n")
+            if abbreviation_version:
+                parts.append(f"**Abbreviation Dictionary Version:** `{abbreviation_version}`\n\n")
             parts.append("## 🧾 Raw Input\n")
-            parts.append("```\n")
-            parts.append(raw_input + "\n")
-            parts.append("```\n")
+            parts.append(_code_block(raw_input))
             parts.append("## 🛠️ Processed Input\n")
-            parts.append("```\n")
-            parts.append(processed_input + "\n")
-            parts.append("```\n")
+            parts.append(_code_block(processed_input))
         elif log_type == 'COMPONENT_START':
             component_name = getattr(record, 'component_name', 'Unknown Component')
             parts.append(f"\n\n# 📖 {component_name}\n")
@@ -48,26 +78,29 @@ class MarkdownBookFormatter(logging.Formatter):
 
             parts.append("\n### 🔍 Extractor\n")
             parts.append("\n#### 📥 Input\n")
-            parts.append("```json\n")
             try:
                 input_json_str = json.dumps(extractor_input, indent=2, ensure_ascii=False)
-                parts.append(input_json_str + "\n")
             except Exception as e:
                 logger.error(f"Error formatting Input JSON for log: {e}")
-                parts.append("Error formatting Input JSON.\n")
-            parts.append("```\n")
+                input_json_str = "Error formatting Input JSON."
+            parts.append(_code_block(input_json_str, "json"))
 
             parts.append("\n#### 📤 Raw Output\n")
-            parts.append("```text\n")
             try:
-                if extractor_raw_output:
-                    parts.append(str(extractor_raw_output) + "\n")
-                else:
-                    parts.append("No raw output.\n")
+                raw_output_text = str(extractor_raw_output) if extractor_raw_output else "No raw output."
             except Exception as e:
                 logger.error(f"Error formatting Raw Output for log: {e}")
-                parts.append("Error formatting Raw Output.\n")
-            parts.append("```\n")
+                raw_output_text = "Error formatting Raw Output."
+            parts.append(_code_block(raw_output_text, "text"))
+
+            json_recovery = getattr(record, 'json_recovery', [])
+            if json_recovery:
+                parts.append("\n**JSON Recovery Applied:** " + ", ".join(json_recovery) + "\n")
+
+            speculative_variants = getattr(record, 'speculative_variants', [])
+            if speculative_variants:
+                variant_summary = ", ".join(f"{v['variant']}: {v['status']}" for v in speculative_variants)
+                parts.append("\n**Speculative Variants:** " + variant_summary + "\n")
 
             errors = getattr(record, 'errors', [])
             if errors:
@@ -76,6 +109,7 @@ class MarkdownBookFormatter(logging.Formatter):
                     error_id_display = f"Error {i+1}"
                     error_message = err_detail.get('message', 'No message provided.')
                     schema_snippet = err_detail.get('schema_snippet', {})
+                    schema_snippet_json = err_detail.get('schema_snippet_json') # Pre-rendered by the schema index
 
                     parts.append(f"\n#### {error_id_display}\n")
                     clean_error_message = str(error_message).strip().replace('`', "'")
@@ -83,14 +117,12 @@ class MarkdownBookFormatter(logging.Formatter):
 
                     if schema_snippet:
                         parts.append("\n**Related Schema:**\n")
-                        parts.append("```json\n")
                         try:
-                            schema_json_str = json.dumps(schema_snippet, indent=2, ensure_ascii=False)
-                            parts.append(schema_json_str + "\n")
+                            schema_json_str = schema_snippet_json or json.dumps(schema_snippet, indent=2, ensure_ascii=False)
                         except Exception as e:
                             logger.error(f"Error formatting Schema JSON for log: {e}")
-                            parts.append("Error formatting Schema JSON.\n")
-                        parts.append("```\n")
+                            schema_json_str = "Error formatting Schema JSON."
+                        parts.append(_code_block(schema_json_str, "json"))
 
             feedback_output = getattr(record, 'feedback_output', None)
             clean_feedback = str(feedback_output).strip() if feedback_output is not None else ""
@@ -98,9 +130,7 @@ class MarkdownBookFormatter(logging.Formatter):
 
             if clean_feedback and not is_default_feedback:
                 parts.append("\n### 💡 Feedback Generator\n")
-                parts.append("```text\n")
-                parts.append(clean_feedback + "\n")
-                parts.append("```\n")
+                parts.append(_code_block(clean_feedback, "text"))
         elif log_type == 'FINAL_REPORT_SECTION':
             successful_extractions = getattr(record, 'successful_extractions', 0)
             total_components = getattr(record, 'total_components', 0)
@@ -112,12 +142,88 @@ class MarkdownBookFormatter(logging.Formatter):
             parts.append(f"🎯 Successful Extractions: {successful_extractions}/{total_components} ({ratio:.2%})\n")
             parts.append(f"⏱️ Total Time: {total_time:.2f} seconds\n")
             parts.append("## 📝 Final Echo Report\n")
-            parts.append("```json\n")
-            parts.append(final_report_json + "\n")
-            parts.append("```\n")
+            parts.append(_code_block(final_report_json, "json"))
 
         return "".join(parts)
 
+class RawOutputFilter(logging.Filter):
+    """Filter the per-attempt records that carry the LLM's raw output."""
+    def filter(self, record):
+        return getattr(record, 'log_type', None) == 'ATTEMPT_PROCESSED'
+
+class RawOutputFormatter(logging.Formatter):
+    """Format each extraction attempt as one JSON line for the raw-output store (see replay.py)."""
+    def format(self, record):
+        raw_output = getattr(record, 'extractor_raw_output', '')
+        entry = {
+            'component': getattr(record, 'component_name', None),
+            'attempt': getattr(record, 'attempt_num', None),
+            'max_attempts': getattr(record, 'max_attempts', None),
+            'status': getattr(record, 'status', None),
+            'escalated': getattr(record, 'escalated', False),
+            'json_recovery': getattr(record, 'json_recovery', []),
+            'errors': [str(err.get('message', '')) for err in getattr(record, 'errors', [])],
+            # 'Not yet generated.' marks an attempt that failed before the LLM answered
+            'raw_output': raw_output if raw_output != 'Not yet generated.' else '',
+        }
+        return json.dumps(entry, ensure_ascii=False)
+
+# Attributes every LogRecord has; the rest of a record's attributes are its `extra` fields
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'taskName'}
+
+# Digest of each recently stored blob text; str hashes are cached, so a repeated text is found without rehashing it
+_blob_digests = {}
+# Blob files known to exist, so shared storage is checked at most once per blob and process
+_written_blobs = set()
+
+class TraceFormatter(logging.Formatter):
+    """
+    Format each book record as one compact JSON event: time, level, message and all `extra` fields.
+    With a blob directory, large repeated strings (report text, processed text, prompt schema;
+    see BLOB_FIELDS) are written once to `<blob_dir>/<sha256>` and replaced by {"$blob": "<sha256>"}.
+    """
+    def __init__(self, blob_dir=None, min_blob_size=LOG_BLOB_MIN_SIZE):
+        super().__init__()
+        self.blob_dir = blob_dir
+        self.min_blob_size = min_blob_size
+
+    def _blob_ref(self, text):
+        digest = _blob_digests.get(text)
+        if digest is None:
+            digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            if len(_blob_digests) >= 256:
+                _blob_digests.clear()
+            _blob_digests[text] = digest
+        path = os.path.join(self.blob_dir, digest)
+        if path not in _written_blobs:
+            if not os.path.exists(path):
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, path) # Atomic, so concurrent writers of the same blob are safe
+            _written_blobs.add(path)
+        return {'$blob': digest}
+
+    def _externalize(self, key, value):
+        if isinstance(value, str):
+            if key in BLOB_FIELDS and len(value) >= self.min_blob_size:
+                return self._blob_ref(value)
+        elif isinstance(value, dict):
+            return {k: self._externalize(k, v) for k, v in value.items()}
+        return value
+
+    def format(self, record):
+        event = {'time': record.created, 'level': record.levelname, 'message': record.getMessage()}
+        blobs = self.blob_dir is not None and self.min_blob_size > 0
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                if key == 'errors' and isinstance(value, list):
+                    # The rendered snippet repeats 'schema_snippet'; render_log renders it again from the dict
+                    value = [{k: v for k, v in err.items() if k != 'schema_snippet_json'} if isinstance(err, dict) else err
+                             for err in value]
+                event[key] = self._externalize(key, value) if blobs else value
+        return json.dumps(event, ensure_ascii=False, separators=(',', ':'), default=str)
+
 def setup_logging():
     """Set up logging with console output only."""
     root_logger = logging.getLogger()
@@ -134,20 +240,188 @@ def setup_logging():
 
     logger.info("Console logging setup (INFO+).")
 
-def set_log_file(log_file_path: str):
-    """Dynamically set the file handler for logging to a specific Markdown file."""
-    root_logger = logging.getLogger()
-    # Remove existing file handlers
-    for handler in root_logger.handlers[:]:
-        if isinstance(handler, logging.FileHandler):
-            root_logger.removeHandler(handler)
-            handler.close()
-    
-    # Add new file handler
-    file_handler = logging.FileHandler(log_file_path, mode='w', encoding='utf-8')
+#--------------------------------------------------------------------------
+# Background writer for the per-report files
+#--------------------------------------------------------------------------
+# Report whose log the records of the current thread/task belong to
+current_report_id = contextvars.ContextVar('current_report_id', default=None)
+
+class BlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a bounded queue: waits for room instead of dropping the record.
+    Each record is stamped with `current_report_id` on the logging thread, since the
+    listener thread does not share its context.
+    """
+    def prepare(self, record):
+        record = super().prepare(record)
+        record.report_id = current_report_id.get()
+        return record
+
+    def enqueue(self, record):
+        self.queue.put(record)
+
+class ReportLogRouter(logging.Handler):
+    """Runs in the listener thread and hands each record to the log files of its report."""
+    def __init__(self):
+        super().__init__()
+        self._sinks = {}
+
+    def open(self, report_id, handlers):
+        with self.lock:
+            for handler in self._sinks.pop(report_id, ()):
+                handler.close()
+            self._sinks[report_id] = handlers
+
+    def close_all(self):
+        with self.lock:
+            for handlers in self._sinks.values():
+                for handler in handlers:
+                    handler.close()
+            self._sinks.clear()
+
+    def emit(self, record):
+        closing = getattr(record, 'close_report_id', None)
+        if closing is not None:
+            # Marker queued by close_report_log: every earlier record of the report is written
+            for handler in self._sinks.pop(closing, ()):
+                handler.close()
+            record.closed.set()
+            return
+        for handler in self._sinks.get(getattr(record, 'report_id', None), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_router = ReportLogRouter()
+_queue_handler = None
+_log_listener = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_log_writer():
+    """Starts the background listener once and (re)installs the queue handler on the root logger."""
+    global _queue_handler, _log_listener
+    with _listener_lock:
+        if _log_listener is None:
+            _log_listener = logging.handlers.QueueListener(_log_queue, _router)
+            _log_listener.start()
+        root_logger = logging.getLogger()
+        if _queue_handler is None or _queue_handler not in root_logger.handlers:
+            _queue_handler = BlockingQueueHandler(_log_queue)
+            _queue_handler.setLevel(logging.DEBUG)
+            _queue_handler.addFilter(BookLogFilter()) # Only book records leave the logging thread
+            root_logger.addHandler(_queue_handler)
+
+
+def _stop_log_writer():
+    """Writes out every queued record and closes all report logs (at exit)."""
+    global _log_listener
+    with _listener_lock:
+        if _queue_handler is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+        if _log_listener is not None:
+            _log_listener.stop() # Processes all queued records before returning
+            _log_listener = None
+    _router.close_all()
+
+atexit.register(_stop_log_writer)
+
+
+def _report_handlers(log_file_path, raw_output_path=None):
+    """
+    The file handlers of one report: the JSONL trace or Markdown book (compressed if the
+    path ends with .gz or .zst), and optionally the raw outputs.
+    """
+    file_handler = CompressedFileHandler(log_file_path, mode='w', encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
-    book_formatter = MarkdownBookFormatter()
+    if strip_compression_suffix(log_file_path).endswith('.jsonl'):
+        # Blobs are shared by all reports logged to the same directory
+        blob_dir = os.path.join(os.path.dirname(log_file_path), BLOB_DIR_NAME)
+        os.makedirs(blob_dir, exist_ok=True)
+        book_formatter = TraceFormatter(blob_dir)
+    else:
+        book_formatter = MarkdownBookFormatter()
     file_handler.setFormatter(book_formatter)
     file_handler.addFilter(BookLogFilter())
-    root_logger.addHandler(file_handler)
-    logger.info(f"Set log file to '{log_file_path}'")
\ No newline at end of file
+    handlers = [file_handler]
+
+    if raw_output_path:
+        raw_output_handler = logging.FileHandler(raw_output_path, mode='w', encoding='utf-8')
+        raw_output_handler.setLevel(logging.DEBUG)
+        raw_output_handler.setFormatter(RawOutputFormatter())
+        raw_output_handler.addFilter(RawOutputFilter())
+        handlers.append(raw_output_handler)
+    return handlers
+
+
+def open_report_log(report_id: str, log_file_path: str, raw_output_path: str = None):
+    """
+    Opens the log files of a report: a JSONL trace (one event per book record) if the
+    path ends with .jsonl, otherwise the Markdown book, gzip or zstd compressed if it
+    ends with .gz or .zst (see log_store). If `raw_output_path` is given,
+    every extraction attempt's raw LLM output is also written there as one JSON line,
+    for replaying the report without the LLM.
+
+    Book records logged while `current_report_id` is `report_id` go to these files.
+    Records are only queued on the logging thread; a background listener formats
+    them and writes the files.
+    """
+    _ensure_log_writer()
+    _router.open(report_id, _report_handlers(log_file_path, raw_output_path))
+
+
+def close_report_log(report_id: str):
+    """Waits until every record of the report queued so far is written, then closes its files."""
+    marker = logging.makeLogRecord({'close_report_id': report_id, 'closed': threading.Event(), 'levelno': logging.CRITICAL})
+    with _listener_lock:
+        running = _log_listener is not None
+        if running:
+            _log_queue.put(marker)
+    if running:
+        marker.closed.wait()
+
+
+@contextlib.contextmanager
+def report_log(report_id: str, log_file_path: str, raw_output_path: str = None):
+    """
+    Routes the book records of the enclosed code (in this thread or task, and in threads
+    started with a copy of its context) to the report's own log files, and writes them out
+    on exit. Reports processed concurrently each get their own files.
+    """
+    open_report_log(report_id, log_file_path, raw_output_path)
+    token = current_report_id.set(report_id)
+    try:
+        yield
+    finally:
+        current_report_id.reset(token)
+        close_report_log(report_id)
+
+
+# Report opened by set_log_file, for one-report-at-a-time processing
+_file_report_id = None
+
+
+def close_log_file():
+    """
+    Writes out every queued record and closes the log files opened by set_log_file.
+    Call when a report is complete, before its files are read (e.g. by render_log).
+    """
+    global _file_report_id
+    if _file_report_id is not None:
+        close_report_log(_file_report_id)
+        _file_report_id = None
+
+
+def set_log_file(log_file_path: str, raw_output_path: str = None):
+    """
+    Dynamically set the log file for the report processed next (see open_report_log),
+    closing the previous one first. The report becomes the current report of this
+    context; use report_log() to process reports concurrently.
+    """
+    global _file_report_id
+    close_log_file()
+    report_id = os.path.splitext(os.path.basename(strip_compression_suffix(log_file_path)))[0]
+    open_report_log(report_id, log_file_path, raw_output_path)
+    current_report_id.set(report_id)
+    _file_report_id = report_id
+    logger.info(f"Set log file to '{log_file_path}'")
@@ -1,37 +1,24 @@
 import os
 import json
 import time
-from typing import Dict, Any, Type, List
+from typing import Dict, Any, Type, List, Optional, Union
 import logging
 import textwrap
 from dotenv import load_dotenv
 
 from echo_extraction import abbreviation_processor
+from echo_extraction.abbreviation_matcher import AbbreviationMatcher
+from echo_extraction.abbreviation_reloader import AbbreviationDictionaryHolder
 from echo_extraction.extraction_logic import extract_component_data
-from echo_extraction.utils import setup_logging, set_log_file
-from echo_extraction.md_cleaner import clean_markdown_file
+from echo_extraction.retry_policy import RetryPolicy
+from echo_extraction.log_store import LogStore
+from echo_extraction.utils import setup_logging, set_log_file, close_log_file, LOG_FORMAT
 from echo_extraction.models import (
-    EchoReport, CardiacChambers, ValvularApparatus,
-    GreatVesselsAndVenousReturn, CongenitalAndStructuralDefects,
+    EchoReport, assemble_echo_report,
     MitralValve, AorticValve, PulmonaryValve, TricuspidValve,
     Pericardium, LeftVentricle, RightVentricle, LeftAtrium, RightAtrium,
     VSD, ASD, PFO,
-    Aorta, PulmonicVein, IVC,
-    LVAssessment, LVMeasurements,
-    RVAssessment, RVMeasurements,
-    LAAssessment, LAMeasurements,
-    RAAssessment, RAMeasurements,
-    MitralValveAssessment, MitralValveMeasurements,
-    AorticValveAssessment, AorticValveMeasurements,
-    PulmonaryValveAssessment, PulmonaryValveMeasurements,
-    TricuspidValveAssessment, TricuspidValveMeasurements,
-    AortaAssessment, AortaMeasurements,
-    PulmonicVeinAssessment, PulmonicVeinMeasurements,
-    IVCAssessment, IVCMeasurements,
-    VSDAssessment, VSDMeasurements,
-    ASDAssessment, ASDMeasurements,
-    PFOAssessment, PFOMeasurements,
-    PericardiumAssessment, PericardiumMeasurements
+    Aorta, PulmonicVein, IVC
 )
 from echo_extraction.llm_mapping_utils import remap_llm_keys
 
@@ -41,8 +28,16 @@ from echo_extraction.llm_mapping_utils import remap_llm_keys
 load_dotenv()
 LOG_FILE_DIR = os.getenv("LOG_FILE_DIR", "main_app/logs")
 FINAL_REPORTS_DIR = os.getenv("FINAL_REPORTS_DIR", "main_app/final_reports")
+# Raw LLM output of every attempt, one JSONL file per report (empty disables)
+RAW_OUTPUTS_DIR = os.getenv("RAW_OUTPUTS_DIR", "main_app/raw_outputs")
 ABBREVIATION_CSV_PATH = os.getenv("ABBREVIATION_CSV_PATH", "main_app/echo_extraction/echo_abb_merged_csv.csv")
 REPORTS_JSON_PATH = os.getenv("REPORTS_JSON_PATH", "main_app/CTICI_NCIBB_Echo_Sample.json")
+RETRY_STATS_PATH = os.getenv("RETRY_STATS_PATH", "main_app/retry_stats.json")
+BATCH_SUMMARY_PATH = os.getenv("BATCH_SUMMARY_PATH", "main_app/batch_summary.json")
+# Seconds between checks of ABBREVIATION_CSV_PATH for changes (0 disables hot reloading)
+ABBREVIATION_RELOAD_INTERVAL = float(os.getenv("ABBREVIATION_RELOAD_INTERVAL", "10"))
+# Opt-in speculative attempts, e.g. "default,json_mode,sampled" (empty disables)
+SPECULATIVE_VARIANTS = [v.strip() for v in os.getenv("SPECULATIVE_VARIANTS", "").split(",") if v.strip()]
 
 
 
@@ -51,7 +46,12 @@ logger = logging.getLogger(__name__)
 
 
 
-def process_report(report_text: str, abbrev_dict: Dict[str, str]) -> EchoReport:
+def process_report(
+    report_text: str,
+    abbrev_dict: Union[Dict[str, str], AbbreviationMatcher],
+    retry_policy: Optional[RetryPolicy] = None,
+    speculative_variants: Optional[List[str]] = None
+) -> EchoReport:
     """Process a single echo report and return the final structured report."""
     start_time = time.perf_counter()
 
@@ -67,7 +67,8 @@ def process_report(report_text: str, abbrev_dict: Dict[str, str]) -> EchoReport:
     logger.info("Input Section", extra={
         'log_type': 'INPUT_SECTION',
         'raw_input': report_text,
-        'processed_input': processed_report
+        'processed_input': processed_report,
+        'abbreviation_version': getattr(abbrev_dict, 'version', None)
     })
 
     component_models_to_extract: List[Type[BaseModel]] = [
@@ -87,7 +88,8 @@ def process_report(report_text: str, abbrev_dict: Dict[str, str]) -> EchoReport:
         component_name = component_model.__name__
         logger.info(f"\n--- Extracting data for {component_name} ---")
         try:
-            validated_data = extract_component_data(processed_report, component_model, max_attempts=5)
+            validated_data = extract_component_data(processed_report, component_model, max_attempts=5, retry_policy=retry_policy,
+                                                    speculative_variants=speculative_variants)
             extracted_components[component_name] = validated_data
             logger.info(f"Successfully extracted data for {component_name}")
         except RuntimeError as e:
@@ -100,41 +102,7 @@ def process_report(report_text: str, abbrev_dict: Dict[str, str]) -> EchoReport:
     logger.info("\n--- Modular extraction complete ---")
 
     try:
-        cardiac_chambers_data = CardiacChambers(
-            Left_Ventricle=extracted_components.get(LeftVentricle.__name__, LeftVentricle(assessment=LVAssessment(), measurements=LVMeasurements())),
-            Right_Ventricle=extracted_components.get(RightVentricle.__name__, RightVentricle(assessment=RVAssessment(), measurements=RVMeasurements())),
-            Left_Atrium=extracted_components.get(LeftAtrium.__name__, LeftAtrium(assessment=LAAssessment(), measurements=LAMeasurements())),
-            Right_Atrium=extracted_components.get(RightAtrium.__name__, RightAtrium(assessment=RAAssessment(), measurements=RAMeasurements()))
-        )
-
-        valvular_apparatus_data = ValvularApparatus(
-            Mitral_Valve=extracted_components.get(MitralValve.__name__, MitralValve(assessment=MitralValveAssessment(), measurements=MitralValveMeasurements())),
-            Aortic_Valve=extracted_components.get(AorticValve.__name__, AorticValve(assessment=AorticValveAssessment(), measurements=AorticValveMeasurements())),
-            Pulmonary_Valve=extracted_components.get(PulmonaryValve.__name__, PulmonaryValve(assessment=PulmonaryValveAssessment(), measurements=PulmonaryValveMeasurements())),
-            Tricuspid_Valve=extracted_components.get(TricuspidValve.__name__, TricuspidValve(assessment=TricuspidValveAssessment(), measurements=TricuspidValveMeasurements()))
-        )
-
-        great_vessels_data = GreatVesselsAndVenousReturn(
-            aorta=extracted_components.get(Aorta.__name__, Aorta(assessment=AortaAssessment(), measurements=AortaMeasurements())),
-            pulmonic_vein=extracted_components.get(PulmonicVein.__name__, PulmonicVein(assessment=PulmonicVeinAssessment(), measurements=PulmonicVeinMeasurements())),
-            ivc=extracted_components.get(IVC.__name__, IVC(assessment=IVCAssessment(), measurements=IVCMeasurements()))
-        )
-
-        congenital_defects_data = CongenitalAndStructuralDefects(
-            vsd=extracted_components.get(VSD.__name__, VSD(assessment=VSDAssessment(), measurements=VSDMeasurements())),
-            asd=extracted_components.get(ASD.__name__, ASD(assessment=ASDAssessment(), measurements=ASDMeasurements())),
-            pfo=extracted_components.get(PFO.__name__, PFO(assessment=PFOAssessment(), measurements=PFOMeasurements()))
-        )
-
-        pericardium_data = extracted_components.get(Pericardium.__name__, Pericardium(assessment=PericardiumAssessment(), measurements=PericardiumMeasurements()))
-
-        final_echo_report = EchoReport(
-            Cardiac_Chambers=cardiac_chambers_data,
-            Valvular_Apparatus=valvular_apparatus_data,
-            GreatVessels_and_VenousReturn=great_vessels_data,
-            Congenital_and_Structural_Defects=congenital_defects_data,
-            pericardium=pericardium_data
-        )
+        final_echo_report = assemble_echo_report(extracted_components)
 
         logger.info("\n--- Final EchoReport object created successfully ---")
         final_report_json_string = final_echo_report.model_dump_json(indent=2)
@@ -171,8 +139,8 @@ if __name__ == "__main__":
     if not is_langchain_available():
         print("\nLangchain components not available. Please install langchain-community and langchain-core (`pip install langchain-community langchain-core`) and ensure Ollama is running with the 'cogito:70b' model.")
     else:
-        # Load abbreviation dictionary 
-        abbrev_dict = abbreviation_processor.get_abbreviation_dictionary(ABBREVIATION_CSV_PATH)
+        # Load abbreviation dictionary; CSV updates are picked up while the batch runs
+        abbreviation_holder = AbbreviationDictionaryHolder(ABBREVIATION_CSV_PATH, ABBREVIATION_RELOAD_INTERVAL).start()
 
         # Load reports from JSON
         try:
@@ -185,24 +153,38 @@ if __name__ == "__main__":
         # Ensure output directories exist
         os.makedirs(LOG_FILE_DIR, exist_ok=True)
         os.makedirs(FINAL_REPORTS_DIR, exist_ok=True)
+        if RAW_OUTPUTS_DIR:
+            os.makedirs(RAW_OUTPUTS_DIR, exist_ok=True)
 
         setup_logging()
 
+        # History-driven retry policy, persisted across runs
+        retry_policy = RetryPolicy.from_env(RETRY_STATS_PATH)
+        # Compressed, date-sharded per-report logs with retention
+        log_store = LogStore.from_env(LOG_FILE_DIR)
+        batch_results = []
+        batch_start = time.perf_counter()
+
         # Process each report
         for i, report in enumerate(reports, start=1):
+            _id = report.get('_id') if isinstance(report, dict) else None
             try:
                 _id = report['_id']
                 report_text = report['data']
-                log_file_path = os.path.join(LOG_FILE_DIR, f"{_id}.md")
+                log_file_path = log_store.path_for(_id, ".jsonl" if LOG_FORMAT == "jsonl" else ".md")
                 final_report_path = os.path.join(FINAL_REPORTS_DIR, f"{_id}.json")
+                raw_output_path = os.path.join(RAW_OUTPUTS_DIR, f"{_id}.jsonl") if RAW_OUTPUTS_DIR else None
                 
                 print(f"Processing report {i}/{len(reports)}: {_id}")
 
                 # Set log file for this report
-                set_log_file(log_file_path)
+                set_log_file(log_file_path, raw_output_path)
 
                 # Process the report
-                final_echo_report = process_report(report_text, abbrev_dict)
+                report_start = time.perf_counter()
+                # One dictionary version per report, even if a reload happens meanwhile
+                abbrev_matcher = abbreviation_holder.current()
+                final_echo_report = process_report(report_text, abbrev_matcher, retry_policy, SPECULATIVE_VARIANTS)
 
                 if final_echo_report:
                     with open(final_report_path, 'w') as f:
@@ -210,10 +192,36 @@ if __name__ == "__main__":
                     print(f"Successfully processed report {_id}")
                 else:
                     print(f"Failed to process report {_id}")
+                batch_results.append({
+                    '_id': _id,
+                    'status': 'Successful' if final_echo_report else 'Failed',
+                    'time': round(time.perf_counter() - report_start, 3),
+                    'abbreviation_version': abbrev_matcher.version,
+                })
+                retry_policy.save()
 
-                # Clean the generated markdown log file
-                logger.info(f"Attempting to clean log file: {log_file_path}")
-                clean_markdown_file(log_file_path)
+                # Write out the queued log records for this report
+                close_log_file()
 
             except Exception as e:
-                print(f"Error processing report {_id}: {e}")
\ No newline at end of file
+                print(f"Error processing report {_id}: {e}")
+                batch_results.append({'_id': _id, 'status': 'Error', 'error': str(e)})
+
+        # Export the batch summary, including the retry policy's statistics and decisions
+        batch_summary = {
+            'total_reports': len(reports),
+            'successful_reports': sum(1 for r in batch_results if r['status'] == 'Successful'),
+            'total_time': round(time.perf_counter() - batch_start, 3),
+            'reports': batch_results,
+            'retry_policy': retry_policy.summary(),
+            'abbreviation_version': abbreviation_holder.version,
+            'abbreviation_line_cache': abbreviation_processor.get_line_cache_stats(),
+        }
+        try:
+            with open(BATCH_SUMMARY_PATH, 'w') as f:
+                json.dump(batch_summary, f, indent=2)
+            print(f"Batch summary written to {BATCH_SUMMARY_PATH}")
+        except Exception as e:
+            print(f"Failed to write batch summary to {BATCH_SUMMARY_PATH}: {e}")
+
+        abbreviation_holder.stop()
\ No newline at end of file